@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tool-call throughput with a client per call vs one shared, pooled client.
+
+Runs against the in-process mock from mock_wordpress.py. Every call is a
+distinct read and the HTTP cache is off, so each one reaches the mock and
+the difference is down to connection reuse, e.g.:
+
+    python scripts/bench_client_pool.py --calls 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import time
+
+from mock_wordpress import start_mock
+from wordpress_mcp_server.server import WordPressClient
+
+
+def read(client: WordPressClient, n: int):
+    # A different page size per call, so reads aren't coalesced
+    return client.list_posts(per_page=n % 100 + 1)
+
+
+async def per_call_client(base_url: str, n: int):
+    # What every tool call used to do: a fresh session and connection each time
+    async with WordPressClient(base_url, http_cache_size=0) as client:
+        return await read(client, n)
+
+
+async def run(label: str, calls: int, concurrency: int, call, mock) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(n: int):
+        async with semaphore:
+            result = await call(n)
+            assert result["success"], result
+
+    requests = mock.requests
+    start = time.perf_counter()
+    await asyncio.gather(*(one(n) for n in range(calls)))
+    elapsed = time.perf_counter() - start
+    upstream = mock.requests - requests
+    rate = upstream / elapsed
+    print(
+        f"{label:<24} {calls} calls in {elapsed:6.2f}s  {rate:9.1f} calls/s  "
+        f"{upstream} upstream requests"
+    )
+    return rate
+
+
+async def main_async(args):
+    runner, base_url, mock = await start_mock()
+    try:
+        before = await run(
+            "client per call",
+            args.calls,
+            args.concurrency,
+            lambda n: per_call_client(base_url, n),
+            mock,
+        )
+        async with WordPressClient(
+            base_url, pool_limit=args.pool_limit, http_cache_size=0
+        ) as shared:
+            after = await run(
+                "shared pooled client",
+                args.calls,
+                args.concurrency,
+                lambda n: read(shared, n),
+                mock,
+            )
+        print(f"speedup: {after / before:.2f}x")
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--pool-limit", type=int, default=100)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Bytes transferred and JSON decode time for full posts vs ``_fields``.
+
+Fetches 100-post pages from the in-process mock in mock_wordpress.py, e.g.:
+
+    python scripts/bench_fields.py --rounds 50 --content-size 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import aiohttp
+from mock_wordpress import start_mock
+from wordpress_mcp_server.server import POST_SUMMARY_FIELDS, fields_param
+
+
+async def measure(session, url: str, params: dict, rounds: int):
+    total_bytes = 0
+    decode_time = 0.0
+    for _ in range(rounds):
+        async with session.get(url, params=params) as response:
+            body = await response.read()
+        total_bytes += len(body)
+        start = time.perf_counter()
+        json.loads(body)
+        decode_time += time.perf_counter() - start
+    return total_bytes / rounds, decode_time / rounds
+
+
+async def main_async(args):
+    runner, base_url, _ = await start_mock(
+        posts=args.per_page, content_size=args.content_size
+    )
+    url = f"{base_url}/wp-json/wp/v2/posts"
+    params = {"per_page": args.per_page}
+    try:
+        async with aiohttp.ClientSession() as session:
+            full = await measure(session, url, params, args.rounds)
+            projected = await measure(
+                session,
+                url,
+                {**params, **fields_param(POST_SUMMARY_FIELDS)},
+                args.rounds,
+            )
+    finally:
+        await runner.cleanup()
+
+    for label, (size, decode) in (("full posts", full), ("_fields", projected)):
+        print(
+            f"{label:<12} {size / 1024:10.1f} KiB/page  {decode * 1000:8.3f} ms decode"
+        )
+    print(
+        f"reduction: {full[0] / projected[0]:.1f}x bytes, "
+        f"{full[1] / projected[1]:.1f}x decode time"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--content-size", type=int, default=20000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Concurrent REST calls over HTTP/1.1 (aiohttp) vs HTTP/2 (httpx + h2).
+
+Starts two local servers answering /wp-json/wp/v2/posts after the same
+artificial latency: an aiohttp HTTP/1.1 server and a plain-text HTTP/2
+server built on the h2 library. Each backend sends the same calls with the
+same connection limit; HTTP/1.1 needs a connection per request in flight,
+HTTP/2 multiplexes them over one. The servers run in a child process so
+their CPU time isn't charged to the client. Needs the http2 extra, e.g.:
+
+    python scripts/bench_http2.py --calls 1000 --concurrency 64 --pool-limit 6
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+from aiohttp import web
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import ConnectionTerminated, RequestReceived
+from h2.settings import SettingCodes
+
+from wordpress_mcp_server.server import WordPressClient
+
+POSTS = json.dumps(
+    [
+        {
+            "id": 1,
+            "title": {"rendered": "Hello"},
+            "link": "http://wp.test/?p=1",
+            "status": "publish",
+            "date": "2024-01-01T00:00:00",
+            "excerpt": {"rendered": "<p>Hello</p>"},
+        }
+    ]
+).encode()
+RESPONSE_HEADERS = [
+    ("content-type", "application/json"),
+    ("content-length", str(len(POSTS))),
+    ("x-wp-totalpages", "1"),
+]
+
+
+class H2Protocol(asyncio.Protocol):
+    """Answers every request after ``delay`` seconds, streams concurrently"""
+
+    def __init__(self, connections, delay: float):
+        self.connections = connections
+        self.delay = delay
+        self.conn = H2Connection(H2Configuration(client_side=False))
+
+    def connection_made(self, transport):
+        self.connections.value += 1
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.conn.update_settings({SettingCodes.MAX_CONCURRENT_STREAMS: 1000})
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, RequestReceived):
+                asyncio.ensure_future(self.respond(event.stream_id))
+            elif isinstance(event, ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.conn.data_to_send())
+
+    async def respond(self, stream_id: int):
+        await asyncio.sleep(self.delay)
+        if self.transport.is_closing():
+            return
+        self.conn.send_headers(stream_id, [(":status", "200")] + RESPONSE_HEADERS)
+        self.conn.send_data(stream_id, POSTS, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+async def start_h2(connections, delay: float) -> int:
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(
+        lambda: H2Protocol(connections, delay), "127.0.0.1", 0
+    )
+    return server.sockets[0].getsockname()[1]
+
+
+async def start_h1(connections, delay: float) -> int:
+    seen = set()
+
+    async def posts(request):
+        if id(request.transport) not in seen:
+            seen.add(id(request.transport))
+            connections.value += 1
+        await asyncio.sleep(delay)
+        return web.Response(
+            body=POSTS,
+            content_type="application/json",
+            headers={"X-WP-TotalPages": "1"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/wp-json/wp/v2/posts", posts)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner.addresses[0][1]
+
+
+def serve(ports, h1_connections, h2_connections, delay: float):
+    """Child process: run both servers until terminated"""
+
+    async def start():
+        ports.put(await start_h1(h1_connections, delay))
+        ports.put(await start_h2(h2_connections, delay))
+        await asyncio.Event().wait()
+
+    asyncio.run(start())
+
+
+async def run(label: str, client: WordPressClient, connections, args):
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(n: int):
+        async with semaphore:
+            # A different page size per call, so reads aren't coalesced
+            result = await client.list_posts(per_page=n % 100 + 1)
+            assert result["success"], result
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(n) for n in range(args.calls)))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<22} {args.calls} calls in {elapsed:6.2f}s  "
+        f"{args.calls / elapsed:8.1f} calls/s  "
+        f"{connections.value:4d} connections"
+    )
+    return elapsed
+
+
+async def main_async(args):
+    options = {
+        "pool_limit": args.pool_limit,
+        "http_cache_size": 0,
+        "concurrency_limit": args.concurrency,
+        "max_concurrency": args.concurrency,
+    }
+    ports = multiprocessing.Queue()
+    h1_connections = multiprocessing.Value("i", 0)
+    h2_connections = multiprocessing.Value("i", 0)
+    servers = multiprocessing.Process(
+        target=serve,
+        args=(ports, h1_connections, h2_connections, args.delay),
+        daemon=True,
+    )
+    servers.start()
+    try:
+        h1_url = f"http://127.0.0.1:{ports.get()}"
+        h2_url = f"http://127.0.0.1:{ports.get()}"
+        async with WordPressClient(h1_url, **options) as client:
+            before = await run("aiohttp HTTP/1.1", client, h1_connections, args)
+        async with WordPressClient(
+            h2_url, http_backend="httpx", http2_prior_knowledge=True, **options
+        ) as client:
+            after = await run("httpx HTTP/2", client, h2_connections, args)
+        print(f"speedup: {before / after:.2f}x")
+    finally:
+        servers.terminate()
+        servers.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument(
+        "--pool-limit",
+        type=int,
+        default=6,
+        help="Connection limit for both backends, like a CDN's per-client cap",
+    )
+    parser.add_argument(
+        "--delay", type=float, default=0.1, help="Server latency per request"
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Decode and encode time of each available JSON codec on a 100-post page.
+
+Records one full (unprojected) page of posts from the in-process mock in
+mock_wordpress.py, or loads a response saved from a real site, e.g.:
+
+    python scripts/bench_json.py --rounds 200
+    curl -s 'https://example.com/wp-json/wp/v2/posts?per_page=100' > posts.json
+    python scripts/bench_json.py --response posts.json
+"""
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from mock_wordpress import start_mock
+from wordpress_mcp_server.codec import CODECS, get_codec
+
+
+async def record_page(per_page: int, content_size: int) -> bytes:
+    runner, base_url, _ = await start_mock(posts=per_page, content_size=content_size)
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                f"{base_url}/wp-json/wp/v2/posts", params={"per_page": per_page}
+            ) as response:
+                return await response.read()
+    finally:
+        await runner.cleanup()
+
+
+def measure(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--response", help="Saved JSON response to benchmark")
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--content-size", type=int, default=20000)
+    args = parser.parse_args()
+
+    if args.response:
+        with open(args.response, "rb") as f:
+            body = f.read()
+    else:
+        body = asyncio.run(record_page(args.per_page, args.content_size))
+    print(f"response: {len(body) / 1024:.1f} KiB")
+
+    results = {}
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ValueError as e:
+            print(f"{name:<8} skipped: {e}")
+            continue
+        document = codec.loads(body)
+        decode = measure(lambda: codec.loads(body), args.rounds)
+        encode = measure(lambda: codec.dumps(document), args.rounds)
+        results[name] = (decode, encode)
+        print(
+            f"{name:<8} {decode * 1000:8.3f} ms decode  {encode * 1000:8.3f} ms encode"
+        )
+
+    if len(results) == 2:
+        (json_decode, json_encode), (fast_decode, fast_encode) = (
+            results["json"],
+            results["orjson"],
+        )
+        print(
+            f"speedup: {json_decode / fast_decode:.1f}x decode, "
+            f"{json_encode / fast_encode:.1f}x encode"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Peak RSS while WordPressClient.upload_media() streams a large file.
+
+Uploads a generated file of --size-mb megabytes to the in-process mock in
+mock_wordpress.py and compares the process' peak RSS with its RSS before the
+upload, e.g.:
+
+    python scripts/bench_upload.py --size-mb 500
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from mock_wordpress import start_mock
+from wordpress_mcp_server.server import WordPressClient
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def write_file(path: str, size_mb: int):
+    block = os.urandom(1 << 20)
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block)
+
+
+async def main_async(args):
+    runner, base_url, mock = await start_mock()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "video.mp4")
+        write_file(path, args.size_mb)
+        try:
+            async with WordPressClient(base_url) as client:
+                await client.authenticate()
+                before = peak_rss_mib()
+                start = time.perf_counter()
+                result = await client.upload_media(path)
+                elapsed = time.perf_counter() - start
+        finally:
+            await runner.cleanup()
+
+    if not result["success"]:
+        raise SystemExit(result["error"])
+    uploaded = next(iter(mock.media.values()))["media_details"]["filesize"]
+    print(f"uploaded {uploaded / (1 << 20):.0f} MiB in {elapsed:.2f}s")
+    print(f"peak RSS before upload {before:8.1f} MiB")
+    print(f"peak RSS after upload  {peak_rss_mib():8.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=500)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
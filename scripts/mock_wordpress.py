@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Minimal in-memory WordPress REST API used by the benchmark scripts."""
+
+import argparse
+import itertools
+import re
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+API = "/wp-json/wp/v2"
+
+
+def project(item: dict, request) -> dict:
+    """Apply a ``_fields=a,b`` projection the way WordPress does."""
+    fields = request.query.get("_fields")
+    if not fields:
+        return item
+    return {key: item[key] for key in fields.split(",") if key in item}
+
+
+class MockWordPress:
+    """Just enough of /wp-json/wp/v2 to exercise WordPressClient."""
+
+    def __init__(self, posts: int = 0, content_size: int = 2000):
+        self._ids = itertools.count(1)
+        self.posts = {}
+        self.terms = {"categories": {}, "tags": {}}
+        self.media = {}
+        self.requests = 0
+        paragraph = "<p>Lorem ipsum dolor sit amet, consectetur adipiscing.</p>\n"
+        content = (paragraph * (content_size // len(paragraph) + 1))[:content_size]
+        for n in range(posts):
+            self._add_post(
+                {"title": f"Post {n}", "content": content, "excerpt": content[:200]}
+            )
+
+    def _add_post(self, data: dict) -> dict:
+        post_id = next(self._ids)
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        link = f"http://mock.local/?p={post_id}"
+        post = {
+            "id": post_id,
+            "date": now,
+            "date_gmt": now,
+            "guid": {"rendered": link},
+            "modified": now,
+            "modified_gmt": now,
+            "slug": f"post-{post_id}",
+            "status": data.get("status", "draft"),
+            "type": "post",
+            "link": link,
+            "title": {"rendered": data.get("title", "")},
+            "content": {"rendered": data.get("content", ""), "protected": False},
+            "excerpt": {"rendered": data.get("excerpt", ""), "protected": False},
+            "author": 1,
+            "featured_media": 0,
+            "comment_status": "open",
+            "ping_status": "open",
+            "sticky": False,
+            "template": "",
+            "format": "standard",
+            "meta": {"footnotes": ""},
+            "categories": data.get("categories", []),
+            "tags": data.get("tags", []),
+            "_links": {
+                "self": [{"href": f"http://mock.local{API}/posts/{post_id}"}],
+                "collection": [{"href": f"http://mock.local{API}/posts"}],
+                "author": [
+                    {"embeddable": True, "href": f"http://mock.local{API}/users/1"}
+                ],
+                "replies": [
+                    {
+                        "embeddable": True,
+                        "href": f"http://mock.local{API}/comments?post={post_id}",
+                    }
+                ],
+            },
+        }
+        self.posts[post_id] = post
+        return post
+
+    @web.middleware
+    async def count_requests(self, request, handler):
+        self.requests += 1
+        return await handler(request)
+
+    async def users_me(self, request):
+        user = {
+            "id": 1,
+            "name": "admin",
+            "username": "admin",
+            "roles": ["administrator"],
+        }
+        return web.json_response(project(user, request))
+
+    async def list_posts(self, request):
+        per_page = int(request.query.get("per_page", 10))
+        page = int(request.query.get("page", 1))
+        posts = sorted(self.posts.values(), key=lambda p: p["id"], reverse=True)
+        start = (page - 1) * per_page
+        total_pages = max(1, -(-len(posts) // per_page))
+        return web.json_response(
+            [project(post, request) for post in posts[start : start + per_page]],
+            headers={
+                "X-WP-Total": str(len(posts)),
+                "X-WP-TotalPages": str(total_pages),
+            },
+        )
+
+    async def create_post(self, request):
+        post = self._add_post(await request.json())
+        return web.json_response(project(post, request), status=201)
+
+    async def update_post(self, request):
+        post = self.posts.get(int(request.match_info["id"]))
+        if post is None:
+            return web.json_response({"code": "rest_post_invalid_id"}, status=404)
+        data = await request.json()
+        for field in ("title", "content", "excerpt"):
+            if field in data:
+                post[field]["rendered"] = data[field]
+        if "status" in data:
+            post["status"] = data["status"]
+        return web.json_response(project(post, request))
+
+    async def list_terms(self, request):
+        terms = list(self.terms[request.match_info["taxonomy"]].values())
+        slugs = request.query.getall("slug[]", [])
+        if slugs:
+            terms = [t for t in terms if t["slug"] in slugs]
+        search = request.query.get("search", "").lower()
+        terms = [t for t in terms if search in t["name"].lower()]
+        per_page = int(request.query.get("per_page", 10))
+        page = int(request.query.get("page", 1))
+        total_pages = max(1, -(-len(terms) // per_page))
+        return web.json_response(
+            [
+                project(term, request)
+                for term in terms[(page - 1) * per_page : page * per_page]
+            ],
+            headers={
+                "X-WP-Total": str(len(terms)),
+                "X-WP-TotalPages": str(total_pages),
+            },
+        )
+
+    async def create_term(self, request):
+        terms = self.terms[request.match_info["taxonomy"]]
+        name = (await request.json())["name"]
+        for term in terms.values():
+            if term["name"].lower() == name.lower():
+                return web.json_response(
+                    {
+                        "code": "term_exists",
+                        "data": {"status": 400, "term_id": term["id"]},
+                    },
+                    status=400,
+                )
+        term_id = next(self._ids)
+        slug = "-".join(name.lower().split())
+        terms[term_id] = {"id": term_id, "name": name, "slug": slug}
+        return web.json_response(project(terms[term_id], request), status=201)
+
+    async def upload_media(self, request):
+        """Stream the upload to nowhere, keeping only its size."""
+        disposition = request.headers.get("Content-Disposition", "")
+        match = re.search(r'filename="([^"]*)"', disposition)
+        if not match:
+            return web.json_response({"code": "rest_upload_no_data"}, status=400)
+        size = 0
+        async for chunk in request.content.iter_chunked(1 << 16):
+            size += len(chunk)
+        media_id = next(self._ids)
+        filename = match.group(1)
+        source_url = f"http://mock.local/wp-content/uploads/{filename}"
+        self.media[media_id] = media = {
+            "id": media_id,
+            "title": {"rendered": request.query.get("title", filename)},
+            "source_url": source_url,
+            "link": f"http://mock.local/?attachment_id={media_id}",
+            "mime_type": request.headers.get("Content-Type"),
+            "media_details": {"filesize": size},
+        }
+        return web.json_response(project(media, request), status=201)
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.count_requests])
+        app.router.add_get(f"{API}/users/me", self.users_me)
+        app.router.add_get(f"{API}/posts", self.list_posts)
+        app.router.add_post(f"{API}/posts", self.create_post)
+        app.router.add_post(f"{API}/posts/{{id}}", self.update_post)
+        app.router.add_post(f"{API}/media", self.upload_media)
+        app.router.add_get(f"{API}/{{taxonomy:categories|tags}}", self.list_terms)
+        app.router.add_post(f"{API}/{{taxonomy:categories|tags}}", self.create_term)
+        return app
+
+
+async def start_mock(host: str = "127.0.0.1", port: int = 0, **options):
+    """Start a mock site; returns (runner, base_url, MockWordPress)."""
+    mock = MockWordPress(**options)
+    runner = web.AppRunner(mock.make_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}", mock
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--posts", type=int, default=0)
+    args = parser.parse_args()
+    web.run_app(MockWordPress(args.posts).make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+WordPress MCP Server - Authentication providers
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import aiohttp
+
+from .concurrency import SingleFlight
+from .transport import WordPressAPIError
+
+logger = logging.getLogger(__name__)
+
+AUTH_METHODS = ("basic", "app-password", "jwt")
+
+# Token endpoint of the "JWT Authentication for WP REST API" plugin
+JWT_TOKEN_PATH = "/wp-json/jwt-auth/v1/token"
+
+
+class BasicAuth:
+    """HTTP Basic credentials, encoded once per client"""
+
+    def __init__(self, username: str, password: str):
+        self._headers = {
+            "Authorization": aiohttp.BasicAuth(username, password).encode()
+        }
+
+    async def headers(self, transport) -> Dict[str, str]:
+        """Headers that authenticate a request sent with ``transport``"""
+        return self._headers
+
+    def invalidate(self) -> bool:
+        """Forget cached credentials; True if fresh ones can be obtained"""
+        return False
+
+
+class ApplicationPasswordAuth(BasicAuth):
+    """A WordPress Application Password, sent as Basic credentials
+
+    WordPress displays application passwords in groups of four characters
+    and ignores the spaces between them, so they are stripped here.
+    """
+
+    def __init__(self, username: str, password: str):
+        super().__init__(username, password.replace(" ", ""))
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """The ``exp`` claim of a JWT, without verifying its signature"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class JWTAuth:
+    """Bearer tokens from a WordPress JWT plugin, cached until they expire
+
+    A token is requested with the username and password on first use and
+    reused until ``refresh_margin`` seconds before its ``exp`` claim (or
+    ``default_ttl`` seconds when it has none). Inside that margin the current
+    token keeps being sent while a new one is fetched in the background;
+    concurrent refreshes share one token request.
+    """
+
+    def __init__(
+        self,
+        token_url: str,
+        username: str,
+        password: str,
+        refresh_margin: float = 60.0,
+        default_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.token_url = token_url
+        self.username = username
+        self.password = password
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.refreshes = 0
+        self._clock = clock
+        self._headers: Optional[Dict[str, str]] = None
+        self._expires_at = 0.0
+        self._flight = SingleFlight()
+        self._background: Optional["asyncio.Future[None]"] = None
+
+    async def headers(self, transport) -> Dict[str, str]:
+        now = self._clock()
+        if self._headers is None or now >= self._expires_at:
+            return await self.refresh(transport)
+        if now >= self._expires_at - self.refresh_margin and not len(self._flight):
+            self._background = asyncio.ensure_future(self.refresh(transport))
+            self._background.add_done_callback(_log_refresh_failure)
+        return self._headers
+
+    async def refresh(self, transport) -> Dict[str, str]:
+        """Fetch a new token, joining a fetch that is already in flight"""
+        return await self._flight.do("token", lambda: self._fetch(transport))
+
+    def invalidate(self) -> bool:
+        self._headers = None
+        return True
+
+    async def _fetch(self, transport) -> Dict[str, str]:
+        response = await transport.request(
+            "POST",
+            self.token_url,
+            json={"username": self.username, "password": self.password},
+        )
+        if response.status != 200:
+            raise WordPressAPIError(
+                response.status, f"Token request failed: {response.text()}"
+            )
+        data = response.json()
+
+        token = data["token"]
+        self._headers = {"Authorization": f"Bearer {token}"}
+        self._expires_at = token_expiry(token) or self._clock() + self.default_ttl
+        self.refreshes += 1
+        return self._headers
+
+
+def _log_refresh_failure(task: "asyncio.Future[None]"):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background token refresh failed: {task.exception()}")
+
+
+def credential_fingerprint(method: str, username: str, password: str) -> str:
+    """Short digest identifying a set of credentials without revealing them"""
+    secret = json.dumps([method, username, password]).encode("utf-8")
+    return hashlib.sha256(secret).hexdigest()[:16]
+
+
+class AuthProbeCache:
+    """Recent authentication check results, per site and credentials
+
+    A successful check is reused for ``ttl`` seconds and a failed one for
+    ``negative_ttl`` seconds. Within ``refresh_margin`` seconds of a success
+    expiring, the cached result is still returned while the check is re-run
+    in the background, so callers polling regularly never wait. Concurrent
+    checks for the same key share one request.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        # key -> (result, expires_at, refresh_at)
+        self._entries: Dict[Hashable, Tuple[Dict[str, Any], float, float]] = {}
+        self._flight = SingleFlight()
+        self._background: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def get(
+        self,
+        key: Hashable,
+        check: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+        refresh_margin: float = 15.0,
+    ) -> Dict[str, Any]:
+        """The cached result of ``check()`` for ``key``, checking if needed
+
+        Results are ``{"success": ...}`` dicts; cached ones are returned with
+        ``"cached": True``.
+        """
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is not None and now < entry[1]:
+            result, _, refresh_at = entry
+            if now >= refresh_at and key not in self._background:
+                task = asyncio.ensure_future(
+                    self._check(key, check, ttl, negative_ttl, refresh_margin)
+                )
+                self._background[key] = task
+                task.add_done_callback(lambda done: self._refreshed(key, done))
+            return {**result, "cached": True}
+
+        return await self._flight.do(
+            key, lambda: self._check(key, check, ttl, negative_ttl, refresh_margin)
+        )
+
+    async def _check(
+        self,
+        key: Hashable,
+        check: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl: float,
+        negative_ttl: float,
+        refresh_margin: float,
+    ) -> Dict[str, Any]:
+        result = await check()
+        now = self._clock()
+        if result.get("success"):
+            expires_at = now + ttl
+            refresh_at = expires_at - min(refresh_margin, ttl)
+        else:
+            expires_at = refresh_at = now + negative_ttl
+        self._entries[key] = (result, expires_at, refresh_at)
+        return result
+
+    def _refreshed(self, key: Hashable, task: "asyncio.Future[Any]"):
+        self._background.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                f"Background authentication check failed: {task.exception()}"
+            )
+
+    def invalidate(self, key: Hashable):
+        """Forget the result for ``key``, e.g. after a 401"""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Shared by every client in the process, so clients for the same site and
+# credentials reuse one another's checks
+auth_probes = AuthProbeCache()
+
+
+def create_auth(
+    method: str,
+    base_url: str,
+    username: str,
+    password: str,
+    token_url: Optional[str] = None,
+    refresh_margin: float = 60.0,
+):
+    """Build the auth provider for ``method`` (one of AUTH_METHODS)"""
+    if method == "basic":
+        return BasicAuth(username, password)
+    if method == "app-password":
+        return ApplicationPasswordAuth(username, password)
+    if method == "jwt":
+        return JWTAuth(
+            token_url or f"{base_url}{JWT_TOKEN_PATH}",
+            username,
+            password,
+            refresh_margin=refresh_margin,
+        )
+    raise ValueError(f"Unknown auth method: {method}")
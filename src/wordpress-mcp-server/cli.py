@@ -7,15 +7,23 @@ import asyncio
 import logging
 import os
 import sys
+from typing import Optional
 from dotenv import load_dotenv
 
+from .auth import AUTH_METHODS
+from .codec import get_codec
+from .exporter import EXPORT_INCLUDES, PostExporter
 from .server import WordPressMCPServer
+from .transport import HTTP_BACKENDS, HTTPXTransport, parse_connect_to
+from .uploader import MediaUploader
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; the client logs what matters itself
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -27,6 +35,8 @@ Examples:
   %(prog)s --mode stdio                          # Run for Claude Desktop
   %(prog)s --mode http --mcp-port 9001          # Run HTTP server
   %(prog)s --wordpress-url http://localhost:8080 # Custom WordPress URL
+  %(prog)s upload-media ./photos                # Upload a media directory
+  %(prog)s export posts.ndjson.gz               # Export every post
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -48,6 +58,288 @@ Examples:
         default=os.getenv("WORDPRESS_PASSWORD", "admin"),
         help="WordPress password (default: %(default)s)",
     )
+    wp_group.add_argument(
+        "--auth-method",
+        choices=list(AUTH_METHODS),
+        default=os.getenv("WORDPRESS_AUTH_METHOD", "basic"),
+        help="How requests authenticate: Basic auth, an Application Password "
+        "or JWT bearer tokens (default: %(default)s)",
+    )
+    wp_group.add_argument(
+        "--jwt-token-url",
+        default=os.getenv("WORDPRESS_JWT_TOKEN_URL"),
+        help="JWT token endpoint (default: <wordpress-url>/wp-json/jwt-auth/v1/token)",
+    )
+    wp_group.add_argument(
+        "--token-refresh-margin",
+        type=float,
+        default=float(os.getenv("WORDPRESS_TOKEN_REFRESH_MARGIN", "60")),
+        help="Seconds before expiry a JWT is refreshed (default: %(default)s)",
+    )
+
+    # WordPress connection pool configuration
+    pool_group = parser.add_argument_group("Connection Pool Configuration")
+    pool_group.add_argument(
+        "--pool-limit",
+        type=int,
+        default=int(os.getenv("WORDPRESS_POOL_LIMIT", "100")),
+        help="Maximum open connections to WordPress, 0 for no limit "
+        "(default: %(default)s)",
+    )
+    pool_group.add_argument(
+        "--pool-limit-per-host",
+        type=int,
+        default=int(os.getenv("WORDPRESS_POOL_LIMIT_PER_HOST", "0")),
+        help="Maximum open connections per host, 0 for no limit "
+        "(default: %(default)s)",
+    )
+    pool_group.add_argument(
+        "--keepalive-timeout",
+        type=float,
+        default=float(os.getenv("WORDPRESS_KEEPALIVE_TIMEOUT", "30")),
+        help="Seconds an idle connection is kept alive (default: %(default)s)",
+    )
+    pool_group.add_argument(
+        "--dns-cache-ttl",
+        type=int,
+        default=int(os.getenv("WORDPRESS_DNS_CACHE_TTL", "300")),
+        help="Seconds resolved addresses are cached (default: %(default)s)",
+    )
+
+    pool_group.add_argument(
+        "--connect-to",
+        default=os.getenv("WORDPRESS_CONNECT_TO"),
+        help="Connect to a co-located WordPress without DNS or the network: "
+        "unix:/path/to.sock for a Unix socket, or IP[:PORT] for a fixed "
+        "address; requests keep the URL's Host header. On the aiohttp "
+        "backend a unix: socket carries plain HTTP, so use an http:// URL",
+    )
+
+    pool_group.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=int(os.getenv("WORDPRESS_BATCH_CONCURRENCY", "4")),
+        help="Batch API calls sent at once by bulk tools (default: %(default)s)",
+    )
+
+    pool_group.add_argument(
+        "--prefetch-pages",
+        type=int,
+        default=int(os.getenv("WORDPRESS_PREFETCH_PAGES", "4")),
+        help="Post pages fetched ahead while paging through listings "
+        "(default: %(default)s)",
+    )
+
+    pool_group.add_argument(
+        "--concurrency-limit",
+        type=int,
+        default=int(os.getenv("WORDPRESS_CONCURRENCY_LIMIT", "8")),
+        help="Requests in flight to start with; adapts to 429/503 responses "
+        "(default: %(default)s)",
+    )
+
+    pool_group.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=int(os.getenv("WORDPRESS_MAX_CONCURRENCY", "64")),
+        help="Most requests in flight the adaptive limit grows to, 0 for no "
+        "limit (default: %(default)s)",
+    )
+
+    pool_group.add_argument(
+        "--json-codec",
+        choices=["auto", "orjson", "json"],
+        default=os.getenv("WORDPRESS_JSON_CODEC", "auto"),
+        help="JSON encoder/decoder; auto uses orjson when installed "
+        "(default: %(default)s)",
+    )
+
+    pool_group.add_argument(
+        "--http-backend",
+        choices=HTTP_BACKENDS,
+        default=os.getenv("WORDPRESS_HTTP_BACKEND", "aiohttp"),
+        help="HTTP client; httpx multiplexes requests over HTTP/2 connections "
+        "when the server supports it (default: %(default)s)",
+    )
+
+    pool_group.add_argument(
+        "--http2-prior-knowledge",
+        action="store_true",
+        default=os.getenv("WORDPRESS_HTTP2_PRIOR_KNOWLEDGE", "false").lower() == "true",
+        help="Speak HTTP/2 to plain http:// URLs without negotiating "
+        "(httpx backend only)",
+    )
+
+    # Retry configuration
+    retry_group = parser.add_argument_group("Retry Configuration")
+    retry_group.add_argument(
+        "--max-retries",
+        type=int,
+        default=int(os.getenv("WORDPRESS_MAX_RETRIES", "3")),
+        help="Retries of a request that failed transiently, 0 to disable "
+        "(default: %(default)s)",
+    )
+    retry_group.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=float(os.getenv("WORDPRESS_RETRY_BACKOFF", "0.5")),
+        help="Base seconds of the jittered exponential backoff "
+        "(default: %(default)s)",
+    )
+    retry_group.add_argument(
+        "--retry-max-delay",
+        type=float,
+        default=float(os.getenv("WORDPRESS_RETRY_MAX_DELAY", "30")),
+        help="Longest wait before a retry, including Retry-After "
+        "(default: %(default)s)",
+    )
+    retry_group.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=int(os.getenv("WORDPRESS_BREAKER_THRESHOLD", "5")),
+        help="Consecutive failures that make requests fail fast, 0 to disable "
+        "(default: %(default)s)",
+    )
+    retry_group.add_argument(
+        "--breaker-reset-timeout",
+        type=float,
+        default=float(os.getenv("WORDPRESS_BREAKER_RESET_TIMEOUT", "30")),
+        help="Seconds requests fail fast before WordPress is tried again "
+        "(default: %(default)s)",
+    )
+
+    # Term cache configuration
+    cache_group = parser.add_argument_group("Cache Configuration")
+    cache_group.add_argument(
+        "--term-cache-ttl",
+        type=float,
+        default=float(os.getenv("WORDPRESS_TERM_CACHE_TTL", "3600")),
+        help="Seconds a category/tag name -> ID mapping is cached "
+        "(default: %(default)s)",
+    )
+    cache_group.add_argument(
+        "--term-cache-size",
+        type=int,
+        default=int(os.getenv("WORDPRESS_TERM_CACHE_SIZE", "10000")),
+        help="Maximum cached terms per taxonomy (default: %(default)s)",
+    )
+    cache_group.add_argument(
+        "--no-term-preload",
+        action="store_true",
+        default=os.getenv("WORDPRESS_TERM_PRELOAD", "true").lower() == "false",
+        help="Don't load all categories and tags into the cache at startup",
+    )
+
+    cache_group.add_argument(
+        "--warm-up-connections",
+        type=int,
+        default=int(os.getenv("WORDPRESS_WARM_UP_CONNECTIONS", "4")),
+        help="Connections opened (and credentials verified) at startup, "
+        "0 to skip (default: %(default)s)",
+    )
+
+    cache_group.add_argument(
+        "--http-cache-size",
+        type=int,
+        default=int(os.getenv("WORDPRESS_HTTP_CACHE_SIZE", "256")),
+        help="Cached GET responses kept for conditional requests, 0 to disable "
+        "(default: %(default)s)",
+    )
+    cache_group.add_argument(
+        "--http-cache-ttl",
+        type=float,
+        default=float(os.getenv("WORDPRESS_HTTP_CACHE_TTL", "5")),
+        help="Seconds a response without ETag/Last-Modified is reused "
+        "(default: %(default)s)",
+    )
+
+    cache_group.add_argument(
+        "--post-hash-cache-size",
+        type=int,
+        default=int(os.getenv("WORDPRESS_POST_HASH_CACHE_SIZE", "4096")),
+        help="Posts whose last written fields are remembered so unchanged "
+        "updates are skipped, 0 to disable (default: %(default)s)",
+    )
+    cache_group.add_argument(
+        "--post-hash-ttl",
+        type=float,
+        default=float(os.getenv("WORDPRESS_POST_HASH_TTL", "600")),
+        help="Seconds a remembered post is trusted to be unchanged on the site "
+        "(default: %(default)s)",
+    )
+
+    cache_group.add_argument(
+        "--create-dedup-window",
+        type=float,
+        default=float(os.getenv("WORDPRESS_CREATE_DEDUP_WINDOW", "600")),
+        help="Seconds a repeated identical create_blog_post returns the original "
+        "post instead of a duplicate, 0 to disable (default: %(default)s)",
+    )
+    cache_group.add_argument(
+        "--create-dedup-size",
+        type=int,
+        default=int(os.getenv("WORDPRESS_CREATE_DEDUP_SIZE", "1024")),
+        help="Recently created posts remembered in memory for deduplication "
+        "(default: %(default)s)",
+    )
+
+    cache_group.add_argument(
+        "--auth-probe-ttl",
+        type=float,
+        default=float(os.getenv("WORDPRESS_AUTH_PROBE_TTL", "60")),
+        help="Seconds test_wordpress_connection reuses a successful check, "
+        "0 to always check (default: %(default)s)",
+    )
+    cache_group.add_argument(
+        "--auth-probe-negative-ttl",
+        type=float,
+        default=float(os.getenv("WORDPRESS_AUTH_PROBE_NEGATIVE_TTL", "10")),
+        help="Seconds a failed connection check is reused (default: %(default)s)",
+    )
+
+    # Post mirror configuration
+    mirror_group = parser.add_argument_group("Mirror Configuration")
+    mirror_group.add_argument(
+        "--mirror-path",
+        default=os.getenv("WORDPRESS_MIRROR_PATH"),
+        help="SQLite file to mirror posts into and serve list_blog_posts from "
+        "(default: no mirror)",
+    )
+    mirror_group.add_argument(
+        "--mirror-sync-interval",
+        type=float,
+        default=float(os.getenv("WORDPRESS_MIRROR_SYNC_INTERVAL", "60")),
+        help="Seconds between delta syncs of the mirror (default: %(default)s)",
+    )
+    mirror_group.add_argument(
+        "--mirror-max-staleness",
+        type=float,
+        default=float(os.getenv("WORDPRESS_MIRROR_MAX_STALENESS", "300")),
+        help="Oldest mirror sync, in seconds, that reads are served from "
+        "(default: %(default)s)",
+    )
+
+    # Multi-site configuration
+    sites_group = parser.add_argument_group("Multi-site Configuration")
+    sites_group.add_argument(
+        "--sites-file",
+        default=os.getenv("WORDPRESS_SITES_FILE"),
+        help="JSON file of further sites tools can target with their 'site' "
+        "argument (default: only --wordpress-url)",
+    )
+    sites_group.add_argument(
+        "--max-open-sites",
+        type=int,
+        default=int(os.getenv("WORDPRESS_MAX_OPEN_SITES", "16")),
+        help="Site clients kept open at once, least recently used closed first "
+        "(default: %(default)s)",
+    )
+    sites_group.add_argument(
+        "--site-idle-timeout",
+        type=float,
+        default=float(os.getenv("WORDPRESS_SITE_IDLE_TIMEOUT", "300")),
+        help="Seconds an unused site client stays open (default: %(default)s)",
+    )
 
     # MCP Server configuration
     mcp_group = parser.add_argument_group("MCP Server Configuration")
@@ -92,6 +384,75 @@ Examples:
     )
     parser.add_argument("--config-file", help="Load configuration from file")
 
+    # Subcommands; without one the MCP server is run
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    upload_parser = subparsers.add_parser(
+        "upload-media",
+        help="Upload a directory to the media library, resuming where the "
+        "last run stopped",
+    )
+    upload_parser.add_argument("directory", help="Directory of files to upload")
+    upload_parser.add_argument(
+        "--manifest",
+        help="Manifest of uploaded files (default: DIRECTORY/.wp-media-manifest.json)",
+    )
+    upload_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Uploads in flight at once (default: %(default)s)",
+    )
+    upload_parser.add_argument(
+        "--hash-workers",
+        type=int,
+        default=4,
+        help="Threads hashing files (default: %(default)s)",
+    )
+    upload_parser.add_argument(
+        "--meta-key",
+        help="Registered attachment meta field to store and check file hashes in",
+    )
+    upload_parser.add_argument(
+        "--no-recursive",
+        action="store_true",
+        help="Don't descend into subdirectories",
+    )
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Stream every post to an NDJSON file (gzipped if it ends in .gz)",
+    )
+    export_parser.add_argument("path", help="File to write")
+    export_parser.add_argument(
+        "--include",
+        action="append",
+        choices=EXPORT_INCLUDES,
+        default=[],
+        help="Also export terms, media or revisions (repeatable)",
+    )
+    export_parser.add_argument(
+        "--status",
+        default="any",
+        help="Only export posts with this status (default: %(default)s)",
+    )
+    export_parser.add_argument(
+        "--modified-after",
+        help="Only export posts and media modified after this ISO 8601 date, "
+        "e.g. the last modified date printed by the previous export",
+    )
+    export_parser.add_argument(
+        "--gzip",
+        action="store_true",
+        default=None,
+        help="Compress the file whatever its name",
+    )
+    export_parser.add_argument(
+        "--per-page",
+        type=int,
+        default=100,
+        help="Posts fetched per request, at most 100 (default: %(default)s)",
+    )
+
     return parser
 
 
@@ -118,6 +479,42 @@ def setup_logging(level: str, log_file: str = None):
         logging.basicConfig(level=numeric_level, format=log_format, stream=sys.stdout)
 
 
+def build_client_options(args) -> dict:
+    """Collect WordPressClient keyword options from parsed arguments"""
+    return {
+        "pool_limit": args.pool_limit,
+        "pool_limit_per_host": args.pool_limit_per_host,
+        "keepalive_timeout": args.keepalive_timeout,
+        "dns_cache_ttl": args.dns_cache_ttl,
+        "term_cache_ttl": args.term_cache_ttl,
+        "term_cache_size": args.term_cache_size,
+        "batch_concurrency": args.batch_concurrency,
+        "prefetch_pages": args.prefetch_pages,
+        "http_cache_size": args.http_cache_size,
+        "http_cache_ttl": args.http_cache_ttl,
+        "json_codec": args.json_codec,
+        "http_backend": args.http_backend,
+        "http2_prior_knowledge": args.http2_prior_knowledge,
+        "connect_to": args.connect_to,
+        "max_retries": args.max_retries,
+        "retry_backoff": args.retry_backoff,
+        "retry_max_delay": args.retry_max_delay,
+        "breaker_threshold": args.breaker_threshold,
+        "breaker_reset_timeout": args.breaker_reset_timeout,
+        "concurrency_limit": args.concurrency_limit,
+        "max_concurrency": args.max_concurrency,
+        "auth_method": args.auth_method,
+        "jwt_token_url": args.jwt_token_url,
+        "token_refresh_margin": args.token_refresh_margin,
+        "post_hash_cache_size": args.post_hash_cache_size,
+        "post_hash_ttl": args.post_hash_ttl,
+        "create_dedup_window": args.create_dedup_window,
+        "create_dedup_size": args.create_dedup_size,
+        "auth_probe_ttl": args.auth_probe_ttl,
+        "auth_probe_negative_ttl": args.auth_probe_negative_ttl,
+    }
+
+
 def validate_configuration(args):
     """Validate configuration arguments"""
     errors = []
@@ -137,6 +534,97 @@ def validate_configuration(args):
         except ValueError:
             pass  # URL might not have a port
 
+    if args.pool_limit < 0 or args.pool_limit_per_host < 0:
+        errors.append("Connection pool limits must be 0 (unlimited) or positive")
+
+    if args.term_cache_size <= 0:
+        errors.append("Term cache size must be positive")
+
+    if args.http_cache_size < 0 or args.http_cache_ttl < 0:
+        errors.append("HTTP cache size and TTL must not be negative")
+
+    if args.batch_concurrency <= 0 or args.prefetch_pages <= 0:
+        errors.append("Batch concurrency and prefetch pages must be positive")
+
+    if args.concurrency_limit <= 0 or args.max_concurrency < 0:
+        errors.append("Concurrency limit must be positive and max not negative")
+
+    if min(args.max_retries, args.retry_backoff, args.retry_max_delay) < 0:
+        errors.append("Retry count, backoff and delay must not be negative")
+
+    if args.breaker_threshold < 0 or args.breaker_reset_timeout < 0:
+        errors.append(
+            "Circuit breaker threshold and reset timeout must not be negative"
+        )
+
+    try:
+        get_codec(args.json_codec)
+    except ValueError as e:
+        errors.append(str(e))
+
+    if args.http_backend not in HTTP_BACKENDS:
+        errors.append(f"HTTP backend must be one of {', '.join(HTTP_BACKENDS)}")
+    elif args.http_backend == "httpx":
+        try:
+            HTTPXTransport()
+        except ValueError as e:
+            errors.append(str(e))
+    elif args.http2_prior_knowledge:
+        errors.append("--http2-prior-knowledge needs --http-backend httpx")
+
+    try:
+        unix_socket, resolver = parse_connect_to(args.connect_to)
+        if resolver is not None and args.http_backend == "httpx":
+            errors.append("--http-backend httpx only supports --connect-to unix:PATH")
+        if (
+            unix_socket
+            and args.http_backend == "aiohttp"
+            and args.wordpress_url.startswith("https://")
+        ):
+            errors.append(
+                "--connect-to unix: carries plain HTTP on the aiohttp backend; "
+                "use an http:// URL or --http-backend httpx for TLS"
+            )
+    except ValueError as e:
+        errors.append(str(e))
+
+    if args.warm_up_connections < 0:
+        errors.append("Warm-up connections must not be negative")
+
+    if args.post_hash_cache_size < 0 or args.post_hash_ttl <= 0:
+        errors.append(
+            "Post hash cache size must not be negative and its TTL must be positive"
+        )
+
+    if args.create_dedup_window < 0 or args.create_dedup_size <= 0:
+        errors.append(
+            "Create dedup window must not be negative and its size must be positive"
+        )
+
+    if args.auth_probe_ttl < 0 or args.auth_probe_negative_ttl < 0:
+        errors.append("Auth probe TTLs must not be negative")
+
+    if args.sites_file and not os.path.isfile(args.sites_file):
+        errors.append(f"Sites file not found: {args.sites_file}")
+
+    if args.max_open_sites <= 0 or args.site_idle_timeout < 0:
+        errors.append(
+            "Max open sites must be positive and site idle timeout not negative"
+        )
+
+    if args.mirror_sync_interval <= 0 or args.mirror_max_staleness < 0:
+        errors.append(
+            "Mirror sync interval must be positive and max staleness not negative"
+        )
+
+    if args.command == "upload-media" and (
+        args.concurrency <= 0 or args.hash_workers <= 0
+    ):
+        errors.append("Upload concurrency and hash workers must be positive")
+
+    if args.command == "export" and not 0 < args.per_page <= 100:
+        errors.append("Export page size must be between 1 and 100")
+
     if args.mcp_port < 9000:
         logger.warning(f"MCP port {args.mcp_port} is below recommended 9000+ range")
 
@@ -160,9 +648,12 @@ async def test_wordpress_connection(args):
 
     try:
         async with WordPressClient(
-            args.wordpress_url, args.username, args.password
+            args.wordpress_url,
+            args.username,
+            args.password,
+            **build_client_options(args),
         ) as wp_client:
-            result = await wp_client.authenticate()
+            result = await wp_client.probe_auth()
 
             if result["success"]:
                 user = result["user"]
@@ -181,6 +672,86 @@ async def test_wordpress_connection(args):
         sys.exit(1)
 
 
+async def upload_media_directory(args):
+    """Upload a directory to the media library and exit"""
+    from .server import WordPressClient
+
+    async def report(done: int, total: int):
+        print(f"\r{done}/{total} files", end="", flush=True)
+
+    async with WordPressClient(
+        args.wordpress_url,
+        args.username,
+        args.password,
+        **build_client_options(args),
+    ) as wp_client:
+        uploader = MediaUploader(
+            wp_client,
+            concurrency=args.concurrency,
+            hash_workers=args.hash_workers,
+            meta_key=args.meta_key,
+            progress=report,
+        )
+        result = await uploader.upload_directory(
+            args.directory,
+            recursive=not args.no_recursive,
+            manifest_path=args.manifest,
+        )
+    print()
+
+    if not result["success"]:
+        print(f"❌ Upload failed: {result['error']}")
+        sys.exit(1)
+    print(
+        f"✅ Uploaded {result['uploaded']} of {result['total']} files "
+        f"({result['skipped']} already uploaded, {result['failed']} failed)"
+    )
+    for error in result["errors"]:
+        print(f"   {error['path']}: {error['error']}")
+    print(f"   Manifest: {result['manifest']}")
+    sys.exit(1 if result["failed"] else 0)
+
+
+async def export_posts(args):
+    """Export posts to an NDJSON file and exit"""
+    from .server import WordPressClient
+
+    async def report(done: int, total: Optional[int]):
+        print(f"\r{done} posts", end="", flush=True)
+
+    async with WordPressClient(
+        args.wordpress_url,
+        args.username,
+        args.password,
+        **build_client_options(args),
+    ) as wp_client:
+        exporter = PostExporter(
+            wp_client, include=args.include, per_page=args.per_page, progress=report
+        )
+        result = await exporter.export(
+            args.path,
+            status=args.status,
+            modified_after=args.modified_after,
+            compress=args.gzip,
+        )
+    print()
+
+    if not result["success"]:
+        print(f"❌ Export failed: {result['error']}")
+        sys.exit(1)
+    print(
+        f"✅ Exported {result['posts']} posts to {result['path']} "
+        f"({result['bytes']} bytes in {result['elapsed']}s)"
+    )
+    print(
+        f"   Terms: {result['terms']}, media: {result['media']}, "
+        f"revisions: {result['revisions']}"
+    )
+    if result["last_modified"]:
+        print(f"   Next incremental export: --modified-after {result['last_modified']}")
+    sys.exit(0)
+
+
 async def run_server(args):
     """Run the MCP server"""
     logger.info("Starting WordPress MCP Server")
@@ -194,6 +765,15 @@ async def run_server(args):
         username=args.username,
         password=args.password,
         mcp_port=args.mcp_port,
+        client_options=build_client_options(args),
+        preload_terms=not args.no_term_preload,
+        warm_up_connections=args.warm_up_connections,
+        mirror_path=args.mirror_path,
+        mirror_sync_interval=args.mirror_sync_interval,
+        mirror_max_staleness=args.mirror_max_staleness,
+        sites_file=args.sites_file,
+        max_open_sites=args.max_open_sites,
+        site_idle_timeout=args.site_idle_timeout,
     )
 
     try:
@@ -230,6 +810,14 @@ async def main_async():
         await test_wordpress_connection(args)
         return
 
+    if args.command == "upload-media":
+        await upload_media_directory(args)
+        return
+
+    if args.command == "export":
+        await export_posts(args)
+        return
+
     # Run the server
     await run_server(args)
 
@@ -0,0 +1,61 @@
+"""
+WordPress MCP Server - JSON codecs
+
+orjson is used when it is installed (``pip install wordpress-mcp-server[fast]``)
+and the standard library ``json`` module otherwise.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class JSONCodec:
+    """Standard library JSON encoding and decoding"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON encoding and decoding with orjson"""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+CODECS = {"json": JSONCodec, "orjson": OrjsonCodec}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return the named codec, or the fastest available one for ``None``/"auto"
+
+    Asking for "orjson" when it isn't installed raises ValueError.
+    """
+    if name in (None, "auto"):
+        name = "orjson" if orjson is not None else "json"
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {name}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("The orjson codec requires the orjson package")
+    return CODECS[name]()
@@ -0,0 +1,127 @@
+"""
+WordPress MCP Server - Concurrency helpers
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome
+
+    Callers that arrive while a call for the same key is in flight await that
+    call instead of starting their own. The key is forgotten as soon as the
+    call finishes, so later callers start a fresh one.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, or the in-flight call already running for ``key``"""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # Shield so one cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]"):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Every caller may have been cancelled; the failure is theirs to see,
+        # not one to report as never retrieved
+        if not future.cancelled():
+            future.exception()
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to the server's feedback (AIMD)
+
+    At most ``limit`` requests run at once; the rest wait in FIFO order. Every
+    successful request raises the limit by ``1 / limit`` (about one slot per
+    round of requests) up to ``max_limit``, and an overload signal (429, 503,
+    timeout) multiplies it by ``backoff`` down to ``min_limit``. Only the first
+    overload signal from requests started under the current limit shrinks it,
+    so one throttled burst halves the limit once rather than once per request.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min <= initial <= max")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.in_flight = 0
+        self._limit = float(initial_limit)
+        self._generation = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Requests currently allowed to run at once"""
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a slot"""
+        return len(self._waiters)
+
+    async def acquire(self) -> int:
+        """Wait for a slot; pass the returned token to ``release()``"""
+        if self._waiters or self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted a slot just as we were cancelled: hand it on
+                    self.in_flight -= 1
+                    self._wake()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+        else:
+            self.in_flight += 1
+        return self._generation
+
+    def release(self, token: int, overloaded: Optional[bool] = None):
+        """Free a slot and adjust the limit
+
+        ``overloaded`` is True for an overload signal, False for a success and
+        ``None`` when the outcome says nothing about the server's load.
+        """
+        self.in_flight -= 1
+        if overloaded:
+            if token == self._generation:
+                self._generation += 1
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        elif overloaded is False:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
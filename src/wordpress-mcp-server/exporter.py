@@ -0,0 +1,229 @@
+"""
+WordPress MCP Server - Streaming NDJSON export of posts
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence
+
+from .mirror import DELTA_OVERLAP
+
+logger = logging.getLogger(__name__)
+
+# What can be exported along with the posts
+EXPORT_INCLUDES = ("terms", "media", "revisions")
+
+# Record kind -> wp/v2 collection of the taxonomy
+TERM_ROUTES = {"category": "categories", "tag": "tags"}
+
+GZIP_LEVEL = 6
+
+# progress(posts exported, total if known) after each page of posts
+ExportProgress = Callable[[int, Optional[int]], Awaitable[None]]
+
+
+class PostExporter:
+    """Stream every post to an NDJSON file, a page at a time
+
+    Each line is one object from the REST API with a ``kind`` field added:
+    ``category`` and ``tag`` terms first when ``include`` has ``terms``, then
+    each ``post`` (followed by its ``revision`` objects with ``revisions``),
+    then ``media``. Posts and media are read from
+    ``WordPressClient.iter_pages`` in id order, so a post edited during the
+    export can't shift the pages still to be read. Pages bypass the HTTP
+    cache and each is written as soon as it arrives, so memory use depends
+    on the page size and prefetch window, not on the size of the site.
+    Revisions are fetched for up to ``prefetch_pages`` posts ahead of the
+    one being written.
+
+    The file is written next to ``path`` and moved into place when the export
+    completes, so an interrupted export never leaves a truncated file behind.
+    """
+
+    def __init__(
+        self,
+        client,
+        include: Sequence[str] = (),
+        per_page: int = 100,
+        context: str = "edit",
+        progress: Optional[ExportProgress] = None,
+    ):
+        unknown = set(include) - set(EXPORT_INCLUDES)
+        if unknown:
+            raise ValueError(f"Unknown export includes: {', '.join(sorted(unknown))}")
+        self.client = client
+        self.include = frozenset(include)
+        self.per_page = per_page
+        # "edit" exports raw content as well as rendered HTML
+        self.context = context
+        self.progress = progress
+
+    async def export(
+        self,
+        path: str,
+        status: str = "any",
+        modified_after: Optional[str] = None,
+        compress: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Export to ``path`` and return a summary
+
+        Only posts and media modified after ``modified_after`` (an ISO 8601
+        date) are exported; pass the ``last_modified`` of the previous
+        summary for an incremental export. The window starts one second
+        early, as ``modified_after`` is exclusive and only has one-second
+        resolution, so posts saved in that second are exported again. ``compress`` gzips the file and
+        defaults to whether ``path`` ends in ``.gz``.
+        """
+        try:
+            return await self._export(path, status, modified_after, compress)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def _export(
+        self,
+        path: str,
+        status: str,
+        modified_after: Optional[str],
+        compress: Optional[bool],
+    ) -> Dict[str, Any]:
+        if modified_after is not None:
+            try:
+                datetime.fromisoformat(modified_after)
+            except ValueError:
+                raise ValueError(
+                    f"modified_after must be an ISO 8601 date: {modified_after}"
+                ) from None
+        if compress is None:
+            compress = path.endswith(".gz")
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        # One writer thread keeps the lines in order
+        executor = ThreadPoolExecutor(max_workers=1)
+        tmp_path = f"{path}.tmp"
+        opener = gzip.open if compress else open
+        kwargs = {"compresslevel": GZIP_LEVEL} if compress else {}
+        f = await loop.run_in_executor(
+            executor, lambda: opener(tmp_path, "wb", **kwargs)
+        )
+        counts = {"terms": 0, "posts": 0, "revisions": 0, "media": 0}
+        last_modified = None
+
+        async def write(kind: str, items: List[Dict[str, Any]]):
+            dumps = self.client.codec.dumps_bytes
+            lines = b"".join(dumps({"kind": kind, **item}) + b"\n" for item in items)
+            await loop.run_in_executor(executor, f.write, lines)
+
+        async def write_post(post: Dict[str, Any], revisions: Optional[Any]):
+            await write("post", [post])
+            if revisions is not None:
+                found = await revisions
+                await write("revision", found)
+                counts["revisions"] += len(found)
+
+        modified: Dict[str, Any] = {"orderby": "id", "order": "asc"}
+        if modified_after is not None:
+            since = datetime.fromisoformat(modified_after) - DELTA_OVERLAP
+            modified["modified_after"] = since.isoformat()
+
+        try:
+            if "terms" in self.include:
+                for kind, route in TERM_ROUTES.items():
+                    async for page in self.client.iter_pages(
+                        route,
+                        self.per_page,
+                        orderby="id",
+                        order="asc",
+                        cache=False,
+                        hide_empty="false",
+                        context=self.context,
+                    ):
+                        await write(kind, page)
+                        counts["terms"] += len(page)
+
+            pending: Deque[Any] = deque()
+            try:
+                async for page in self.client.iter_post_pages(
+                    self.per_page,
+                    cache=False,
+                    status=status,
+                    context=self.context,
+                    **modified,
+                ):
+                    for post in page:
+                        revisions = None
+                        if "revisions" in self.include:
+                            revisions = asyncio.ensure_future(
+                                self._revisions(post["id"])
+                            )
+                        pending.append((post, revisions))
+                        if len(pending) > self.client.prefetch_pages:
+                            await write_post(*pending.popleft())
+                    if page:
+                        counts["posts"] += len(page)
+                        last_modified = max(
+                            [last_modified or ""] + [post["modified"] for post in page]
+                        )
+                    if self.progress is not None:
+                        await self.progress(counts["posts"], None)
+                while pending:
+                    await write_post(*pending.popleft())
+            finally:
+                fetches = [revisions for _, revisions in pending if revisions]
+                for revisions in fetches:
+                    revisions.cancel()
+                await asyncio.gather(*fetches, return_exceptions=True)
+
+            if "media" in self.include:
+                async for page in self.client.iter_pages(
+                    "media",
+                    self.per_page,
+                    cache=False,
+                    context=self.context,
+                    **modified,
+                ):
+                    await write("media", page)
+                    counts["media"] += len(page)
+
+            await loop.run_in_executor(executor, f.close)
+            await loop.run_in_executor(executor, os.replace, tmp_path, path)
+        except BaseException:
+            await loop.run_in_executor(executor, f.close)
+            await loop.run_in_executor(executor, _remove, tmp_path)
+            raise
+        finally:
+            executor.shutdown(wait=False)
+
+        logger.info(f"Exported {counts['posts']} posts to {path}")
+        return {
+            "success": True,
+            "path": path,
+            **counts,
+            "bytes": os.path.getsize(path),
+            "compressed": compress,
+            "last_modified": last_modified or modified_after,
+            "elapsed": round(time.monotonic() - start, 3),
+        }
+
+    async def _revisions(self, post_id: int) -> List[Dict[str, Any]]:
+        revisions = []
+        async for page in self.client.iter_pages(
+            f"posts/{post_id}/revisions",
+            self.per_page,
+            cache=False,
+            context=self.context,
+        ):
+            revisions.extend(page)
+        return revisions
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,149 @@
+"""
+WordPress MCP Server - Conditional-request HTTP cache
+"""
+
+import re
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+
+from .cache import TTLCache
+from .transport import Response
+
+Params = Union[Mapping[str, Any], Sequence[Tuple[str, Any]], None]
+
+
+class CacheEntry:
+    """A cached GET response and the validators to revalidate it with"""
+
+    __slots__ = ("response", "etag", "last_modified")
+
+    def __init__(self, response: Response):
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class HTTPCache:
+    """LRU cache of GET responses keyed by URL and query parameters
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` validator are kept
+    until evicted and revalidated with ``If-None-Match``/``If-Modified-Since``
+    on every use, so a ``304 Not Modified`` serves the cached body. Responses
+    without validators are served as-is for ``ttl`` seconds and then dropped.
+    Any write invalidates cached reads of the collection it touched.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self._entries = TTLCache(maxsize=maxsize, clock=clock)
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, params: Params = None) -> str:
+        """Cache key for a GET of ``url`` with ``params`` in any order"""
+        items = params.items() if isinstance(params, Mapping) else params or []
+        query = urlencode(sorted((str(k), str(v)) for k, v in items))
+        return f"{url}?{query}" if query else url
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        return self._entries.get(key)
+
+    def fresh_response(self, entry: Optional[CacheEntry]) -> Optional[Response]:
+        """The cached response if it can be used without asking the server"""
+        if entry is None or entry.has_validators:
+            return None
+        self.hits += 1
+        return self._from_cache(entry.response)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Validator headers that make the next GET conditional"""
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def update(
+        self,
+        key: str,
+        entry: Optional[CacheEntry],
+        response: Response,
+        store: bool = True,
+    ) -> Response:
+        """Record a GET response and return the response to hand the caller
+
+        A 304 answered for ``entry`` returns the cached body; a 200 is stored
+        unless the server forbids it. With ``store`` false nothing is stored,
+        for a read that may predate a write made while it was in flight.
+        """
+        if response.status == 304 and entry is not None:
+            self.revalidations += 1
+            # The 304 may carry refreshed validators for the same body
+            if "ETag" in response.headers:
+                entry.etag = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                entry.last_modified = response.headers["Last-Modified"]
+            if store:
+                self._entries.set(key, entry)
+            return self._from_cache(entry.response)
+
+        self.misses += 1
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if store and response.status == 200 and "no-store" not in cache_control:
+            # Expired bodies would otherwise linger until LRU eviction
+            self._entries.expire()
+            entry = CacheEntry(response)
+            self._entries.set(
+                key, entry, ttl=None if entry.has_validators else self.ttl
+            )
+        return response
+
+    def invalidate(self, url: str):
+        """Drop cached reads of the collection ``url`` belongs to
+
+        A write to ``.../wp/v2/posts/12`` invalidates ``.../wp/v2/posts`` and
+        every item and sub-route below it.
+        """
+        prefix = _collection_path(url)
+        for key in self._entries:
+            path = urlsplit(key).path
+            if path == prefix or path.startswith(prefix + "/"):
+                self._entries.pop(key)
+
+    def clear(self):
+        self._entries.clear()
+
+    @staticmethod
+    def _from_cache(response: Response) -> Response:
+        return Response(
+            200,
+            response.headers,
+            response.body,
+            response.url,
+            from_cache=True,
+            loads=response.loads,
+        )
+
+
+def _collection_path(url: str) -> str:
+    """Path of the collection a REST URL addresses, e.g. ``/wp-json/wp/v2/posts``"""
+    path = urlsplit(url).path.rstrip("/")
+    match = re.match(r"^(.*?)/\d+(/|$)", path)
+    return match.group(1) if match else path
@@ -0,0 +1,58 @@
+"""
+WordPress MCP Server - Media upload helpers
+"""
+
+import asyncio
+import mimetypes
+import os
+from typing import AsyncIterable, AsyncIterator, Iterable, Union
+from urllib.parse import quote
+
+# Bytes read from disk per chunk while streaming an upload
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+ByteSource = Union[AsyncIterable[bytes], Iterable[bytes]]
+
+
+def guess_mime_type(filename: str) -> str:
+    """MIME type WordPress should store ``filename`` as"""
+    mime_type, _ = mimetypes.guess_type(filename)
+    return mime_type or "application/octet-stream"
+
+
+def content_disposition(filename: str) -> str:
+    """``Content-Disposition`` naming the uploaded file
+
+    Non-ASCII names get an RFC 5987 ``filename*`` alongside an ASCII fallback.
+    """
+    fallback = filename.encode("ascii", "replace").decode().replace('"', "")
+    header = f'attachment; filename="{fallback}"'
+    if fallback != filename:
+        header += f"; filename*=UTF-8''{quote(filename)}"
+    return header
+
+
+async def file_chunks(
+    path: Union[str, os.PathLike], chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Read ``path`` in chunks off the event loop, holding one chunk at a time"""
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, path, "rb")
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        await loop.run_in_executor(None, f.close)
+
+
+async def iterate_bytes(source: ByteSource) -> AsyncIterator[bytes]:
+    """Iterate a sync or async iterable of byte chunks asynchronously"""
+    if hasattr(source, "__aiter__"):
+        async for chunk in source:
+            yield chunk
+    else:
+        for chunk in source:
+            yield chunk
@@ -0,0 +1,498 @@
+"""
+WordPress MCP Server - Local SQLite mirror of posts
+"""
+
+import asyncio
+import html
+import json
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Every status a post can be listed under, plus trash so deletions show up
+SYNC_STATUSES = "publish,future,draft,pending,private,trash"
+
+MIRROR_FIELDS = (
+    "id",
+    "date",
+    "modified",
+    "status",
+    "link",
+    "title",
+    "excerpt",
+    "content",
+)
+
+# Delta passes re-read this much before the high-water mark, because
+# ``modified_after`` is exclusive and only has one-second resolution
+DELTA_OVERLAP = timedelta(seconds=1)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    modified TEXT NOT NULL,
+    status TEXT NOT NULL,
+    link TEXT NOT NULL,
+    title TEXT NOT NULL,
+    excerpt TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_by_date ON posts (status, date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS created_posts (
+    key TEXT PRIMARY KEY,
+    post TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, excerpt, content, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# BM25 weights of the title, excerpt and content columns of posts_fts
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0)
+
+# Tokens of context around the matched terms in a search snippet
+SNIPPET_TOKENS = 16
+
+
+def _rendered(value: Any) -> str:
+    """The rendered text of a ``{"rendered": ...}`` field"""
+    if isinstance(value, dict):
+        return value.get("rendered", "")
+    return value or ""
+
+
+class _TextExtractor(HTMLParser):
+    SKIP = {"script", "style"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self._skipping:
+            self._skipping -= 1
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def strip_html(text: str) -> str:
+    """Visible text of an HTML fragment, whitespace collapsed"""
+    if "<" not in text and "&" not in text:
+        return " ".join(text.split())
+    extractor = _TextExtractor()
+    extractor.feed(text)
+    extractor.close()
+    return " ".join(html.unescape(" ".join(extractor.parts)).split())
+
+
+def fts_query(text: str) -> str:
+    """FTS5 query matching posts that contain every word of ``text``
+
+    Words are quoted so punctuation and FTS5 operators in user input are
+    searched for literally; a trailing ``*`` keeps its prefix meaning.
+    """
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*") if prefix else word
+        terms.append('"{}"{}'.format(word.replace('"', '""'), "*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _search_row(row) -> tuple:
+    """(rowid, title, excerpt, content) of posts_fts for a mirrored post"""
+    post_id, title, excerpt, content = row
+    return post_id, strip_html(title), strip_html(excerpt), strip_html(content)
+
+
+class PostMirror:
+    """A local copy of every post, kept current by a background sync
+
+    The first sync pages through all posts with ``WordPressClient``'s
+    paginated iterator; later ones only fetch posts modified after the
+    high-water mark (``modified_after``). Every ``full_sync_interval``
+    seconds a full pass also drops posts that were deleted on the site, after
+    looking up the ones it didn't see again. Both page by id, so a post
+    edited mid-pass can't shift the pages after it, and the high-water mark
+    only advances when a pass completes; an interrupted pass is redone.
+
+    Titles, excerpts and HTML-stripped content are indexed in an FTS5 table
+    as posts are stored, for ``search``. The mirror also serves as
+    ``WordPressClient.idempotency_store``, remembering recently created posts
+    across restarts.
+
+    SQLite runs on a dedicated thread so the event loop never waits on disk.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        client,
+        sync_interval: float = 60.0,
+        full_sync_interval: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.client = client
+        self.sync_interval = sync_interval
+        self.full_sync_interval = full_sync_interval
+        self._clock = clock
+        self._db: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional["asyncio.Future[None]"] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._sync_lock: Optional[asyncio.Lock] = None
+        self._state: Dict[str, str] = {}
+        # Writes made through this server since the mirror last caught up
+        self._writes = 0
+        self._synced_writes = 0
+
+    async def open(self) -> "PostMirror":
+        if self._db is None:
+            self._wake = asyncio.Event()
+            self._sync_lock = asyncio.Lock()
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._db = await self._run(self._connect)
+            self._state = await self._run(self._load_state)
+        return self
+
+    async def close(self):
+        await self.stop()
+        if self._db is not None:
+            await self._run(self._db.close)
+            self._db = None
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript(SCHEMA)
+        # Mirrors created before the search index existed
+        if db.execute("SELECT 1 FROM posts_fts LIMIT 1").fetchone() is None:
+            with db:
+                db.executemany(
+                    "INSERT INTO posts_fts (rowid, title, excerpt, content) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        _search_row(row)
+                        for row in db.execute(
+                            "SELECT id, title, excerpt, content FROM posts"
+                        )
+                    ),
+                )
+        return db
+
+    def _load_state(self) -> Dict[str, str]:
+        return dict(self._db.execute("SELECT key, value FROM sync_state"))
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    @property
+    def last_sync(self) -> Optional[float]:
+        """When the last sync finished (epoch seconds), if ever"""
+        value = self._state.get("last_sync")
+        return float(value) if value is not None else None
+
+    @property
+    def high_water_mark(self) -> Optional[str]:
+        """``modified`` date of the most recently modified post mirrored"""
+        return self._state.get("high_water_mark")
+
+    def is_fresh(self, max_staleness: float) -> bool:
+        """Whether reads may be served from the mirror
+
+        True if a sync finished within ``max_staleness`` seconds and no
+        write went through this server since that sync started.
+        """
+        last_sync = self.last_sync
+        return (
+            last_sync is not None
+            and self._synced_writes == self._writes
+            and self._clock() - last_sync <= max_staleness
+        )
+
+    def notify_write(self):
+        """Mark the mirror stale after a write and sync it right away"""
+        self._writes += 1
+        if self._wake is not None:
+            self._wake.set()
+
+    def start(self):
+        """Start syncing in the background every ``sync_interval`` seconds"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._sync_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sync_loop(self):
+        while True:
+            try:
+                result = await self.sync()
+                logger.debug(f"Post mirror sync: {result}")
+            except Exception as e:
+                logger.warning(f"Post mirror sync failed: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.sync_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def sync(self, full: Optional[bool] = None) -> Dict[str, Any]:
+        """Bring the mirror up to date with the site
+
+        Runs a full pass when ``full`` is True, or when it is ``None`` and no
+        full pass finished within ``full_sync_interval``; a delta otherwise.
+        """
+        async with self._sync_lock:
+            start = time.perf_counter()
+            writes = self._writes
+            last_full = float(self._state.get("last_full_sync", 0))
+            if full is None:
+                full = (
+                    self.high_water_mark is None
+                    or self._clock() - last_full >= self.full_sync_interval
+                )
+
+            # An edit mid-pass would move a post within a modified-ordered
+            # listing and shift the pages after it, so page by id
+            params: Dict[str, Any] = {
+                "status": SYNC_STATUSES,
+                "orderby": "id",
+                "order": "asc",
+            }
+            if not full:
+                hwm = datetime.fromisoformat(self.high_water_mark) - DELTA_OVERLAP
+                params["modified_after"] = hwm.isoformat()
+
+            seen: List[int] = []
+            newest = self.high_water_mark or ""
+            async for page in self.client.iter_post_pages(
+                per_page=100, fields=MIRROR_FIELDS, **params
+            ):
+                if page:
+                    await self._run(self._store_page, page)
+                    seen.extend(post["id"] for post in page)
+                    newest = max([newest] + [post["modified"] for post in page])
+
+            deleted = 0
+            state = {"last_sync": str(self._clock())}
+            if full:
+                missing = await self._run(self._missing, set(seen))
+                # Deletions elsewhere can still shift a post past a page
+                # boundary, so look the missing ones up before dropping them
+                for start in range(0, len(missing), 100):
+                    async for page in self.client.iter_post_pages(
+                        per_page=100,
+                        fields=MIRROR_FIELDS,
+                        status=SYNC_STATUSES,
+                        include=",".join(map(str, missing[start : start + 100])),
+                    ):
+                        if page:
+                            await self._run(self._store_page, page)
+                            seen.extend(post["id"] for post in page)
+                            newest = max([newest] + [post["modified"] for post in page])
+                deleted = await self._run(self._delete_missing, set(seen))
+                state["last_full_sync"] = state["last_sync"]
+            # Pages aren't in modified order, so the mark waits for the end
+            if newest:
+                state["high_water_mark"] = newest
+            await self._run(self._save_state, state)
+            self._synced_writes = writes
+
+            return {
+                "mode": "full" if full else "delta",
+                "posts": len(seen),
+                "deleted": deleted,
+                "elapsed": time.perf_counter() - start,
+            }
+
+    def _store_page(self, page: List[Dict[str, Any]]):
+        """Upsert one page of posts"""
+        rows = [
+            (
+                post["id"],
+                post["date"],
+                post["modified"],
+                post["status"],
+                post["link"],
+                _rendered(post["title"]),
+                _rendered(post["excerpt"]),
+                _rendered(post["content"]),
+            )
+            for post in page
+        ]
+        with self._db:
+            self._upsert(rows)
+
+    def _upsert(self, rows: List[tuple]):
+        self._db.executemany(
+            "INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        self._db.executemany(
+            "DELETE FROM posts_fts WHERE rowid = ?", [(row[0],) for row in rows]
+        )
+        self._db.executemany(
+            "INSERT INTO posts_fts (rowid, title, excerpt, content) "
+            "VALUES (?, ?, ?, ?)",
+            [_search_row((row[0], row[5], row[6], row[7])) for row in rows],
+        )
+
+    def _missing(self, seen: Iterable[int]) -> List[int]:
+        """Mirrored posts a full pass didn't see"""
+        stored = {row[0] for row in self._db.execute("SELECT id FROM posts")}
+        return sorted(stored - set(seen))
+
+    def _delete_missing(self, seen: Iterable[int]) -> int:
+        """Drop mirrored posts a full pass didn't see (deleted on the site)"""
+        stored = {row[0] for row in self._db.execute("SELECT id FROM posts")}
+        missing = [(post_id,) for post_id in stored - set(seen)]
+        with self._db:
+            self._db.executemany("DELETE FROM posts WHERE id = ?", missing)
+            self._db.executemany("DELETE FROM posts_fts WHERE rowid = ?", missing)
+        return len(missing)
+
+    def _save_state(self, state: Dict[str, str]):
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", state.items()
+            )
+        self._state.update(state)
+
+    async def list_posts(
+        self, status: str = "any", per_page: int = 10
+    ) -> Dict[str, Any]:
+        """``WordPressClient.list_posts`` answered from the mirror"""
+        try:
+            rows = await self._run(self._select_posts, status, per_page)
+            posts = [
+                {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "url": row["link"],
+                    "status": row["status"],
+                    "date": row["date"],
+                    "excerpt": row["excerpt"],
+                }
+                for row in rows
+            ]
+            return {"success": True, "posts": posts}
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _select_posts(self, status: str, limit: int) -> List[sqlite3.Row]:
+        # "any" means every status except trash, as in the REST API
+        if status == "any":
+            where, args = "status != 'trash'", ()
+        else:
+            where, args = "status = ?", (status,)
+        return self._db.execute(
+            f"SELECT * FROM posts WHERE {where} ORDER BY date DESC, id DESC LIMIT ?",
+            (*args, limit),
+        ).fetchall()
+
+    async def search(
+        self, query: str, status: str = "any", per_page: int = 10
+    ) -> Dict[str, Any]:
+        """Posts matching every word of ``query``, best BM25 match first"""
+        try:
+            match = fts_query(query)
+            if not match:
+                raise ValueError("Search query is empty")
+            rows = await self._run(self._search, match, status, per_page)
+            posts = [
+                {
+                    "id": row["id"],
+                    "title": strip_html(row["title"]),
+                    "url": row["link"],
+                    "status": row["status"],
+                    "date": row["date"],
+                    "snippet": row["snippet"],
+                    "score": -row["rank"],
+                }
+                for row in rows
+            ]
+            return {"success": True, "posts": posts}
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _search(self, match: str, status: str, limit: int) -> List[sqlite3.Row]:
+        if status == "any":
+            where, args = "posts.status != 'trash'", ()
+        else:
+            where, args = "posts.status = ?", (status,)
+        return self._db.execute(
+            "SELECT posts.id, posts.title, posts.link, posts.status, posts.date, "
+            "snippet(posts_fts, -1, '**', '**', '...', ?) AS snippet, "
+            "bm25(posts_fts, ?, ?, ?) AS rank "
+            "FROM posts_fts JOIN posts ON posts.id = posts_fts.rowid "
+            f"WHERE posts_fts MATCH ? AND {where} ORDER BY rank LIMIT ?",
+            (SNIPPET_TOKENS, *SEARCH_WEIGHTS, match, *args, limit),
+        ).fetchall()
+
+    async def get_created(self, key: str) -> Optional[Dict[str, Any]]:
+        """The post created under idempotency ``key``, if not expired"""
+        if self._db is None:
+            return None
+        try:
+            row = await self._run(self._select_created, key, self._clock())
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read created post: {str(e)}")
+            return None
+        return json.loads(row[0]) if row is not None else None
+
+    async def put_created(self, key: str, post: Dict[str, Any], expires_at: float):
+        """Remember a created post until ``expires_at`` (epoch seconds)"""
+        if self._db is None:
+            return
+        try:
+            await self._run(self._store_created, key, json.dumps(post), expires_at)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record created post: {str(e)}")
+
+    def _select_created(self, key: str, now: float) -> Optional[sqlite3.Row]:
+        return self._db.execute(
+            "SELECT post FROM created_posts WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+
+    def _store_created(self, key: str, post: str, expires_at: float):
+        with self._db:
+            self._db.execute(
+                "DELETE FROM created_posts WHERE expires_at <= ?", (self._clock(),)
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO created_posts VALUES (?, ?, ?)",
+                (key, post, expires_at),
+            )
@@ -0,0 +1,197 @@
+"""
+WordPress MCP Server - Retry policy and circuit breaker
+"""
+
+import asyncio
+import random
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .transport import ConnectionNotEstablished
+
+# Statuses that mean "try again later" rather than "this request is wrong"
+RETRY_STATUSES = frozenset({408, 429, 502, 503, 504})
+
+# Transport failures worth retrying: resets, disconnects, timeouts
+RETRY_EXCEPTIONS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def is_idempotent(method: str, url: str) -> bool:
+    """Whether replaying ``method url`` cannot create a second resource
+
+    WordPress updates items with a POST to the item route (``/posts/12``),
+    which sets fields rather than appending, so those count as idempotent.
+    A POST to a collection creates a new resource each time and does not.
+    """
+    method = method.upper()
+    if method in IDEMPOTENT_METHODS:
+        return True
+    return method in ("POST", "PATCH") and bool(
+        re.search(r"/\d+/?$", urlsplit(url).path)
+    )
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc).timestamp()
+    return max(0.0, when.timestamp() - now)
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a WordPress request
+
+    Failed attempts are retried up to ``max_retries`` times with full-jitter
+    exponential backoff: a random delay between 0 and
+    ``min(max_delay, backoff * 2 ** attempt)``. A ``Retry-After`` header
+    replaces the backoff, unless it asks for more than ``max_delay``, in which
+    case the response is returned as-is.
+
+    Non-idempotent requests (creates) are only retried when they provably did
+    not reach WordPress: the connection could not be opened, or the request
+    was rejected with 429 before being processed.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 30.0,
+        rand: Callable[[], float] = random.random,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self._rand = rand
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Jittered delay before retry number ``attempt + 1``"""
+        return self._rand() * min(self.max_delay, self.backoff * 2**attempt)
+
+    def error_delay(
+        self, error: BaseException, attempt: int, idempotent: bool
+    ) -> Optional[float]:
+        """Delay before retrying after ``error``, or ``None`` to give up"""
+        if attempt >= self.max_retries or not isinstance(error, RETRY_EXCEPTIONS):
+            return None
+        # Only a failed connect proves a non-idempotent request wasn't sent
+        if not idempotent and not isinstance(
+            error, (aiohttp.ClientConnectorError, ConnectionNotEstablished)
+        ):
+            return None
+        return self.backoff_delay(attempt)
+
+    def status_delay(
+        self,
+        status: int,
+        retry_after: Optional[str],
+        attempt: int,
+        idempotent: bool,
+    ) -> Optional[float]:
+        """Delay before retrying a ``status`` response, or ``None`` to give up"""
+        if attempt >= self.max_retries or status not in RETRY_STATUSES:
+            return None
+        if not idempotent and status != 429:
+            return None
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            return self.backoff_delay(attempt)
+        return delay if delay <= self.max_delay else None
+
+
+class CircuitOpenError(Exception):
+    """A request was refused because the circuit breaker for its host is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(
+            f"{host} is unavailable after repeated failures; "
+            f"retrying in {retry_in:.0f}s"
+        )
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Fail fast while a host keeps failing
+
+    After ``failure_threshold`` consecutive failures (transport errors or
+    5xx responses) the circuit opens and requests are refused for
+    ``reset_timeout`` seconds. Then one trial request is let through: success
+    closes the circuit, failure opens it again. A threshold of 0 disables the
+    breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._clock = clock
+        self._opened_at = 0.0
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        if self.state == self.CLOSED:
+            return
+        elapsed = self._clock() - self._opened_at
+        if elapsed < self.reset_timeout:
+            raise CircuitOpenError(self.host, self.reset_timeout - elapsed)
+        # Let one trial request through; restart the timer so that a trial
+        # that never reports back doesn't keep the circuit half-open forever
+        self.state = self.HALF_OPEN
+        self._opened_at = self._clock()
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failure_threshold <= 0:
+            return
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+
+    def record_status(self, status: int):
+        """Count 5xx responses as failures and anything else as success"""
+        if status >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
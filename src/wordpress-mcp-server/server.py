@@ -3,10 +3,29 @@ WordPress MCP Server - Main server implementation
 """
 
 import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
+import time
+import unicodedata
 import mcp
-from typing import Any, Dict, List, Optional, Sequence
-from urllib.parse import urljoin
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote, urljoin, urlsplit
 import aiohttp
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -25,46 +44,516 @@ from mcp.types import (
     PromptArgument,
 )
 
+from .auth import auth_probes, create_auth, credential_fingerprint
+from .cache import TTLCache
+from .codec import get_codec
+from .concurrency import AdaptiveLimiter, SingleFlight
+from .exporter import EXPORT_INCLUDES, PostExporter
+from .http_cache import HTTPCache, Params
+from .media import (
+    ByteSource,
+    content_disposition,
+    file_chunks,
+    guess_mime_type,
+    iterate_bytes,
+)
+from .mirror import PostMirror
+from .retry import (
+    RETRY_EXCEPTIONS,
+    CircuitBreaker,
+    RetryPolicy,
+    is_idempotent,
+)
+from .sites import DEFAULT_SITE, ClientPool, Site, SiteRegistry, UnknownSiteError
+from .transport import Response, create_transport, parse_connect_to
+from .uploader import MediaUploader
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Taxonomies posts are tagged with, by REST route name
+TAXONOMIES = ("categories", "tags")
+
+# Responses telling the adaptive limiter to back off
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+# Methods whose identical concurrent requests share one response
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+# Most sub-requests WordPress accepts in one /batch/v1 call
+BATCH_MAX_REQUESTS = 25
+
+# Default ``_fields`` projections: only what the client actually reads
+USER_FIELDS = ("id", "name", "username", "email", "roles")
+POST_FIELDS = ("id", "title", "link", "status", "date")
+POST_SUMMARY_FIELDS = POST_FIELDS + ("excerpt",)
+TERM_FIELDS = ("id", "name", "slug")
+MEDIA_FIELDS = ("id", "title", "source_url", "mime_type", "link")
+
+
+def fields_param(fields: Sequence[str]) -> Dict[str, str]:
+    """Query parameters asking WordPress to only return ``fields``"""
+    return {"_fields": ",".join(fields)}
+
+
+def content_hash(value: Any) -> str:
+    """Digest identifying a post field value, for change detection"""
+    return hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+
+
+def creation_key(
+    title: str,
+    content: str,
+    status: str,
+    categories: Sequence[str] = (),
+    tags: Sequence[str] = (),
+) -> str:
+    """Idempotency key of a create_post call
+
+    Term names are compared case-insensitively and in any order, as they
+    resolve to the same terms.
+    """
+    terms = [
+        sorted({name.strip().lower() for name in names}) for names in (categories, tags)
+    ]
+    return content_hash(json.dumps([title, content, status, *terms]))
+
+
+# Characters sanitize_title() drops from slugs, and those it turns into dashes
+SLUG_DROPPED = "'\"\u2018\u2019\u201c\u201d"
+SLUG_DASHES = " ./\u00a0\u2013\u2014"
+
+
+def slugify(name: str) -> str:
+    """Approximate WordPress' sanitize_title() for looking terms up by slug
+
+    Accented Latin letters lose their accents, other non-ASCII characters are
+    percent-encoded in lower case, whitespace, dots, slashes and dashes
+    become one dash, and other punctuation except ``_`` is dropped.
+    """
+    chars = []
+    for char in unicodedata.normalize("NFC", name.strip().lower()):
+        if char in SLUG_DROPPED:
+            continue
+        if char in SLUG_DASHES or char.isspace():
+            char = "-"
+        elif not char.isascii():
+            base = unicodedata.normalize("NFKD", char)[0]
+            char = base if base.isascii() else quote(char).lower()
+        elif not (char.isalnum() or char in "_-"):
+            continue
+        chars.append(char)
+    return re.sub(r"-+", "-", "".join(chars)).strip("-")
+
 
 class WordPressClient:
-    """WordPress REST API client"""
+    """WordPress REST API client
 
-    def __init__(self, base_url: str, username: str = "admin", password: str = "admin"):
+    A client owns one ``aiohttp.ClientSession`` backed by a pooled
+    ``TCPConnector``. It can be used as an async context manager for one-off
+    work, or opened once with ``open()`` and shared for the lifetime of a
+    server so that connections are kept alive between tool calls.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str = "admin",
+        password: str = "admin",
+        pool_limit: int = 100,
+        pool_limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        term_cache_ttl: Optional[float] = 3600.0,
+        term_cache_size: int = 10000,
+        batch_concurrency: int = 4,
+        prefetch_pages: int = 4,
+        http_cache_size: int = 256,
+        http_cache_ttl: float = 5.0,
+        json_codec: Optional[str] = "auto",
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        retry_max_delay: float = 30.0,
+        breaker_threshold: int = 5,
+        breaker_reset_timeout: float = 30.0,
+        concurrency_limit: int = 8,
+        max_concurrency: int = 64,
+        auth_method: str = "basic",
+        jwt_token_url: Optional[str] = None,
+        token_refresh_margin: float = 60.0,
+        post_hash_cache_size: int = 4096,
+        post_hash_ttl: Optional[float] = 600.0,
+        create_dedup_window: float = 600.0,
+        create_dedup_size: int = 1024,
+        auth_probe_ttl: float = 60.0,
+        auth_probe_negative_ttl: float = 10.0,
+        http_backend: str = "aiohttp",
+        http2_prior_knowledge: bool = False,
+        connect_to: Optional[str] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_base = f"{self.base_url}/wp-json/wp/v2"
         self.username = username
         self.password = password
-        self.session = None
+        # Authorization headers are built once (or per token) and reused
+        self.auth = create_auth(
+            auth_method,
+            self.base_url,
+            username,
+            password,
+            token_url=jwt_token_url,
+            refresh_margin=token_refresh_margin,
+        )
+        # probe_auth() results are shared per site and credentials
+        self.auth_probe_ttl = auth_probe_ttl
+        self.auth_probe_negative_ttl = auth_probe_negative_ttl
+        self._probe_key = (
+            self.base_url,
+            credential_fingerprint(auth_method, username, password),
+        )
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.batch_concurrency = batch_concurrency
+        self.prefetch_pages = prefetch_pages
+        # orjson when installed, stdlib json otherwise (or as configured)
+        self.codec = get_codec(json_codec)
+        # A Unix socket or fixed address of a co-located WordPress, if any
+        self.unix_socket, self.resolver = parse_connect_to(connect_to)
+        if (
+            self.unix_socket
+            and http_backend == "aiohttp"
+            and self.base_url.startswith("https://")
+        ):
+            # aiohttp's UnixConnector never starts TLS
+            raise ValueError(
+                "unix: sockets carry plain HTTP on the aiohttp backend; use an "
+                "http:// URL or --http-backend httpx for TLS"
+            )
+        # aiohttp (HTTP/1.1) by default, or httpx to multiplex over HTTP/2
+        self.transport = create_transport(
+            http_backend,
+            self._create_connector,
+            self.codec,
+            max_connections=pool_limit,
+            keepalive_timeout=keepalive_timeout,
+            http2_prior_knowledge=http2_prior_knowledge,
+            connect_to=connect_to,
+        )
+        # Case-insensitive term name -> term ID, per taxonomy
+        self._term_cache = {
+            taxonomy: TTLCache(maxsize=term_cache_size, ttl=term_cache_ttl)
+            for taxonomy in TAXONOMIES
+        }
+        self._term_creations = SingleFlight()
+        self.retry_policy = RetryPolicy(
+            max_retries=max_retries, backoff=retry_backoff, max_delay=retry_max_delay
+        )
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # AIMD limit on requests in flight; a max_concurrency of 0 disables it
+        self.limiter = (
+            AdaptiveLimiter(
+                initial_limit=min(concurrency_limit, max_concurrency),
+                max_limit=max_concurrency,
+            )
+            if max_concurrency > 0
+            else None
+        )
+        # Conditional-request cache for GETs; a size of 0 disables it
+        self.http_cache = (
+            HTTPCache(maxsize=http_cache_size, ttl=http_cache_ttl)
+            if http_cache_size > 0
+            else None
+        )
+        # Identical GETs and HEADs in flight share one request (see _request)
+        self._reads = SingleFlight()
+        # Bumped by every write so reads issued after it don't join older
+        # ones, and reads that raced it aren't cached
+        self._write_generation = 0
+        # Post ID -> hashes of the fields last written and the result, so
+        # updates can skip unchanged fields; a size of 0 disables it
+        self._post_hashes = (
+            TTLCache(maxsize=post_hash_cache_size, ttl=post_hash_ttl)
+            if post_hash_cache_size > 0
+            else None
+        )
+        # Posts created in the last create_dedup_window seconds, by
+        # creation_key(); a window of 0 disables deduplication
+        self.create_dedup_window = create_dedup_window
+        self._created = (
+            TTLCache(maxsize=create_dedup_size, ttl=create_dedup_window)
+            if create_dedup_window > 0 and create_dedup_size > 0
+            else None
+        )
+        self._creations = SingleFlight()
+        # Optional persistent store of creations (see PostMirror), so
+        # duplicates are caught across restarts
+        self.idempotency_store = None
+
+    @property
+    def coalescing(self) -> Dict[str, int]:
+        """Reads sent upstream and reads that joined one already in flight"""
+        return {"requests": self._reads.calls, "coalesced": self._reads.coalesced}
+
+    @property
+    def session(self):
+        """The open session of the HTTP backend, if any"""
+        return self.transport.session
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client has no open session"""
+        return self.transport.closed
+
+    def _create_connector(self) -> aiohttp.BaseConnector:
+        """Build the pooled connector shared by every request of this client"""
+        options = {
+            "limit": self.pool_limit,
+            "limit_per_host": self.pool_limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+        }
+        if self.unix_socket:
+            return aiohttp.UnixConnector(self.unix_socket, **options)
+        return aiohttp.TCPConnector(
+            ttl_dns_cache=self.dns_cache_ttl, resolver=self.resolver, **options
+        )
+
+    async def open(self) -> "WordPressClient":
+        """Open the HTTP session; calling it on an open client is a no-op"""
+        await self.transport.open()
+        return self
+
+    async def close(self):
+        """Close the HTTP session and release pooled connections"""
+        await self.transport.close()
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
+        return await self.open()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.close()
 
-    async def authenticate(self) -> Dict[str, Any]:
-        """Test authentication with WordPress"""
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        data: Any = None,
+        cache: bool = True,
+    ) -> Response:
+        """Send one request to WordPress and read the whole response
+
+        GETs go through the HTTP cache unless ``cache`` is false: fresh
+        entries are served without a request and stale ones are revalidated.
+        Any other method invalidates the cached reads of the collection it
+        writes to. Identical concurrent GETs and HEADs are coalesced into one
+        request (see ``coalescing``).
+
+        Transient failures are retried by the retry policy; ``idempotent``
+        overrides the guess made from the method and URL. Requests to a host
+        whose circuit breaker is open fail with CircuitOpenError.
+
+        ``data`` is a raw request body. A streamed body can only be sent once,
+        so pass a callable returning a fresh stream to keep retries enabled.
+        """
+        if method in COALESCED_METHODS and data is None and json is None:
+            # Identical reads in flight at once share one request, unless a
+            # write finished in between and the earlier read may be stale
+            key = (
+                method,
+                HTTPCache.key(url, params),
+                tuple(sorted((headers or {}).items())),
+                self._write_generation,
+                cache,
+            )
+            return await self._reads.do(
+                key,
+                lambda: self._request_now(method, url, params, headers, cache=cache),
+            )
+        return await self._request_now(
+            method, url, params, headers, json, idempotent, data
+        )
+
+    async def _request_now(
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Optional[Dict[str, str]] = None,
+        json: Any = None,
+        idempotent: Optional[bool] = None,
+        data: Any = None,
+        cache: bool = True,
+    ) -> Response:
+        cache_key = entry = None
+        if method == "GET" and cache and self.http_cache is not None:
+            cache_key = self.http_cache.key(url, params)
+            entry = self.http_cache.lookup(cache_key)
+            cached = self.http_cache.fresh_response(entry)
+            if cached is not None:
+                return cached
+            headers = {**(headers or {}), **self.http_cache.conditional_headers(entry)}
+        generation = self._write_generation
+
+        if idempotent is None:
+            idempotent = is_idempotent(method, url)
+        replayable = data is None or callable(data) or isinstance(data, bytes)
+        breaker = self.circuit_breaker(url)
+        attempt = 0
+        reauthenticated = False
         try:
-            auth = aiohttp.BasicAuth(self.username, self.password)
-            async with self.session.get(
-                f"{self.api_base}/users/me", auth=auth
-            ) as response:
-                if response.status == 200:
-                    user_data = await response.json()
-                    return {"success": True, "user": user_data}
+            while True:
+                breaker.before_request()
+                try:
+                    result = await self._send(method, url, params, json, headers, data)
+                except RETRY_EXCEPTIONS as e:
+                    breaker.record_failure()
+                    delay = self.retry_policy.error_delay(e, attempt, idempotent)
+                    if delay is None or not replayable:
+                        raise
+                    logger.debug(f"Retrying {method} {url} after {e!r}")
                 else:
-                    return {
-                        "success": False,
-                        "error": f"Authentication failed: {response.status}",
-                    }
+                    breaker.record_status(result.status)
+                    if not replayable:
+                        break
+                    if result.status == 401 and not reauthenticated:
+                        # An expired or revoked token: fetch a new one once
+                        reauthenticated = self.auth.invalidate()
+                        if reauthenticated:
+                            continue
+                    delay = self.retry_policy.status_delay(
+                        result.status,
+                        result.headers.get("Retry-After"),
+                        attempt,
+                        idempotent,
+                    )
+                    if delay is None:
+                        break
+                    logger.debug(f"Retrying {method} {url} after {result.status}")
+                attempt += 1
+                await asyncio.sleep(delay)
+        finally:
+            if method not in COALESCED_METHODS:
+                self._write_generation += 1
+                self._invalidate(url)
+
+        if result.status == 401:
+            auth_probes.invalidate(self._probe_key)
+        if cache_key is not None:
+            # A write while this read was in flight has already invalidated
+            # the cache, and this response may predate it
+            store = generation == self._write_generation
+            result = self.http_cache.update(cache_key, entry, result, store)
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Params,
+        json: Any,
+        headers: Optional[Dict[str, str]],
+        data: Any = None,
+    ) -> Response:
+        """Send one attempt, within the adaptive concurrency limit"""
+        if self.limiter is None:
+            return await self._send_now(method, url, params, json, headers, data)
+
+        token = await self.limiter.acquire()
+        overloaded = None
+        try:
+            result = await self._send_now(method, url, params, json, headers, data)
+            overloaded = result.status in OVERLOAD_STATUSES
+            return result
+        except asyncio.TimeoutError:
+            overloaded = True
+            raise
+        finally:
+            self.limiter.release(token, overloaded)
+
+    async def _send_now(
+        self,
+        method: str,
+        url: str,
+        params: Params,
+        json: Any,
+        headers: Optional[Dict[str, str]],
+        data: Any = None,
+    ) -> Response:
+        headers = {**(headers or {}), **await self.auth.headers(self.transport)}
+        return await self.transport.request(
+            method,
+            url,
+            params=params,
+            json=json,
+            data=data() if callable(data) else data,
+            headers=headers,
+        )
+
+    def circuit_breaker(self, url: str) -> CircuitBreaker:
+        """The circuit breaker for the host ``url`` points at"""
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                host,
+                failure_threshold=self.breaker_threshold,
+                reset_timeout=self.breaker_reset_timeout,
+            )
+        return breaker
+
+    def _invalidate(self, url: str):
+        """Forget cached reads made stale by a write to ``url``"""
+        if self.http_cache is not None:
+            self.http_cache.invalidate(url)
+
+    async def authenticate(
+        self, fields: Optional[Sequence[str]] = USER_FIELDS
+    ) -> Dict[str, Any]:
+        """Test authentication with WordPress
+
+        ``fields`` limits the user fields returned; ``None`` returns them all.
+        """
+        try:
+            response = await self._request(
+                "GET",
+                f"{self.api_base}/users/me",
+                params=fields_param(fields) if fields else None,
+            )
+            if response.status == 200:
+                return {"success": True, "user": response.json()}
+            else:
+                return {
+                    "success": False,
+                    "error": f"Authentication failed: {response.status}",
+                }
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    async def probe_auth(self) -> Dict[str, Any]:
+        """``authenticate()``, answered from a short-lived cache
+
+        Successes are reused for ``auth_probe_ttl`` seconds and refreshed in
+        the background during the last quarter of that, failures for
+        ``auth_probe_negative_ttl`` seconds; a 401 from any request drops the
+        cached result. A TTL of 0 always checks.
+        """
+        if self.auth_probe_ttl <= 0:
+            return await self.authenticate()
+        return await auth_probes.get(
+            self._probe_key,
+            self.authenticate,
+            ttl=self.auth_probe_ttl,
+            negative_ttl=self.auth_probe_negative_ttl,
+            refresh_margin=self.auth_probe_ttl / 4,
+        )
+
     async def create_post(
         self,
         title: str,
@@ -74,10 +563,49 @@ class WordPressClient:
         categories: List[str] = None,
         tags: List[str] = None,
     ) -> Dict[str, Any]:
-        """Create a new WordPress post"""
-        try:
-            auth = aiohttp.BasicAuth(self.username, self.password)
+        """Create a new WordPress post
+
+        Repeating a call with the same title, content, status and terms
+        within ``create_dedup_window`` seconds returns the post created the
+        first time, marked ``"duplicate": True``, instead of creating another;
+        concurrent identical calls share one request.
+        """
+        args = (title, content, status, excerpt, categories, tags)
+        if self._created is None:
+            return await self._create_post(*args)
+        key = creation_key(title, content, status, categories or (), tags or ())
+        created = self._created.get(key)
+        if created is not None:
+            return {"success": True, "duplicate": True, "post": dict(created)}
+        return await self._creations.do(key, lambda: self._create_once(key, args))
+
+    async def _create_once(self, key: str, args: tuple) -> Dict[str, Any]:
+        store = self.idempotency_store
+        if store is not None:
+            created = await store.get_created(key)
+            if created is not None:
+                self._created.set(key, created)
+                return {"success": True, "duplicate": True, "post": dict(created)}
+
+        result = await self._create_post(*args)
+        if result["success"]:
+            self._created.set(key, result["post"])
+            if store is not None:
+                await store.put_created(
+                    key, result["post"], time.time() + self.create_dedup_window
+                )
+        return result
 
+    async def _create_post(
+        self,
+        title: str,
+        content: str,
+        status: str,
+        excerpt: str,
+        categories: Optional[List[str]],
+        tags: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        try:
             # Prepare post data
             post_data = {
                 "title": title,
@@ -87,41 +615,38 @@ class WordPressClient:
                 "format": "standard",
             }
 
-            # Handle categories
+            # Resolve categories and tags in parallel, creating missing ones
+            category_ids, tag_ids = await asyncio.gather(
+                self._get_or_create_categories(categories or []),
+                self._get_or_create_tags(tags or []),
+            )
             if categories:
-                # First, get existing categories or create new ones
-                category_ids = await self._get_or_create_categories(categories)
                 post_data["categories"] = category_ids
-
-            # Handle tags
             if tags:
-                tag_ids = await self._get_or_create_tags(tags)
                 post_data["tags"] = tag_ids
 
-            async with self.session.post(
+            response = await self._request(
+                "POST",
                 f"{self.api_base}/posts",
+                params=fields_param(POST_FIELDS),
                 json=post_data,
-                auth=auth,
-                headers={"Content-Type": "application/json"},
-            ) as response:
-                if response.status == 201:
-                    post = await response.json()
-                    return {
-                        "success": True,
-                        "post": {
-                            "id": post["id"],
-                            "title": post["title"]["rendered"],
-                            "url": post["link"],
-                            "status": post["status"],
-                            "date": post["date"],
-                        },
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Failed to create post: {response.status} - {error_text}",
-                    }
+            )
+            if response.status == 201:
+                post = response.json()
+                summary = {
+                    "id": post["id"],
+                    "title": post["title"]["rendered"],
+                    "url": post["link"],
+                    "status": post["status"],
+                    "date": post["date"],
+                }
+                self._remember_post(summary, post_data)
+                return {"success": True, "post": summary}
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to create post: {response.status} - {response.text()}",
+                }
 
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -129,10 +654,13 @@ class WordPressClient:
     async def update_post(
         self, post_id: int, title: str = None, content: str = None, status: str = None
     ) -> Dict[str, Any]:
-        """Update an existing WordPress post"""
-        try:
-            auth = aiohttp.BasicAuth(self.username, self.password)
+        """Update an existing WordPress post
 
+        Fields identical to what this client last wrote to the post are not
+        sent; if none are left, no request is made and the last result is
+        returned with ``"unchanged": True``.
+        """
+        try:
             post_data = {}
             if title:
                 post_data["title"] = title
@@ -141,29 +669,147 @@ class WordPressClient:
             if status:
                 post_data["status"] = status
 
-            async with self.session.post(
+            post_data, unchanged = self._changed_fields(post_id, post_data)
+            if unchanged is not None:
+                return unchanged
+
+            response = await self._request(
+                "POST",
                 f"{self.api_base}/posts/{post_id}",
+                params=fields_param(POST_FIELDS),
                 json=post_data,
-                auth=auth,
-                headers={"Content-Type": "application/json"},
-            ) as response:
-                if response.status == 200:
-                    post = await response.json()
-                    return {
-                        "success": True,
-                        "post": {
-                            "id": post["id"],
-                            "title": post["title"]["rendered"],
-                            "url": post["link"],
-                            "status": post["status"],
-                        },
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Failed to update post: {response.status} - {error_text}",
-                    }
+            )
+            if response.status == 200:
+                post = response.json()
+                summary = {
+                    "id": post["id"],
+                    "title": post["title"]["rendered"],
+                    "url": post["link"],
+                    "status": post["status"],
+                }
+                self._remember_post(summary, post_data)
+                return {"success": True, "post": summary}
+            else:
+                self._forget_post(post_id)
+                return {
+                    "success": False,
+                    "error": f"Failed to update post: {response.status} - {response.text()}",
+                }
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _changed_fields(
+        self, post_id: int, post_data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Drop fields last written with the same value
+
+        Returns the fields left to send and, when there are none, the
+        ``unchanged`` result to return instead of sending a request.
+        """
+        known = self._post_hashes.get(post_id) if self._post_hashes else None
+        if known is None:
+            return post_data, None
+        changed = {
+            field: value
+            for field, value in post_data.items()
+            if known["hashes"].get(field) != content_hash(value)
+        }
+        if changed:
+            return changed, None
+        return changed, {
+            "success": True,
+            "unchanged": True,
+            "post": dict(known["post"]),
+        }
+
+    def _remember_post(self, summary: Dict[str, Any], post_data: Dict[str, Any]):
+        """Record what was just written to a post"""
+        if self._post_hashes is None:
+            return
+        known = self._post_hashes.get(summary["id"]) or {"hashes": {}}
+        hashes = dict(known["hashes"])
+        hashes.update(
+            (field, content_hash(value)) for field, value in post_data.items()
+        )
+        post = {field: summary[field] for field in ("id", "title", "url", "status")}
+        self._post_hashes.set(summary["id"], {"hashes": hashes, "post": post})
+
+    def _forget_post(self, post_id: int):
+        if self._post_hashes is not None:
+            self._post_hashes.pop(post_id)
+
+    async def upload_media(
+        self,
+        source: Union[str, os.PathLike, ByteSource],
+        filename: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        size: Optional[int] = None,
+        title: Optional[str] = None,
+        alt_text: Optional[str] = None,
+        caption: Optional[str] = None,
+        meta: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Upload a file to the media library without buffering it
+
+        ``source`` is a path, streamed from disk in chunks, or an iterable
+        (sync or async) of byte chunks, which needs a ``filename`` and is sent
+        with chunked transfer encoding unless its ``size`` is given. The MIME
+        type is guessed from the file name unless ``mime_type`` is set.
+        ``meta`` sets registered attachment meta fields.
+        """
+        try:
+            if isinstance(source, (str, os.PathLike)):
+                path = source
+                filename = filename or os.path.basename(path)
+                size = os.path.getsize(path)
+                # A fresh stream per attempt so that the upload can be retried
+                data = functools.partial(file_chunks, path)
+            elif filename:
+                data = iterate_bytes(source)
+            else:
+                raise ValueError("A filename is required to upload a byte stream")
+
+            headers = {
+                "Content-Type": mime_type or guess_mime_type(filename),
+                "Content-Disposition": content_disposition(filename),
+            }
+            if size is not None:
+                headers["Content-Length"] = str(size)
+            params = fields_param(MEDIA_FIELDS)
+            for field, value in (
+                ("title", title),
+                ("alt_text", alt_text),
+                ("caption", caption),
+            ):
+                if value:
+                    params[field] = value
+            for key, value in (meta or {}).items():
+                params[f"meta[{key}]"] = value
+
+            response = await self._request(
+                "POST",
+                f"{self.api_base}/media",
+                params=params,
+                headers=headers,
+                data=data,
+            )
+            if response.status == 201:
+                media = response.json()
+                return {
+                    "success": True,
+                    "media": {
+                        "id": media["id"],
+                        "title": media["title"]["rendered"],
+                        "url": media["source_url"],
+                        "mime_type": media["mime_type"],
+                    },
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to upload media: {response.status} - {response.text()}",
+                }
 
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -171,109 +817,512 @@ class WordPressClient:
     async def list_posts(
         self, status: str = "any", per_page: int = 10
     ) -> Dict[str, Any]:
-        """List WordPress posts"""
+        """List the ``per_page`` most recent WordPress posts
+
+        More than 100 posts are fetched over several pages.
+        """
         try:
-            auth = aiohttp.BasicAuth(self.username, self.password)
-            params = {
-                "status": status,
-                "per_page": per_page,
-                "orderby": "date",
-                "order": "desc",
+            posts = []
+            async for post in self.iter_posts(
+                status=status,
+                per_page=min(per_page, 100),
+                max_posts=per_page,
+                fields=POST_SUMMARY_FIELDS,
+                cache=True,
+            ):
+                posts.append(
+                    {
+                        "id": post["id"],
+                        "title": post["title"]["rendered"],
+                        "url": post["link"],
+                        "status": post["status"],
+                        "date": post["date"],
+                        "excerpt": post["excerpt"]["rendered"],
+                    }
+                )
+            return {"success": True, "posts": posts}
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def iter_posts(
+        self,
+        status: str = "any",
+        per_page: int = 100,
+        max_posts: Optional[int] = None,
+        **params: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield posts newest first, fetched page by page
+
+        ``params`` are extra ``/posts`` query parameters, ``fields`` an
+        optional projection and ``cache`` whether pages go through the HTTP
+        cache (see ``iter_pages``). Stops after
+        ``max_posts`` posts when given.
+        """
+        max_pages = None if max_posts is None else -(-max_posts // per_page)
+        pages = self.iter_post_pages(
+            status=status, per_page=per_page, max_pages=max_pages, **params
+        )
+        count = 0
+        try:
+            async for page in pages:
+                for post in page:
+                    if max_posts is not None and count >= max_posts:
+                        return
+                    count += 1
+                    yield post
+        finally:
+            await pages.aclose()
+
+    def iter_post_pages(
+        self,
+        per_page: int = 100,
+        max_pages: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        cache: bool = False,
+        **params: Any,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of raw posts in order, prefetching the pages ahead
+
+        See ``iter_pages``; ``fields`` restricts each post to those top-level
+        fields and ``None`` returns full post objects.
+        """
+        return self.iter_pages("posts", per_page, max_pages, fields, cache, **params)
+
+    async def iter_pages(
+        self,
+        route: str,
+        per_page: int = 100,
+        max_pages: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        cache: bool = False,
+        **params: Any,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of a wp/v2 collection such as ``media`` in order
+
+        The page count comes from the ``X-WP-TotalPages`` header of the first
+        response. Up to ``prefetch_pages`` later pages are fetched concurrently
+        while the caller consumes the current one, so at most that many pages
+        are held in memory at a time. Pages bypass the HTTP cache unless
+        ``cache`` is true, so paging through a large collection doesn't fill
+        it with bodies that are rarely read twice.
+        """
+        query = {"orderby": "date", "order": "desc", **params, "per_page": per_page}
+        if fields:
+            query.update(fields_param(fields))
+
+        async def fetch_page(page: int):
+            response = await self._request(
+                "GET",
+                f"{self.api_base}/{route}",
+                params={**query, "page": page},
+                cache=cache,
+            )
+            response.raise_for_status()
+            return response.json(), response.header_int("X-WP-TotalPages", 1)
+
+        posts, total_pages = await fetch_page(1)
+        if max_pages is not None:
+            total_pages = min(total_pages, max_pages)
+
+        pending: Deque["asyncio.Future[Any]"] = deque()
+        next_page = 2
+
+        def prefetch():
+            nonlocal next_page
+            while next_page <= total_pages and len(pending) < self.prefetch_pages:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+
+        try:
+            # The window is topped up before each yield, so later pages load
+            # while the caller works on the current one, including the first
+            prefetch()
+            yield posts
+            while pending:
+                posts, _ = await pending.popleft()
+                prefetch()
+                yield posts
+        finally:
+            for task in pending:
+                task.cancel()
+            # A page fetched ahead may already have failed; retrieve its
+            # exception so it isn't reported as never retrieved
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send REST sub-requests through the WordPress Batch API
+
+        Each request is a dict with ``method``, ``path`` (relative to
+        ``/wp-json``, e.g. ``/wp/v2/posts``) and an optional ``body``. Requests
+        are packed up to 25 per ``/wp-json/batch/v1`` call and the calls are
+        sent with bounded concurrency. Returns one ``{"status", "body"}`` dict
+        per request, in order; a failed batch call fails every item in it.
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def send(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            payload = {"validation": "normal", "requests": chunk}
+            # A batch can be replayed safely only if every sub-request can
+            idempotent = all(
+                is_idempotent(request.get("method", "POST"), request["path"])
+                for request in chunk
+            )
+            async with semaphore:
+                try:
+                    response = await self._request(
+                        "POST",
+                        f"{self.base_url}/wp-json/batch/v1",
+                        json=payload,
+                        idempotent=idempotent,
+                    )
+                    status = response.status
+                    if status in (200, 207):
+                        return [
+                            {"status": item.get("status"), "body": item.get("body")}
+                            for item in response.json()["responses"]
+                        ]
+                    error = f"Batch request failed: {status} - {response.text()}"
+                except Exception as e:
+                    status, error = None, str(e)
+                finally:
+                    for request in chunk:
+                        self._invalidate(f"{self.base_url}/wp-json{request['path']}")
+            failed = {"code": "batch_failed", "message": error}
+            return [{"status": status, "body": failed} for _ in chunk]
+
+        chunks = [
+            requests[start : start + BATCH_MAX_REQUESTS]
+            for start in range(0, len(requests), BATCH_MAX_REQUESTS)
+        ]
+        results = await asyncio.gather(*(send(chunk) for chunk in chunks))
+        return [item for chunk_results in results for item in chunk_results]
+
+    async def create_posts(self, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many posts through the Batch API
+
+        Each post takes the same fields as ``create_post``. Every distinct
+        category and tag name is resolved once up front.
+        """
+        try:
+            await asyncio.gather(
+                *(
+                    self._get_or_create_terms(
+                        taxonomy,
+                        [name for post in posts for name in post.get(taxonomy) or []],
+                    )
+                    for taxonomy in TAXONOMIES
+                )
+            )
+
+            requests = []
+            for post in posts:
+                body = {
+                    "title": post["title"],
+                    "content": post["content"],
+                    "status": post.get("status", "draft"),
+                    "excerpt": post.get("excerpt", ""),
+                    "format": "standard",
+                }
+                for taxonomy in TAXONOMIES:
+                    if post.get(taxonomy):
+                        body[taxonomy] = self._cached_term_ids(taxonomy, post[taxonomy])
+                requests.append(
+                    {"method": "POST", "path": "/wp/v2/posts", "body": body}
+                )
+
+            result = self._bulk_result(await self.batch(requests), 201, "create post")
+            for request, item in zip(requests, result["results"]):
+                if item["success"]:
+                    self._remember_post(item["post"], request["body"])
+            return result
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def update_posts(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Update many posts through the Batch API
+
+        Each update has a ``post_id`` plus any of ``title``, ``content`` and
+        ``status``. As in ``update_post``, unchanged fields are not sent and
+        updates that change nothing are answered without a request.
+        """
+        try:
+            requests = []
+            sent = []
+            results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+            for index, update in enumerate(updates):
+                body = {
+                    field: update[field]
+                    for field in ("title", "content", "status")
+                    if update.get(field)
+                }
+                body, unchanged = self._changed_fields(update["post_id"], body)
+                if unchanged is not None:
+                    results[index] = unchanged
+                    continue
+                sent.append((index, body))
+                requests.append(
+                    {
+                        "method": "POST",
+                        "path": f"/wp/v2/posts/{update['post_id']}",
+                        "body": body,
+                    }
+                )
+
+            responses = await self.batch(requests) if requests else []
+            items = self._bulk_result(responses, 200, "update post")["results"]
+            for (index, body), item in zip(sent, items):
+                if item["success"]:
+                    self._remember_post(item["post"], body)
+                else:
+                    self._forget_post(updates[index]["post_id"])
+                results[index] = item
+
+            return {
+                "success": all(item["success"] for item in results),
+                "succeeded": sum(item["success"] for item in results),
+                "results": results,
             }
 
-            async with self.session.get(
-                f"{self.api_base}/posts", params=params, auth=auth
-            ) as response:
-                if response.status == 200:
-                    posts = await response.json()
-                    return {
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def _bulk_result(
+        responses: List[Dict[str, Any]], expected_status: int, action: str
+    ) -> Dict[str, Any]:
+        """Turn Batch API sub-responses into per-item post results"""
+        items = []
+        for response in responses:
+            body = response["body"] or {}
+            if response["status"] == expected_status:
+                items.append(
+                    {
                         "success": True,
-                        "posts": [
-                            {
-                                "id": post["id"],
-                                "title": post["title"]["rendered"],
-                                "url": post["link"],
-                                "status": post["status"],
-                                "date": post["date"],
-                                "excerpt": post["excerpt"]["rendered"],
-                            }
-                            for post in posts
-                        ],
+                        "post": {
+                            "id": body["id"],
+                            "title": body["title"]["rendered"],
+                            "url": body["link"],
+                            "status": body["status"],
+                        },
                     }
-                else:
-                    return {
+                )
+            else:
+                message = body.get("message", body) if isinstance(body, dict) else body
+                items.append(
+                    {
                         "success": False,
-                        "error": f"Failed to list posts: {response.status}",
+                        "error": f"Failed to {action}: {response['status']} - {message}",
                     }
-
+                )
+        return {
+            "success": all(item["success"] for item in items),
+            "succeeded": sum(item["success"] for item in items),
+            "results": items,
+        }
+
+    async def warm_up(
+        self, connections: int = 4, verify_auth: bool = True, preload_terms: bool = True
+    ) -> Dict[str, Any]:
+        """Get the client ready before the first real request
+
+        Concurrently opens ``connections`` pooled connections (paying DNS,
+        TCP and TLS up front), verifies the credentials once and preloads the
+        term cache. Failures are reported rather than raised. Returns what was
+        done and the time it took in ``elapsed`` seconds.
+        """
+        start = time.perf_counter()
+        await self.open()
+        report: Dict[str, Any] = {"connections": 0, "errors": []}
+
+        async def verify():
+            result = await self.authenticate()
+            report["authenticated"] = result["success"]
+            if not result["success"]:
+                report["errors"].append(result["error"])
+
+        async def preload():
+            try:
+                report["terms"] = await self.preload_terms()
+            except Exception as e:
+                report["errors"].append(f"Could not preload terms: {str(e)}")
+
+        jobs = [self._open_connection(report) for _ in range(connections)]
+        if verify_auth:
+            jobs.append(verify())
+        if preload_terms:
+            jobs.append(preload())
+        await asyncio.gather(*jobs)
+        report["elapsed"] = time.perf_counter() - start
+        return report
+
+    async def _open_connection(self, report: Dict[str, Any]):
+        """Make a cheap HEAD request so that one more connection is pooled"""
+        try:
+            await self.transport.request(
+                "HEAD", self.api_base, headers=await self.auth.headers(self.transport)
+            )
+            report["connections"] += 1
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            report["errors"].append(f"Could not open a connection: {str(e)}")
+
+    async def preload_terms(self) -> Dict[str, int]:
+        """Fill the term cache with every category and tag on the site
+
+        Returns the number of terms cached per taxonomy.
+        """
+        counts = await asyncio.gather(
+            *(self._preload_taxonomy(taxonomy) for taxonomy in TAXONOMIES)
+        )
+        return dict(zip(TAXONOMIES, counts))
+
+    async def _preload_taxonomy(self, taxonomy: str) -> int:
+        """Page through a taxonomy 100 terms at a time and cache name -> id"""
+        url = f"{self.api_base}/{taxonomy}"
+
+        async def fetch_page(page: int):
+            params = {
+                "per_page": 100,
+                "page": page,
+                "hide_empty": "false",
+                **fields_param(TERM_FIELDS),
+            }
+            response = await self._request("GET", url, params=params)
+            response.raise_for_status()
+            return response.json(), response.header_int("X-WP-TotalPages", 1)
+
+        terms, total_pages = await fetch_page(1)
+        if total_pages > 1:
+            pages = await asyncio.gather(
+                *(fetch_page(page) for page in range(2, total_pages + 1))
+            )
+            for page_terms, _ in pages:
+                terms.extend(page_terms)
+
+        for term in terms:
+            self._remember_term(taxonomy, term["name"], term["id"])
+        return len(terms)
+
+    @staticmethod
+    def _term_key(name: str) -> str:
+        """Case-insensitive cache key for a term name"""
+        return name.strip().lower()
+
+    def _remember_term(self, taxonomy: str, name: str, term_id: int):
+        self._term_cache[taxonomy].set(self._term_key(name), term_id)
+
+    async def _get_or_create_terms(self, taxonomy: str, names: List[str]) -> List[int]:
+        """Resolve term names to IDs, creating the terms that don't exist
+
+        Known names are served from the term cache; the rest are looked up by
+        exact slug in one batched request and any still missing are created
+        concurrently. IDs are returned in the order of ``names``.
+        """
+        missing: Dict[str, List[str]] = {}  # slug -> names with that slug
+        for name in names:
+            if self._term_cache[taxonomy].get(self._term_key(name)) is None:
+                missing.setdefault(slugify(name), []).append(name)
+
+        # Names without a slug (e.g. only punctuation) can't be looked up
+        slugs = [slug for slug in missing if slug]
+        if slugs:
+            found = await self._lookup_terms_by_slug(taxonomy, slugs)
+            for slug, term_id in found.items():
+                for name in missing.pop(slug, []):
+                    self._remember_term(taxonomy, name, term_id)
+
+        if missing:
+            await asyncio.gather(
+                *(
+                    self._create_term(taxonomy, name)
+                    for same_slug in missing.values()
+                    for name in same_slug
+                )
+            )
+
+        return self._cached_term_ids(taxonomy, names)
+
+    def _cached_term_ids(self, taxonomy: str, names: List[str]) -> List[int]:
+        """IDs of the cached terms among ``names``, in order and without repeats"""
+        term_ids = []
+        for name in names:
+            term_id = self._term_cache[taxonomy].get(self._term_key(name))
+            if term_id is not None and term_id not in term_ids:
+                term_ids.append(term_id)
+        return term_ids
+
+    async def _lookup_terms_by_slug(
+        self, taxonomy: str, slugs: List[str]
+    ) -> Dict[str, int]:
+        """Fetch existing terms by exact slug, 100 slugs per request"""
+        found: Dict[str, int] = {}
+        for start in range(0, len(slugs), 100):
+            params = [("slug[]", slug) for slug in slugs[start : start + 100]]
+            params.append(("per_page", "100"))
+            params.extend(fields_param(TERM_FIELDS).items())
+            response = await self._request(
+                "GET", f"{self.api_base}/{taxonomy}", params=params
+            )
+            if response.status != 200:
+                continue
+            for term in response.json():
+                found[term["slug"]] = term["id"]
+        return found
+
+    async def _create_term(self, taxonomy: str, name: str) -> Optional[int]:
+        """Create a term and cache its ID
+
+        Concurrent creations of the same term share one request, and a
+        ``term_exists`` rejection resolves to the ID of the existing term.
+        """
+        key = (taxonomy, self._term_key(name))
+        return await self._term_creations.do(
+            key, lambda: self._post_term(taxonomy, name)
+        )
+
+    async def _post_term(self, taxonomy: str, name: str) -> Optional[int]:
+        # Another task may have cached the term since our lookup missed
+        term_id = self._term_cache[taxonomy].get(self._term_key(name))
+        if term_id is not None:
+            return term_id
+
+        # A replayed creation is answered with term_exists, so retrying is safe
+        response = await self._request(
+            "POST",
+            f"{self.api_base}/{taxonomy}",
+            params=fields_param(TERM_FIELDS),
+            json={"name": name},
+            idempotent=True,
+        )
+        if response.status == 201:
+            term_id = response.json()["id"]
+        elif response.status == 400:
+            # {"code": "term_exists", "data": {"status": 400, "term_id": 12}}
+            error = response.json() or {}
+            if error.get("code") != "term_exists":
+                return None
+            term_id = error.get("data", {}).get("term_id")
+        else:
+            return None
+
+        if term_id is not None:
+            self._remember_term(taxonomy, name, term_id)
+        return term_id
 
     async def _get_or_create_categories(self, category_names: List[str]) -> List[int]:
         """Get category IDs or create categories if they don't exist"""
-        category_ids = []
-        auth = aiohttp.BasicAuth(self.username, self.password)
-
-        for name in category_names:
-            # First try to find existing category
-            async with self.session.get(
-                f"{self.api_base}/categories", params={"search": name}, auth=auth
-            ) as response:
-                if response.status == 200:
-                    categories = await response.json()
-                    existing = next(
-                        (
-                            cat
-                            for cat in categories
-                            if cat["name"].lower() == name.lower()
-                        ),
-                        None,
-                    )
-
-                    if existing:
-                        category_ids.append(existing["id"])
-                    else:
-                        # Create new category
-                        async with self.session.post(
-                            f"{self.api_base}/categories",
-                            json={"name": name},
-                            auth=auth,
-                        ) as create_response:
-                            if create_response.status == 201:
-                                new_category = await create_response.json()
-                                category_ids.append(new_category["id"])
-
-        return category_ids
+        return await self._get_or_create_terms("categories", category_names)
 
     async def _get_or_create_tags(self, tag_names: List[str]) -> List[int]:
         """Get tag IDs or create tags if they don't exist"""
-        tag_ids = []
-        auth = aiohttp.BasicAuth(self.username, self.password)
-
-        for name in tag_names:
-            # First try to find existing tag
-            async with self.session.get(
-                f"{self.api_base}/tags", params={"search": name}, auth=auth
-            ) as response:
-                if response.status == 200:
-                    tags = await response.json()
-                    existing = next(
-                        (tag for tag in tags if tag["name"].lower() == name.lower()),
-                        None,
-                    )
+        return await self._get_or_create_terms("tags", tag_names)
 
-                    if existing:
-                        tag_ids.append(existing["id"])
-                    else:
-                        # Create new tag
-                        async with self.session.post(
-                            f"{self.api_base}/tags", json={"name": name}, auth=auth
-                        ) as create_response:
-                            if create_response.status == 201:
-                                new_tag = await create_response.json()
-                                tag_ids.append(new_tag["id"])
 
-        return tag_ids
+@asynccontextmanager
+async def _shared(client: WordPressClient) -> AsyncIterator[WordPressClient]:
+    """Yield a client whose lifetime is managed elsewhere"""
+    yield client
 
 
 class WordPressMCPServer:
@@ -285,11 +1334,54 @@ class WordPressMCPServer:
         username: str = "admin",
         password: str = "admin",
         mcp_port: int = 9001,
+        client_options: Optional[Dict[str, Any]] = None,
+        preload_terms: bool = True,
+        warm_up_connections: int = 4,
+        mirror_path: Optional[str] = None,
+        mirror_sync_interval: float = 60.0,
+        mirror_max_staleness: float = 300.0,
+        sites_file: Optional[str] = None,
+        max_open_sites: int = 16,
+        site_idle_timeout: float = 300.0,
     ):
         self.wordpress_url = wordpress_url
         self.username = username
         self.password = password
         self.mcp_port = mcp_port
+        self.client_options = client_options or {}
+        self.preload_terms = preload_terms
+        self.warm_up_connections = warm_up_connections
+        # Set once startup warm-up has finished; /health reports ready after
+        self.warm_up_report: Optional[Dict[str, Any]] = None
+        # One client (and connection pool) shared by every tool call; it is
+        # opened by run_stdio/run_http and closed when the server shuts down.
+        self.wp_client = WordPressClient(
+            wordpress_url, username, password, **self.client_options
+        )
+        # Optional local copy of the posts that read tools are served from
+        # while it is at most mirror_max_staleness seconds old
+        self.mirror = (
+            PostMirror(mirror_path, self.wp_client, sync_interval=mirror_sync_interval)
+            if mirror_path
+            else None
+        )
+        self.mirror_max_staleness = mirror_max_staleness
+        if self.mirror is not None:
+            self.wp_client.idempotency_store = self.mirror
+        # Further sites from sites_file, whose clients are opened on demand;
+        # the site above is always DEFAULT_SITE and uses wp_client
+        self.sites = (
+            SiteRegistry.load(
+                sites_file, Site(DEFAULT_SITE, wordpress_url, username, password)
+            )
+            if sites_file
+            else None
+        )
+        self.client_pool = ClientPool(
+            self._create_site_client,
+            max_open=max_open_sites,
+            idle_timeout=site_idle_timeout,
+        )
         self.server = Server("wordpress-blog-server")
         self._setup_handlers()
 
@@ -299,7 +1391,7 @@ class WordPressMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List available WordPress tools"""
-            return [
+            tools = [
                 Tool(
                     name="create_blog_post",
                     description="Create a new blog post in WordPress",
@@ -374,6 +1466,34 @@ class WordPressMCPServer:
                     inputSchema={
                         "type": "object",
                         "properties": {
+                            "status": {
+                                "type": "string",
+                                "enum": ["draft", "publish", "private", "any"],
+                                "description": "Filter posts by status",
+                                "default": "any",
+                            },
+                            "per_page": {
+                                "type": "integer",
+                                "description": "Number of posts to retrieve",
+                                "default": 10,
+                                "minimum": 1,
+                                "maximum": 500,
+                            },
+                        },
+                    },
+                ),
+                Tool(
+                    name="search_blog_posts",
+                    description="Full-text search of blog posts (titles, excerpts "
+                    "and content) in the local post mirror, best matches first",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "query": {
+                                "type": "string",
+                                "description": "Words every result must contain; "
+                                "end a word with * to match it as a prefix",
+                            },
                             "status": {
                                 "type": "string",
                                 "enum": ["draft", "publish", "private", "any"],
@@ -388,6 +1508,175 @@ class WordPressMCPServer:
                                 "maximum": 100,
                             },
                         },
+                        "required": ["query"],
+                    },
+                ),
+                Tool(
+                    name="create_blog_posts_bulk",
+                    description="Create many blog posts in WordPress at once "
+                    "using the WordPress Batch API",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "posts": {
+                                "type": "array",
+                                "description": "Posts to create",
+                                "minItems": 1,
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "title": {"type": "string"},
+                                        "content": {"type": "string"},
+                                        "status": {
+                                            "type": "string",
+                                            "enum": ["draft", "publish", "private"],
+                                            "default": "draft",
+                                        },
+                                        "excerpt": {"type": "string", "default": ""},
+                                        "categories": {
+                                            "type": "array",
+                                            "items": {"type": "string"},
+                                            "default": [],
+                                        },
+                                        "tags": {
+                                            "type": "array",
+                                            "items": {"type": "string"},
+                                            "default": [],
+                                        },
+                                    },
+                                    "required": ["title", "content"],
+                                },
+                            },
+                        },
+                        "required": ["posts"],
+                    },
+                ),
+                Tool(
+                    name="update_blog_posts_bulk",
+                    description="Update many existing blog posts in WordPress at "
+                    "once using the WordPress Batch API",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "updates": {
+                                "type": "array",
+                                "description": "Post updates to apply",
+                                "minItems": 1,
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "post_id": {"type": "integer"},
+                                        "title": {"type": "string"},
+                                        "content": {"type": "string"},
+                                        "status": {
+                                            "type": "string",
+                                            "enum": ["draft", "publish", "private"],
+                                        },
+                                    },
+                                    "required": ["post_id"],
+                                },
+                            },
+                        },
+                        "required": ["updates"],
+                    },
+                ),
+                Tool(
+                    name="upload_media",
+                    description="Upload an image or other file to the WordPress "
+                    "media library",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "file_path": {
+                                "type": "string",
+                                "description": "Path of the file to upload, on "
+                                "the machine running this server",
+                            },
+                            "title": {
+                                "type": "string",
+                                "description": "Title of the attachment",
+                            },
+                            "alt_text": {
+                                "type": "string",
+                                "description": "Alternative text for images",
+                            },
+                            "caption": {
+                                "type": "string",
+                                "description": "Caption of the attachment",
+                            },
+                        },
+                        "required": ["file_path"],
+                    },
+                ),
+                Tool(
+                    name="upload_media_directory",
+                    description="Upload every file in a directory to the "
+                    "WordPress media library, skipping files uploaded before",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "directory": {
+                                "type": "string",
+                                "description": "Directory to upload, on the "
+                                "machine running this server",
+                            },
+                            "recursive": {
+                                "type": "boolean",
+                                "description": "Include subdirectories",
+                                "default": True,
+                            },
+                            "concurrency": {
+                                "type": "integer",
+                                "description": "Uploads in flight at once",
+                                "default": 4,
+                                "minimum": 1,
+                                "maximum": 32,
+                            },
+                            "meta_key": {
+                                "type": "string",
+                                "description": "Registered attachment meta "
+                                "field holding each file's SHA-256",
+                            },
+                        },
+                        "required": ["directory"],
+                    },
+                ),
+                Tool(
+                    name="export_posts",
+                    description="Export every post to an NDJSON file (gzipped "
+                    "if the path ends in .gz), optionally with terms, media and "
+                    "revisions",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "path": {
+                                "type": "string",
+                                "description": "File to write, on the machine "
+                                "running this server",
+                            },
+                            "include": {
+                                "type": "array",
+                                "items": {
+                                    "type": "string",
+                                    "enum": list(EXPORT_INCLUDES),
+                                },
+                                "description": "What to export besides posts",
+                                "default": [],
+                            },
+                            "status": {
+                                "type": "string",
+                                "enum": ["publish", "draft", "private", "any"],
+                                "description": "Only export posts with this status",
+                                "default": "any",
+                            },
+                            "modified_after": {
+                                "type": "string",
+                                "description": "Only export posts and media "
+                                "modified after this ISO 8601 date, e.g. the "
+                                "last_modified of the previous export",
+                            },
+                        },
+                        "required": ["path"],
                     },
                 ),
                 Tool(
@@ -396,163 +1685,26 @@ class WordPressMCPServer:
                     inputSchema={"type": "object", "properties": {}},
                 ),
             ]
+            if self.sites is not None:
+                for tool in tools:
+                    tool.inputSchema["properties"]["site"] = {
+                        "type": "string",
+                        "description": "Site to use, by name or URL: "
+                        f"{', '.join(self.sites.names)} (default: {DEFAULT_SITE})",
+                    }
+            return tools
 
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> CallToolResult:
-            """Handle tool calls"""
-
-            if name == "create_blog_post":
-                async with WordPressClient(
-                    self.wordpress_url, self.username, self.password
-                ) as wp_client:
-                    result = await wp_client.create_post(
-                        title=arguments["title"],
-                        content=arguments["content"],
-                        status=arguments.get("status", "draft"),
-                        excerpt=arguments.get("excerpt", ""),
-                        categories=arguments.get("categories", []),
-                        tags=arguments.get("tags", []),
-                    )
-
-                    if result["success"]:
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=f"Successfully created blog post!\n\n"
-                                    f"Title: {result['post']['title']}\n"
-                                    f"ID: {result['post']['id']}\n"
-                                    f"Status: {result['post']['status']}\n"
-                                    f"URL: {result['post']['url']}\n"
-                                    f"Date: {result['post']['date']}",
-                                )
-                            ]
-                        )
-                    else:
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=f"Failed to create blog post: {result['error']}",
-                                )
-                            ],
-                            isError=True,
-                        )
-
-            elif name == "update_blog_post":
-                async with WordPressClient(
-                    self.wordpress_url, self.username, self.password
-                ) as wp_client:
-                    result = await wp_client.update_post(
-                        post_id=arguments["post_id"],
-                        title=arguments.get("title"),
-                        content=arguments.get("content"),
-                        status=arguments.get("status"),
-                    )
-
-                    if result["success"]:
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=f"Successfully updated blog post!\n\n"
-                                    f"Title: {result['post']['title']}\n"
-                                    f"ID: {result['post']['id']}\n"
-                                    f"Status: {result['post']['status']}\n"
-                                    f"URL: {result['post']['url']}",
-                                )
-                            ]
-                        )
-                    else:
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=f"Failed to update blog post: {result['error']}",
-                                )
-                            ],
-                            isError=True,
-                        )
-
-            elif name == "list_blog_posts":
-                async with WordPressClient(
-                    self.wordpress_url, self.username, self.password
-                ) as wp_client:
-                    result = await wp_client.list_posts(
-                        status=arguments.get("status", "any"),
-                        per_page=arguments.get("per_page", 10),
-                    )
-
-                    if result["success"]:
-                        posts_text = "Blog Posts:\n\n"
-                        for post in result["posts"]:
-                            posts_text += (
-                                f"ID: {post['id']}\n"
-                                f"Title: {post['title']}\n"
-                                f"Status: {post['status']}\n"
-                                f"Date: {post['date']}\n"
-                                f"URL: {post['url']}\n"
-                                f"Excerpt: {post['excerpt'][:100]}...\n\n"
-                            )
-
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=posts_text
-                                    if result["posts"]
-                                    else "No posts found.",
-                                )
-                            ]
-                        )
-                    else:
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=f"Failed to list posts: {result['error']}",
-                                )
-                            ],
-                            isError=True,
-                        )
-
-            elif name == "test_wordpress_connection":
-                async with WordPressClient(
-                    self.wordpress_url, self.username, self.password
-                ) as wp_client:
-                    result = await wp_client.authenticate()
-
-                    if result["success"]:
-                        user = result["user"]
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=f"WordPress connection successful!\n\n"
-                                    f"Connected as: {user.get('name', 'Unknown')}\n"
-                                    f"Username: {user.get('username', 'Unknown')}\n"
-                                    f"Email: {user.get('email', 'Unknown')}\n"
-                                    f"Role: {', '.join(user.get('roles', []))}\n"
-                                    f"Site URL: {self.wordpress_url}",
-                                )
-                            ]
-                        )
-                    else:
-                        return CallToolResult(
-                            content=[
-                                TextContent(
-                                    type="text",
-                                    text=f"WordPress connection failed: {result['error']}",
-                                )
-                            ],
-                            isError=True,
-                        )
-
-            else:
+            """Handle tool calls, with the client of the site they name"""
+            try:
+                site_client = self.site_client(arguments.get("site"))
+            except UnknownSiteError as e:
                 return CallToolResult(
-                    content=[TextContent(type="text", text=f"Unknown tool: {name}")],
-                    isError=True,
+                    content=[TextContent(type="text", text=str(e))], isError=True
                 )
+            async with site_client as wp_client:
+                return await self._call_tool(name, arguments, wp_client)
 
         @self.server.list_prompts()
         async def handle_list_prompts() -> List[Prompt]:
@@ -678,32 +1830,507 @@ Make sure to explain mathematical concepts clearly and include practical example
             else:
                 raise ValueError(f"Unknown prompt: {name}")
 
+    async def _call_tool(
+        self, name: str, arguments: dict, wp_client: WordPressClient
+    ) -> CallToolResult:
+        """Run a tool against ``wp_client``"""
+        # The mirror, and what depends on it, only covers the default site
+        default_site = wp_client is self.wp_client
+
+        if name == "create_blog_post":
+            result = await wp_client.create_post(
+                title=arguments["title"],
+                content=arguments["content"],
+                status=arguments.get("status", "draft"),
+                excerpt=arguments.get("excerpt", ""),
+                categories=arguments.get("categories", []),
+                tags=arguments.get("tags", []),
+            )
+
+            if result["success"]:
+                if result.get("duplicate"):
+                    heading = "Blog post already created, returning the original."
+                else:
+                    heading = "Successfully created blog post!"
+                    self._posts_changed(wp_client)
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"{heading}\n\n"
+                            f"Title: {result['post']['title']}\n"
+                            f"ID: {result['post']['id']}\n"
+                            f"Status: {result['post']['status']}\n"
+                            f"URL: {result['post']['url']}\n"
+                            f"Date: {result['post']['date']}",
+                        )
+                    ]
+                )
+            else:
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Failed to create blog post: {result['error']}",
+                        )
+                    ],
+                    isError=True,
+                )
+
+        elif name == "update_blog_post":
+            result = await wp_client.update_post(
+                post_id=arguments["post_id"],
+                title=arguments.get("title"),
+                content=arguments.get("content"),
+                status=arguments.get("status"),
+            )
+
+            if result.get("unchanged"):
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Blog post unchanged, nothing to update.\n\n"
+                            f"Title: {result['post']['title']}\n"
+                            f"ID: {result['post']['id']}\n"
+                            f"Status: {result['post']['status']}\n"
+                            f"URL: {result['post']['url']}",
+                        )
+                    ]
+                )
+            elif result["success"]:
+                self._posts_changed(wp_client)
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Successfully updated blog post!\n\n"
+                            f"Title: {result['post']['title']}\n"
+                            f"ID: {result['post']['id']}\n"
+                            f"Status: {result['post']['status']}\n"
+                            f"URL: {result['post']['url']}",
+                        )
+                    ]
+                )
+            else:
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Failed to update blog post: {result['error']}",
+                        )
+                    ],
+                    isError=True,
+                )
+
+        elif name == "list_blog_posts":
+            reader = wp_client
+            if (
+                default_site
+                and self.mirror is not None
+                and self.mirror.is_fresh(self.mirror_max_staleness)
+            ):
+                reader = self.mirror
+            result = await reader.list_posts(
+                status=arguments.get("status", "any"),
+                per_page=arguments.get("per_page", 10),
+            )
+
+            if result["success"]:
+                posts_text = "Blog Posts:\n\n"
+                for post in result["posts"]:
+                    posts_text += (
+                        f"ID: {post['id']}\n"
+                        f"Title: {post['title']}\n"
+                        f"Status: {post['status']}\n"
+                        f"Date: {post['date']}\n"
+                        f"URL: {post['url']}\n"
+                        f"Excerpt: {post['excerpt'][:100]}...\n\n"
+                    )
+
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=(posts_text if result["posts"] else "No posts found."),
+                        )
+                    ]
+                )
+            else:
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Failed to list posts: {result['error']}",
+                        )
+                    ],
+                    isError=True,
+                )
+
+        elif name == "search_blog_posts":
+            if not default_site or self.mirror is None or self.mirror.last_sync is None:
+                result = {
+                    "success": False,
+                    "error": "search needs a synced post mirror (--mirror-path), "
+                    "which covers the default site only",
+                }
+            else:
+                result = await self.mirror.search(
+                    arguments["query"],
+                    status=arguments.get("status", "any"),
+                    per_page=arguments.get("per_page", 10),
+                )
+
+            if result["success"]:
+                posts_text = f"Search results for '{arguments['query']}':\n\n"
+                for post in result["posts"]:
+                    posts_text += (
+                        f"ID: {post['id']}\n"
+                        f"Title: {post['title']}\n"
+                        f"Status: {post['status']}\n"
+                        f"Date: {post['date']}\n"
+                        f"URL: {post['url']}\n"
+                        f"Match: {post['snippet']}\n\n"
+                    )
+
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=(posts_text if result["posts"] else "No posts found."),
+                        )
+                    ]
+                )
+            else:
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Failed to search posts: {result['error']}",
+                        )
+                    ],
+                    isError=True,
+                )
+
+        elif name == "create_blog_posts_bulk":
+            result = await wp_client.create_posts(arguments["posts"])
+            if result.get("succeeded"):
+                self._posts_changed(wp_client)
+            return self._bulk_tool_result(result, "created")
+
+        elif name == "update_blog_posts_bulk":
+            result = await wp_client.update_posts(arguments["updates"])
+            if result.get("succeeded"):
+                self._posts_changed(wp_client)
+            return self._bulk_tool_result(result, "updated")
+
+        elif name == "upload_media":
+            result = await wp_client.upload_media(
+                os.path.expanduser(arguments["file_path"]),
+                title=arguments.get("title"),
+                alt_text=arguments.get("alt_text"),
+                caption=arguments.get("caption"),
+            )
+
+            if result["success"]:
+                media = result["media"]
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Successfully uploaded media!\n\n"
+                            f"Title: {media['title']}\n"
+                            f"ID: {media['id']}\n"
+                            f"URL: {media['url']}\n"
+                            f"Type: {media['mime_type']}",
+                        )
+                    ]
+                )
+            else:
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Failed to upload media: {result['error']}",
+                        )
+                    ],
+                    isError=True,
+                )
+
+        elif name == "upload_media_directory":
+            uploader = MediaUploader(
+                wp_client,
+                concurrency=arguments.get("concurrency", 4),
+                meta_key=arguments.get("meta_key"),
+                progress=self._progress_reporter(),
+            )
+            result = await uploader.upload_directory(
+                os.path.expanduser(arguments["directory"]),
+                recursive=arguments.get("recursive", True),
+            )
+            return self._upload_tool_result(result)
+
+        elif name == "export_posts":
+            exporter = PostExporter(
+                wp_client,
+                include=arguments.get("include", []),
+                progress=self._progress_reporter(),
+            )
+            result = await exporter.export(
+                os.path.expanduser(arguments["path"]),
+                status=arguments.get("status", "any"),
+                modified_after=arguments.get("modified_after"),
+            )
+            if not result["success"]:
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"Failed to export posts: {result['error']}",
+                        )
+                    ],
+                    isError=True,
+                )
+            return CallToolResult(
+                content=[
+                    TextContent(
+                        type="text",
+                        text=f"Exported {result['posts']} posts to "
+                        f"{result['path']} ({result['bytes']} bytes)\n"
+                        f"Terms: {result['terms']} | Media: {result['media']} | "
+                        f"Revisions: {result['revisions']}\n"
+                        f"Last modified: {result['last_modified'] or 'n/a'}",
+                    )
+                ]
+            )
+
+        elif name == "test_wordpress_connection":
+            result = await wp_client.probe_auth()
+
+            if result["success"]:
+                user = result["user"]
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"WordPress connection successful!\n\n"
+                            f"Connected as: {user.get('name', 'Unknown')}\n"
+                            f"Username: {user.get('username', 'Unknown')}\n"
+                            f"Email: {user.get('email', 'Unknown')}\n"
+                            f"Role: {', '.join(user.get('roles', []))}\n"
+                            f"Site URL: {wp_client.base_url}",
+                        )
+                    ]
+                )
+            else:
+                return CallToolResult(
+                    content=[
+                        TextContent(
+                            type="text",
+                            text=f"WordPress connection failed: {result['error']}",
+                        )
+                    ],
+                    isError=True,
+                )
+
+        else:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"Unknown tool: {name}")],
+                isError=True,
+            )
+
+    def _create_site_client(self, site: Site) -> WordPressClient:
+        return WordPressClient(
+            site.url,
+            site.username,
+            site.password,
+            **{**self.client_options, **site.options},
+        )
+
+    def site_client(self, site: Optional[str] = None):
+        """Async context manager yielding the client for ``site``
+
+        ``None`` and DEFAULT_SITE are the shared ``wp_client``; other sites
+        come from the client pool. Raises UnknownSiteError for sites that
+        aren't registered.
+        """
+        if site is None or site == DEFAULT_SITE:
+            return _shared(self.wp_client)
+        if self.sites is None:
+            raise UnknownSiteError(site)
+        resolved = self.sites.resolve(site)
+        if resolved.name == DEFAULT_SITE:
+            return _shared(self.wp_client)
+        return self.client_pool.use(resolved)
+
+    def _posts_changed(self, wp_client: WordPressClient):
+        """Stop serving reads from the mirror until it has synced the write"""
+        if self.mirror is not None and wp_client is self.wp_client:
+            self.mirror.notify_write()
+
+    @staticmethod
+    def _bulk_tool_result(result: Dict[str, Any], verb: str) -> CallToolResult:
+        """Render a create_posts/update_posts result as one line per post"""
+        if "results" not in result:
+            return CallToolResult(
+                content=[
+                    TextContent(
+                        type="text",
+                        text=f"Bulk request failed: {result['error']}",
+                    )
+                ],
+                isError=True,
+            )
+
+        lines = [
+            f"Successfully {verb} {result['succeeded']} of "
+            f"{len(result['results'])} blog posts.\n"
+        ]
+        for index, item in enumerate(result["results"], start=1):
+            if item["success"]:
+                post = item["post"]
+                lines.append(
+                    f"{index}. ID: {post['id']} | {post['status']} | "
+                    f"{post['title']} | {post['url']}"
+                    + (" | unchanged" if item.get("unchanged") else "")
+                )
+            else:
+                lines.append(f"{index}. {item['error']}")
+
+        return CallToolResult(
+            content=[TextContent(type="text", text="\n".join(lines))],
+            isError=result["succeeded"] == 0,
+        )
+
+    def _progress_reporter(self):
+        """Send MCP progress notifications if the current call asked for them"""
+        try:
+            context = self.server.request_context
+        except LookupError:
+            return None
+        token = context.meta.progressToken if context.meta else None
+        if token is None:
+            return None
+
+        async def report(done: int, total: int):
+            await context.session.send_progress_notification(token, done, total)
+
+        return report
+
+    @staticmethod
+    def _upload_tool_result(result: Dict[str, Any]) -> CallToolResult:
+        """Format a MediaUploader summary as a tool result"""
+        if not result["success"]:
+            return CallToolResult(
+                content=[
+                    TextContent(
+                        type="text",
+                        text=f"Failed to upload media: {result['error']}",
+                    )
+                ],
+                isError=True,
+            )
+
+        lines = [
+            f"Uploaded {result['uploaded']} of {result['total']} files "
+            f"({result['skipped']} already uploaded, {result['failed']} failed).",
+            f"Manifest: {result['manifest']}",
+        ]
+        for error in result["errors"]:
+            lines.append(f"- {error['path']}: {error['error']}")
+        return CallToolResult(
+            content=[TextContent(type="text", text="\n".join(lines))],
+            isError=result["failed"] > 0
+            and result["uploaded"] + result["skipped"] == 0,
+        )
+
+    async def _start_client(self):
+        """Open the shared WordPress client and warm it up
+
+        With ``warm_up_connections`` set, connections are opened and the
+        credentials verified concurrently with the term preload.
+        """
+        report = await self.wp_client.warm_up(
+            connections=self.warm_up_connections,
+            verify_auth=self.warm_up_connections > 0,
+            preload_terms=self.preload_terms,
+        )
+        for error in report["errors"]:
+            logger.warning(f"Warm-up: {error}")
+        logger.info(
+            f"Warm-up finished in {report['elapsed']:.2f}s: "
+            f"{report['connections']} connections opened, "
+            f"terms preloaded: {report.get('terms', 'no')}"
+        )
+        self.warm_up_report = report
+        if self.mirror is not None:
+            await self.mirror.open()
+            self.mirror.start()
+
+    async def _stop_client(self):
+        if self.mirror is not None:
+            await self.mirror.close()
+        await self.client_pool.close()
+        await self.wp_client.close()
+
     async def run_stdio(self):
         """Run server with stdio transport (for Claude Desktop)"""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="wordpress-blog-server",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=None, experimental_capabilities=None
+        try:
+            await self._start_client()
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="wordpress-blog-server",
+                        server_version="1.0.0",
+                        capabilities=self.server.get_capabilities(
+                            notification_options=None, experimental_capabilities=None
+                        ),
                     ),
-                ),
-            )
+                )
+        finally:
+            await self._stop_client()
 
-    async def run_http(self, host: str = "0.0.0.0", port: int = None):
-        """Run server with HTTP transport (for remote access)"""
-        if port is None:
-            port = self.mcp_port
+    def create_http_app(self):
+        """The aiohttp application serving /health and /capabilities
 
+        ``/health`` answers 503 until startup warm-up has finished.
+        """
         from aiohttp import web
 
         app = web.Application()
+        dumps = self.wp_client.codec.dumps
 
         async def health_check(request):
-            return web.json_response({"status": "healthy", "server": "wordpress-mcp"})
+            report = self.warm_up_report
+            if report is None:
+                return web.json_response(
+                    {"status": "starting", "server": "wordpress-mcp"},
+                    status=503,
+                    dumps=dumps,
+                )
+            health = {
+                "status": "healthy",
+                "server": "wordpress-mcp",
+                "warm_up": {
+                    "elapsed": round(report["elapsed"], 3),
+                    "connections": report["connections"],
+                    "authenticated": report.get("authenticated"),
+                    "errors": report["errors"],
+                },
+            }
+            limiter = self.wp_client.limiter
+            if limiter is not None:
+                health["concurrency"] = {
+                    "limit": limiter.limit,
+                    "in_flight": limiter.in_flight,
+                    "queue_depth": limiter.queue_depth,
+                }
+            health["reads"] = self.wp_client.coalescing
+            if self.sites is not None:
+                health["sites"] = self.client_pool.stats
+            return web.json_response(health, dumps=dumps)
 
         async def mcp_capabilities(request):
             capabilities = self.server.get_capabilities(
@@ -716,13 +2343,22 @@ Make sure to explain mathematical concepts clearly and include practical example
                         "name": "wordpress-blog-server",
                         "version": "1.0.0",
                     },
-                }
+                },
+                dumps=dumps,
             )
 
         app.router.add_get("/health", health_check)
         app.router.add_get("/capabilities", mcp_capabilities)
+        return app
+
+    async def run_http(self, host: str = "0.0.0.0", port: int = None):
+        """Run server with HTTP transport (for remote access)"""
+        if port is None:
+            port = self.mcp_port
+
+        from aiohttp import web
 
-        runner = web.AppRunner(app)
+        runner = web.AppRunner(self.create_http_app())
         await runner.setup()
         site = web.TCPSite(runner, host, port)
         await site.start()
@@ -732,8 +2368,10 @@ Make sure to explain mathematical concepts clearly and include practical example
         logger.info(f"Capabilities: http://{host}:{port}/capabilities")
 
         try:
+            await self._start_client()
             await asyncio.Future()  # Run forever
         except KeyboardInterrupt:
             logger.info("Shutting down HTTP server...")
         finally:
             await runner.cleanup()
+            await self._stop_client()
@@ -0,0 +1,209 @@
+"""
+WordPress MCP Server - Multi-site registry and client pool
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from .concurrency import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Name of the site given with --wordpress-url
+DEFAULT_SITE = "default"
+
+
+class UnknownSiteError(KeyError):
+    """A tool named a site that isn't in the registry"""
+
+    def __init__(self, site: str):
+        super().__init__(site)
+        self.site = site
+
+    def __str__(self) -> str:
+        return f"Unknown site: {self.site}"
+
+
+class Site:
+    """One WordPress site: where it is, how to log in, and client overrides"""
+
+    __slots__ = ("name", "url", "username", "password", "options")
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        username: str = "admin",
+        password: str = "admin",
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.url = url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.options = options or {}
+
+    def __repr__(self) -> str:
+        return f"<Site {self.name} {self.url}>"
+
+
+class SiteRegistry:
+    """The sites a server fronts, looked up by name or URL"""
+
+    def __init__(self, sites: List[Site]):
+        self._by_name: Dict[str, Site] = {}
+        self._by_url: Dict[str, Site] = {}
+        for site in sites:
+            if site.name in self._by_name:
+                raise ValueError(f"Duplicate site name: {site.name}")
+            self._by_name[site.name] = site
+            self._by_url.setdefault(site.url, site)
+
+    @classmethod
+    def load(cls, path: str, default: Optional[Site] = None) -> "SiteRegistry":
+        """Read a sites file, plus the ``default`` site if given
+
+        The file is JSON::
+
+            {"sites": {"lab": {"url": "https://lab.example.org",
+                               "username": "editor",
+                               "password_env": "LAB_WP_PASSWORD",
+                               "options": {"pool_limit": 20}}}}
+
+        ``password_env`` names an environment variable holding the password,
+        so the file needn't contain secrets; ``options`` override the
+        ``WordPressClient`` options for that site.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        sites = [default] if default is not None else []
+        for name, entry in data.get("sites", {}).items():
+            password = entry.get("password")
+            if "password_env" in entry:
+                password = os.getenv(entry["password_env"])
+                if password is None:
+                    raise ValueError(
+                        f"Site {name}: environment variable "
+                        f"{entry['password_env']} is not set"
+                    )
+            sites.append(
+                Site(
+                    name,
+                    entry["url"],
+                    entry.get("username", "admin"),
+                    password if password is not None else "admin",
+                    entry.get("options"),
+                )
+            )
+        return cls(sites)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __iter__(self):
+        return iter(self._by_name.values())
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._by_name)
+
+    def resolve(self, site: str) -> Site:
+        """The site called ``site``, or registered at that URL"""
+        found = self._by_name.get(site) or self._by_url.get(site.rstrip("/"))
+        if found is None:
+            raise UnknownSiteError(site)
+        return found
+
+
+class ClientPool:
+    """Open clients for the sites in use, least recently used closed first
+
+    ``factory`` builds the client for a site; it is opened on first use and
+    kept open for later calls. Each site has its own client, so its own
+    connection pool, limits and caches. When more than ``max_open`` clients
+    are open, or a client has been idle for ``idle_timeout`` seconds, the
+    least recently used idle clients are closed. Clients in use are never
+    closed from under a call.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Site], Any],
+        max_open: int = 16,
+        idle_timeout: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.factory = factory
+        self.max_open = max_open
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        # site name -> client, least recently used first
+        self._clients: "OrderedDict[str, Any]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        self._in_use: Dict[str, int] = {}
+        self._opening = SingleFlight()
+        self.opened = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": list(self._clients),
+            "opened": self.opened,
+            "evicted": self.evicted,
+        }
+
+    @asynccontextmanager
+    async def use(self, site: Site) -> AsyncIterator[Any]:
+        """The open client for ``site``, held open while the block runs"""
+        self._in_use[site.name] = self._in_use.get(site.name, 0) + 1
+        try:
+            client = self._clients.get(site.name)
+            if client is None:
+                client = await self._opening.do(site.name, lambda: self._open(site))
+            self._clients.move_to_end(site.name)
+            yield client
+        finally:
+            self._in_use[site.name] -= 1
+            if not self._in_use[site.name]:
+                del self._in_use[site.name]
+            self._last_used[site.name] = self._clock()
+            await self._evict()
+
+    async def _open(self, site: Site):
+        client = self.factory(site)
+        await client.open()
+        self._clients[site.name] = client
+        self.opened += 1
+        logger.info(f"Opened client for site {site.name} ({site.url})")
+        return client
+
+    async def _evict(self):
+        now = self._clock()
+        idle = [name for name in self._clients if name not in self._in_use]
+        excess = len(self._clients) - self.max_open
+        closing = []
+        for name in idle:
+            if excess > 0 or now - self._last_used.get(name, now) >= self.idle_timeout:
+                closing.append(self._clients.pop(name))
+                self._last_used.pop(name, None)
+                excess -= 1
+                self.evicted += 1
+                logger.info(f"Closed idle client for site {name}")
+        if closing:
+            await asyncio.gather(*(client.close() for client in closing))
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._last_used.clear()
+        await asyncio.gather(*(client.close() for client in clients))
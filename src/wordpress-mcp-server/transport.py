@@ -0,0 +1,335 @@
+"""
+WordPress MCP Server - HTTP transport primitives
+"""
+
+import asyncio
+import ipaddress
+import json
+import socket
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+
+from .codec import JSONCodec
+
+# Backends WordPressClient can send requests with, see create_transport()
+HTTP_BACKENDS = ("aiohttp", "httpx")
+
+
+# Prefix of a --connect-to value naming a Unix domain socket
+UNIX_SOCKET_PREFIX = "unix:"
+
+
+class ConnectionNotEstablished(aiohttp.ClientConnectionError):
+    """No connection could be made, so the request was certainly not sent"""
+
+
+class StaticResolver(AbstractResolver):
+    """Resolves every host name to one fixed address, without DNS
+
+    The URL is left alone, so requests still carry its Host header (and TLS
+    server name) while connecting to ``host``, e.g. a co-located container.
+    """
+
+    def __init__(self, host: str, port: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.family = (
+            socket.AF_INET6
+            if ipaddress.ip_address(host).version == 6
+            else socket.AF_INET
+        )
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_INET
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "hostname": host,
+                "host": self.host,
+                "port": self.port or port,
+                "family": self.family,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST,
+            }
+        ]
+
+    async def close(self):
+        pass
+
+
+def parse_connect_to(
+    value: Optional[str],
+) -> Tuple[Optional[str], Optional[StaticResolver]]:
+    """Split a --connect-to value into (Unix socket path, fixed resolver)
+
+    ``unix:/run/wordpress.sock`` connects over a Unix domain socket;
+    ``ADDRESS[:PORT]`` (``[ADDRESS]:PORT`` for IPv6) connects to a fixed IP
+    address; an empty value connects to wherever the URL's host resolves.
+    """
+    if not value:
+        return None, None
+    if value.startswith(UNIX_SOCKET_PREFIX):
+        path = value[len(UNIX_SOCKET_PREFIX) :]
+        if not path:
+            raise ValueError("connect-to needs a socket path after unix:")
+        return path, None
+    host, port = value, ""
+    if value.startswith("["):
+        host, _, port = value[1:].partition("]")
+        port = port[1:] if port.startswith(":") else port
+    elif value.count(":") == 1:
+        host, port = value.split(":")
+    try:
+        return None, StaticResolver(host, int(port) if port else None)
+    except ValueError:
+        raise ValueError(
+            f"connect-to must be unix:PATH or IP[:PORT], not {value!r}"
+        ) from None
+
+
+class WordPressAPIError(Exception):
+    """A WordPress REST API request returned an unexpected status"""
+
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(f"{status} - {message}" if message else str(status))
+        self.status = status
+        self.message = message
+
+
+class Response:
+    """A WordPress response whose body has been read in full
+
+    Responses are buffered so they can be cached, shared between concurrent
+    callers and decoded after the connection has gone back to the pool.
+    ``loads`` is the JSON decoder of the client's codec.
+    """
+
+    __slots__ = ("status", "headers", "body", "url", "from_cache", "loads")
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        url: str = "",
+        from_cache: bool = False,
+        loads: Callable[[Union[str, bytes]], Any] = json.loads,
+    ):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+        self.from_cache = from_cache
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"<Response [{self.status}] {self.url}>"
+
+    def json(self) -> Any:
+        """Decode the JSON body; an empty body decodes to ``None``"""
+        return self.loads(self.body) if self.body else None
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def header_int(self, name: str, default: int = 0) -> int:
+        """An integer response header such as ``X-WP-TotalPages``"""
+        try:
+            return int(self.headers.get(name, default))
+        except (TypeError, ValueError):
+            return default
+
+    def raise_for_status(self, expected: Optional[int] = None):
+        """Raise WordPressAPIError unless the status is ``expected`` (or 2xx)"""
+        ok = self.status == expected if expected else 200 <= self.status < 300
+        if not ok:
+            raise WordPressAPIError(self.status, self.text())
+
+
+class AiohttpTransport:
+    """HTTP/1.1 over a pooled aiohttp connector, one request per connection
+
+    ``connector_factory`` builds the connector when the transport is opened.
+    """
+
+    name = "aiohttp"
+
+    def __init__(
+        self,
+        connector_factory: Callable[[], aiohttp.BaseConnector],
+        codec: Any = None,
+        timeout: float = 300.0,
+    ):
+        self.connector_factory = connector_factory
+        self.codec = codec or JSONCodec()
+        self.timeout = timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def closed(self) -> bool:
+        return self.session is None or self.session.closed
+
+    async def open(self):
+        if self.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self.connector_factory(),
+                json_serialize=self.codec.dumps,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        json: Any = None,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """Send a request and read the whole response
+
+        ``data`` is bytes or an (async) iterable of byte chunks.
+        """
+        async with self.session.request(
+            method, url, params=params, json=json, data=data, headers=headers
+        ) as response:
+            return Response(
+                response.status,
+                response.headers,
+                await response.read(),
+                str(response.url),
+                loads=self.codec.loads,
+            )
+
+
+class HTTPXTransport:
+    """HTTP/2 through httpx, multiplexing concurrent requests per connection
+
+    Needs ``httpx`` with the ``h2`` extra (``pip install
+    wordpress-mcp-server[http2]``). Servers that don't negotiate HTTP/2 over
+    TLS get HTTP/1.1; ``http2_prior_knowledge`` speaks HTTP/2 to plain-text
+    ``http://`` servers known to support it. httpx errors are re-raised as the
+    aiohttp exceptions the retry policy understands.
+    """
+
+    name = "httpx"
+
+    def __init__(
+        self,
+        codec: Any = None,
+        max_connections: Optional[int] = 100,
+        keepalive_expiry: float = 30.0,
+        http2_prior_knowledge: bool = False,
+        timeout: float = 300.0,
+        unix_socket: Optional[str] = None,
+    ):
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError:
+            raise ValueError(
+                "The httpx backend needs httpx and h2: "
+                "pip install wordpress-mcp-server[http2]"
+            ) from None
+        self._httpx = httpx
+        self.codec = codec or JSONCodec()
+        self.limits = httpx.Limits(
+            max_connections=max_connections or None,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2_prior_knowledge = http2_prior_knowledge
+        self.timeout = timeout
+        self.unix_socket = unix_socket
+        self.session = None
+
+    @property
+    def closed(self) -> bool:
+        return self.session is None or self.session.is_closed
+
+    async def open(self):
+        if self.closed:
+            self.session = self._httpx.AsyncClient(
+                transport=self._httpx.AsyncHTTPTransport(
+                    http1=not self.http2_prior_knowledge,
+                    http2=True,
+                    limits=self.limits,
+                    uds=self.unix_socket,
+                ),
+                timeout=self.timeout,
+            )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.aclose()
+            self.session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        json: Any = None,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        headers = dict(headers or {})
+        if json is not None:
+            data = self.codec.dumps_bytes(json)
+            headers.setdefault("Content-Type", "application/json")
+        httpx = self._httpx
+        try:
+            response = await self.session.request(
+                method, url, params=params, content=data, headers=headers
+            )
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except httpx.ConnectError as e:
+            raise ConnectionNotEstablished(str(e)) from e
+        except httpx.TransportError as e:
+            raise aiohttp.ClientConnectionError(str(e)) from e
+        return Response(
+            response.status_code,
+            response.headers,
+            response.content,
+            str(response.url),
+            loads=self.codec.loads,
+        )
+
+
+def create_transport(
+    backend: str,
+    connector_factory: Callable[[], aiohttp.BaseConnector],
+    codec: Any = None,
+    max_connections: Optional[int] = 100,
+    keepalive_timeout: float = 30.0,
+    http2_prior_knowledge: bool = False,
+    connect_to: Optional[str] = None,
+):
+    """Build the transport for ``backend`` (one of HTTP_BACKENDS)
+
+    The aiohttp transport connects wherever ``connector_factory``'s connector
+    does; the httpx one follows ``connect_to`` itself, but only to a socket.
+    """
+    if backend == "aiohttp":
+        return AiohttpTransport(connector_factory, codec)
+    if backend == "httpx":
+        unix_socket, resolver = parse_connect_to(connect_to)
+        if resolver is not None:
+            raise ValueError(
+                "The httpx backend can only connect to a fixed unix: socket"
+            )
+        return HTTPXTransport(
+            codec,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_timeout,
+            http2_prior_knowledge=http2_prior_knowledge,
+            unix_socket=unix_socket,
+        )
+    raise ValueError(f"Unknown HTTP backend: {backend}")
@@ -0,0 +1,296 @@
+"""
+WordPress MCP Server - Bulk media uploads with resume
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .concurrency import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Manifest written next to the uploaded files unless told otherwise
+MANIFEST_NAME = ".wp-media-manifest.json"
+
+HASH_CHUNK_SIZE = 1 << 20
+
+# progress(done, total) after each file is uploaded, skipped or fails
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+def sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def walk_files(directory: str, recursive: bool = True) -> List[str]:
+    """Regular files under ``directory`` in a stable order, skipping dotfiles"""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".")) if recursive else []
+        found.extend(
+            os.path.join(root, name)
+            for name in sorted(files)
+            if not name.startswith(".")
+        )
+    return found
+
+
+class UploadManifest:
+    """Files already in the media library, by relative path and SHA-256
+
+    Saved as JSON so an interrupted run can resume::
+
+        {"version": 1, "files": {"2024/cat.jpg": {"sha256": "...", "size": 1,
+         "mtime": 1.0, "media_id": 12, "url": "https://..."}}}
+
+    Size and mtime let unchanged files skip re-hashing on the next run.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, files: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.path = path
+        self.files = files or {}
+        self._by_hash = {entry["sha256"]: entry for entry in self.files.values()}
+
+    @classmethod
+    def load(cls, path: str) -> "UploadManifest":
+        """Read the manifest at ``path``; a missing file is an empty manifest"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        return cls(path, data.get("files", {}))
+
+    def known_hash(self, name: str, size: int, mtime: float) -> Optional[str]:
+        """The recorded hash of ``name`` if the file looks unchanged"""
+        entry = self.files.get(name)
+        if entry and entry["size"] == size and entry["mtime"] == mtime:
+            return entry["sha256"]
+        return None
+
+    def find(self, digest: str) -> Optional[Dict[str, Any]]:
+        """The upload of a file with this content, under any name"""
+        return self._by_hash.get(digest)
+
+    def record(
+        self, name: str, digest: str, size: int, mtime: float, media_id: int, url: str
+    ):
+        entry = {
+            "sha256": digest,
+            "size": size,
+            "mtime": mtime,
+            "media_id": media_id,
+            "url": url,
+        }
+        self.files[name] = entry
+        self._by_hash.setdefault(digest, entry)
+
+    def dumps(self) -> str:
+        return json.dumps({"version": self.VERSION, "files": self.files}, indent=1)
+
+    def write(self, text: str):
+        """Atomically replace the manifest file with ``text``"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, self.path)
+
+
+class MediaUploader:
+    """Upload a directory tree to the media library, skipping what's there
+
+    Files are hashed in a thread pool and compared with the manifest (and,
+    with ``meta_key``, with the hashes stored in that attachment meta field,
+    which must be registered for the REST API). New files are uploaded
+    through ``WordPressClient.upload_media`` by ``concurrency`` workers; files
+    with the same content are uploaded once. The manifest is checkpointed
+    every ``checkpoint_every`` uploads and when the run ends or is cancelled.
+    """
+
+    def __init__(
+        self,
+        client,
+        concurrency: int = 4,
+        hash_workers: int = 4,
+        meta_key: Optional[str] = None,
+        checkpoint_every: int = 10,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.hash_workers = hash_workers
+        self.meta_key = meta_key
+        self.checkpoint_every = checkpoint_every
+        self.progress = progress
+
+    async def upload_directory(
+        self,
+        directory: str,
+        recursive: bool = True,
+        manifest_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Upload new files under ``directory`` and return a summary"""
+        try:
+            return await self._upload_directory(directory, recursive, manifest_path)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def _upload_directory(
+        self, directory: str, recursive: bool, manifest_path: Optional[str]
+    ) -> Dict[str, Any]:
+        if not os.path.isdir(directory):
+            raise ValueError(f"Not a directory: {directory}")
+        loop = asyncio.get_running_loop()
+        manifest_path = manifest_path or os.path.join(directory, MANIFEST_NAME)
+        manifest = await loop.run_in_executor(None, UploadManifest.load, manifest_path)
+        paths = await loop.run_in_executor(None, walk_files, directory, recursive)
+        paths = [
+            p for p in paths if os.path.abspath(p) != os.path.abspath(manifest_path)
+        ]
+        remote = await self._remote_hashes() if self.meta_key else {}
+
+        summary = {"total": len(paths), "uploaded": 0, "skipped": 0, "failed": 0}
+        errors: List[Dict[str, str]] = []
+        pending_paths: "asyncio.Queue[str]" = asyncio.Queue()
+        for path in paths:
+            pending_paths.put_nowait(path)
+        # Bounded so hashing runs at most a window ahead of uploading
+        to_upload: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self.concurrency * 2)
+        uploads = SingleFlight()
+        save_lock = asyncio.Lock()
+        unsaved = 0
+
+        async def checkpoint():
+            nonlocal unsaved
+            async with save_lock:
+                unsaved = 0
+                await loop.run_in_executor(None, manifest.write, manifest.dumps())
+
+        async def finish(outcome: str):
+            nonlocal unsaved
+            summary[outcome] += 1
+            if outcome == "uploaded":
+                unsaved += 1
+                if unsaved >= self.checkpoint_every:
+                    await checkpoint()
+            if self.progress is not None:
+                done = summary["uploaded"] + summary["skipped"] + summary["failed"]
+                await self.progress(done, summary["total"])
+
+        def fail(name: str, error: str):
+            logger.warning(f"Could not upload {name}: {error}")
+            errors.append({"path": name, "error": error})
+
+        async def hash_files(executor: ThreadPoolExecutor):
+            while not pending_paths.empty():
+                path = pending_paths.get_nowait()
+                name = os.path.relpath(path, directory)
+                try:
+                    stat = os.stat(path)
+                    digest = manifest.known_hash(
+                        name, stat.st_size, stat.st_mtime
+                    ) or await loop.run_in_executor(executor, sha256_file, path)
+                except OSError as e:
+                    fail(name, str(e))
+                    await finish("failed")
+                    continue
+                uploaded = manifest.find(digest) or remote.get(digest)
+                if uploaded is not None:
+                    manifest.record(
+                        name,
+                        digest,
+                        stat.st_size,
+                        stat.st_mtime,
+                        uploaded["media_id"],
+                        uploaded["url"],
+                    )
+                    await finish("skipped")
+                else:
+                    await to_upload.put((path, name, digest, stat))
+
+        async def upload_files():
+            while True:
+                item = await to_upload.get()
+                if item is None:
+                    return
+                path, name, digest, stat = item
+                # A file with the same content may have finished uploading
+                # after this one was queued
+                uploaded = manifest.find(digest)
+                if uploaded is not None:
+                    manifest.record(
+                        name,
+                        digest,
+                        stat.st_size,
+                        stat.st_mtime,
+                        uploaded["media_id"],
+                        uploaded["url"],
+                    )
+                    await finish("skipped")
+                    continue
+                meta = {self.meta_key: digest} if self.meta_key else None
+                result = await uploads.do(
+                    digest, lambda: self.client.upload_media(path, meta=meta)
+                )
+                if not result["success"]:
+                    fail(name, result["error"])
+                    await finish("failed")
+                    continue
+                # Another file with the same content may have shared this upload
+                duplicate = manifest.find(digest) is not None
+                media = result["media"]
+                manifest.record(
+                    name, digest, stat.st_size, stat.st_mtime, media["id"], media["url"]
+                )
+                await finish("skipped" if duplicate else "uploaded")
+
+        executor = ThreadPoolExecutor(max_workers=self.hash_workers)
+        uploaders = [
+            asyncio.ensure_future(upload_files()) for _ in range(self.concurrency)
+        ]
+        try:
+            await asyncio.gather(
+                *(hash_files(executor) for _ in range(self.hash_workers))
+            )
+            for _ in uploaders:
+                await to_upload.put(None)
+            await asyncio.gather(*uploaders)
+        finally:
+            for task in uploaders:
+                task.cancel()
+            executor.shutdown(wait=False)
+            # Checkpoint whatever finished, even if the run was interrupted
+            await asyncio.shield(checkpoint())
+
+        return {
+            "success": True,
+            **summary,
+            "errors": errors,
+            "manifest": manifest_path,
+        }
+
+    async def _remote_hashes(self) -> Dict[str, Dict[str, Any]]:
+        """Hashes recorded in attachment meta, mapped to their uploads"""
+        found = {}
+        fields = ("id", "source_url", "meta")
+        async for page in self.client.iter_pages("media", fields=fields):
+            for media in page:
+                meta = media.get("meta")
+                digest = meta.get(self.meta_key) if isinstance(meta, dict) else None
+                if digest:
+                    found[digest] = {
+                        "media_id": media["id"],
+                        "url": media["source_url"],
+                    }
+        return found
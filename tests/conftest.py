@@ -0,0 +1,22 @@
+import pytest
+
+
+class FakeClock:
+    """A clock that only moves when a test sets or advances ``now``"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock_start():
+    """Time the ``clock`` fixture starts at; override it to start elsewhere"""
+    return 0.0
+
+
+@pytest.fixture
+def clock(clock_start):
+    return FakeClock(clock_start)
@@ -0,0 +1,218 @@
+import asyncio
+import base64
+import json
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from wordpress_mcp_server.auth import (
+    ApplicationPasswordAuth,
+    AuthProbeCache,
+    BasicAuth,
+    JWTAuth,
+    create_auth,
+    credential_fingerprint,
+    token_expiry,
+)
+from wordpress_mcp_server.transport import AiohttpTransport, WordPressAPIError
+
+TOKEN_URL = "http://wp.test/wp-json/jwt-auth/v1/token"
+
+
+def make_token(exp=None) -> str:
+    claims = {"iss": "http://wp.test"} if exp is None else {"exp": exp}
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+@pytest.fixture
+def clock_start():
+    return 1000.0
+
+
+@pytest.fixture
+def mock_wp():
+    with aioresponses() as mocked:
+        yield mocked
+
+
+@pytest.fixture
+async def transport():
+    transport = AiohttpTransport(aiohttp.TCPConnector)
+    await transport.open()
+    yield transport
+    await transport.close()
+
+
+class TestBasicAuth:
+    """Test cases for precomputed Basic credentials."""
+
+    async def test_header_is_encoded_once(self, transport):
+        auth = BasicAuth("admin", "secret")
+
+        first = await auth.headers(transport)
+        assert first["Authorization"] == "Basic YWRtaW46c2VjcmV0"
+        assert await auth.headers(transport) is first
+        assert not auth.invalidate()
+
+    async def test_application_password_spaces_are_ignored(self, transport):
+        auth = ApplicationPasswordAuth("admin", "abcd EFGH ijkl")
+        expected = aiohttp.BasicAuth("admin", "abcdEFGHijkl").encode()
+
+        assert (await auth.headers(transport))["Authorization"] == expected
+
+
+class TestJWTAuth:
+    """Test cases for cached, refreshed JWT bearer tokens."""
+
+    def test_token_expiry(self):
+        assert token_expiry(make_token(exp=2000)) == 2000
+        assert token_expiry(make_token()) is None
+        assert token_expiry("not-a-jwt") is None
+
+    async def test_token_is_cached_until_refresh_margin(
+        self, mock_wp, transport, clock
+    ):
+        token = make_token(exp=2000)
+        mock_wp.post(TOKEN_URL, payload={"token": token})
+        auth = JWTAuth(TOKEN_URL, "admin", "secret", refresh_margin=60, clock=clock)
+
+        headers = await auth.headers(transport)
+        clock.now = 1900
+        assert await auth.headers(transport) is headers
+
+        assert headers == {"Authorization": f"Bearer {token}"}
+        assert auth.refreshes == 1
+        (call,) = list(mock_wp.requests.values())[0]
+        assert call.kwargs["json"] == {"username": "admin", "password": "secret"}
+
+    async def test_token_is_refreshed_in_background_near_expiry(
+        self, mock_wp, transport, clock
+    ):
+        old, new = make_token(exp=2000), make_token(exp=5000)
+        mock_wp.post(TOKEN_URL, payload={"token": old})
+        mock_wp.post(TOKEN_URL, payload={"token": new})
+        auth = JWTAuth(TOKEN_URL, "admin", "secret", refresh_margin=60, clock=clock)
+        await auth.headers(transport)
+
+        clock.now = 1950
+        assert (await auth.headers(transport))["Authorization"] == f"Bearer {old}"
+        await auth._background
+
+        assert (await auth.headers(transport))["Authorization"] == f"Bearer {new}"
+        assert auth.refreshes == 2
+
+    async def test_expired_token_is_replaced_before_use(
+        self, mock_wp, transport, clock
+    ):
+        mock_wp.post(TOKEN_URL, payload={"token": make_token()}, repeat=True)
+        auth = JWTAuth(TOKEN_URL, "admin", "secret", default_ttl=300, clock=clock)
+        await auth.headers(transport)
+
+        clock.now += 300
+        await auth.headers(transport)
+        assert auth.refreshes == 2
+
+    async def test_rejected_credentials_raise(self, mock_wp, transport):
+        mock_wp.post(TOKEN_URL, status=403, body="jwt_auth_failed")
+        auth = JWTAuth(TOKEN_URL, "admin", "wrong")
+
+        with pytest.raises(WordPressAPIError, match="403"):
+            await auth.headers(transport)
+
+
+class TestCreateAuth:
+    """Test cases for choosing an auth provider."""
+
+    def test_jwt_defaults_to_plugin_endpoint(self):
+        auth = create_auth("jwt", "http://wp.test", "admin", "secret")
+
+        assert isinstance(auth, JWTAuth)
+        assert auth.token_url == TOKEN_URL
+
+    def test_unknown_method_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown auth method"):
+            create_auth("oauth", "http://wp.test", "admin", "secret")
+
+
+class FakeCheck:
+    """Counts authentication checks and answers with the given outcome."""
+
+    def __init__(self):
+        self.calls = 0
+        self.success = True
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.success:
+            return {"success": True, "user": {"id": 1}}
+        return {"success": False, "error": "Authentication failed: 401"}
+
+
+class TestAuthProbeCache:
+    """Test cases for the AuthProbeCache class."""
+
+    @pytest.fixture
+    def probes(self, clock):
+        return AuthProbeCache(clock=clock)
+
+    def test_fingerprint_hides_and_distinguishes_credentials(self):
+        fingerprint = credential_fingerprint("basic", "admin", "secret")
+        assert "secret" not in fingerprint
+        assert fingerprint == credential_fingerprint("basic", "admin", "secret")
+        assert fingerprint != credential_fingerprint("basic", "admin", "other")
+
+    async def test_success_is_cached_for_ttl(self, probes, clock):
+        check = FakeCheck()
+
+        first = await probes.get("site", check, ttl=60)
+        second = await probes.get("site", check, ttl=60)
+        clock.now += 61
+        third = await probes.get("site", check, ttl=60)
+
+        assert "cached" not in first
+        assert second == {**first, "cached": True}
+        assert "cached" not in third
+        assert check.calls == 2
+
+    async def test_failure_is_cached_briefly(self, probes, clock):
+        check = FakeCheck()
+        check.success = False
+
+        await probes.get("site", check, ttl=60, negative_ttl=5)
+        assert (await probes.get("site", check, ttl=60, negative_ttl=5))["cached"]
+        clock.now += 5
+        check.success = True
+        assert (await probes.get("site", check, ttl=60, negative_ttl=5))["success"]
+        assert check.calls == 2
+
+    async def test_refreshes_in_background_near_expiry(self, probes, clock):
+        check = FakeCheck()
+        await probes.get("site", check, ttl=60, refresh_margin=15)
+
+        clock.now += 50
+        check.success = False
+        result = await probes.get("site", check, ttl=60, refresh_margin=15)
+        assert result["success"] and result["cached"]
+        await asyncio.sleep(0.01)
+
+        # The refresh caught the credential change before the TTL ran out
+        assert check.calls == 2
+        assert not (await probes.get("site", check, ttl=60))["success"]
+
+    async def test_concurrent_checks_share_one_call(self, probes):
+        check = FakeCheck()
+
+        results = await asyncio.gather(*(probes.get("site", check) for _ in range(3)))
+
+        assert all(result["success"] for result in results)
+        assert check.calls == 1
+
+    async def test_invalidate(self, probes):
+        check = FakeCheck()
+        await probes.get("site", check)
+        probes.invalidate("site")
+        await probes.get("site", check)
+        assert check.calls == 2
@@ -0,0 +1,69 @@
+import pytest
+
+from wordpress_mcp_server.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for the TTLCache class."""
+
+    def test_get_and_set(self):
+        cache = TTLCache(maxsize=4)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", 0) == 0
+        assert "a" in cache
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+        cache.set("short", 1, ttl=1)
+        cache.set("long", 2)
+
+        clock.now = 5
+        assert "short" not in cache
+        assert cache.get("long") == 2
+
+    def test_expire_drops_expired_entries(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=20)
+
+        clock.now = 10
+        assert cache.expire() == 1
+        assert list(cache) == ["b"]
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(maxsize=4)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a", "gone") == "gone"
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_maxsize_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
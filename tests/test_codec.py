@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from wordpress_mcp_server import codec
+from wordpress_mcp_server.codec import JSONCodec, OrjsonCodec, get_codec
+from wordpress_mcp_server.transport import Response
+
+DOCUMENT = {"id": 1, "title": {"rendered": "Café ☕"}, "tags": [1, 2], "sticky": False}
+
+
+class TestCodecs:
+    """Test cases for the JSON codecs."""
+
+    @pytest.fixture(params=["json", "orjson"])
+    def json_codec(self, request):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        return get_codec(request.param)
+
+    def test_round_trip(self, json_codec):
+        assert json_codec.loads(json_codec.dumps(DOCUMENT)) == DOCUMENT
+        assert json_codec.loads(json_codec.dumps_bytes(DOCUMENT)) == DOCUMENT
+
+    def test_output_is_compatible_with_stdlib(self, json_codec):
+        assert isinstance(json_codec.dumps(DOCUMENT), str)
+        assert json.loads(json_codec.dumps_bytes(DOCUMENT)) == DOCUMENT
+
+    def test_response_decodes_with_codec(self, json_codec):
+        response = Response(200, {}, json_codec.dumps_bytes(DOCUMENT))
+        response.loads = json_codec.loads
+
+        assert response.json() == DOCUMENT
+
+    def test_auto_prefers_orjson(self, monkeypatch):
+        monkeypatch.setattr(codec, "orjson", object())
+        assert isinstance(get_codec("auto"), OrjsonCodec)
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        monkeypatch.setattr(codec, "orjson", None)
+        assert type(get_codec()) is JSONCodec
+
+    def test_missing_orjson_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(codec, "orjson", None)
+        with pytest.raises(ValueError, match="requires the orjson package"):
+            get_codec("orjson")
+
+    def test_unknown_codec_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_codec("yaml")
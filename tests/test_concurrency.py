@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from wordpress_mcp_server.concurrency import AdaptiveLimiter, SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for the SingleFlight class."""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        started = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal started
+            started += 1
+            await release.wait()
+            return "done"
+
+        callers = [asyncio.ensure_future(flight.do("key", work)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*callers) == ["done"] * 5
+        assert started == 1
+        assert flight.calls == 1
+        assert flight.coalesced == 4
+        assert len(flight) == 0
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def work(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: work(1)), flight.do("b", lambda: work(2))
+        )
+
+        assert results == [1, 2]
+        assert flight.coalesced == 0
+
+    async def test_errors_are_shared_and_key_is_released(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def succeed():
+            return "ok"
+
+        assert await flight.do("key", succeed) == "ok"
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestAdaptiveLimiter:
+    """Test cases for the AdaptiveLimiter class."""
+
+    async def test_requests_over_the_limit_queue(self):
+        limiter = AdaptiveLimiter(initial_limit=2)
+        tokens = [await limiter.acquire() for _ in range(2)]
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert limiter.in_flight == 2
+        assert limiter.queue_depth == 1
+        assert not waiter.done()
+
+        limiter.release(tokens[0])
+        await waiter
+        assert limiter.in_flight == 2
+        assert limiter.queue_depth == 0
+
+    async def test_success_grows_limit_additively(self):
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=3)
+        # 2 -> 2.5 -> 2.9 -> 3.24, capped at 3
+        for _ in range(3):
+            limiter.release(await limiter.acquire(), overloaded=False)
+        assert limiter.limit == 3
+
+        for _ in range(10):
+            limiter.release(await limiter.acquire(), overloaded=False)
+        assert limiter.limit == 3
+
+    async def test_overload_shrinks_limit_once_per_window(self):
+        limiter = AdaptiveLimiter(initial_limit=8, min_limit=1)
+        tokens = [await limiter.acquire() for _ in range(8)]
+
+        for token in tokens:
+            limiter.release(token, overloaded=True)
+        assert limiter.limit == 4
+
+        limiter.release(await limiter.acquire(), overloaded=True)
+        assert limiter.limit == 2
+        for _ in range(5):
+            limiter.release(await limiter.acquire(), overloaded=True)
+        assert limiter.limit == 1
+
+    async def test_unknown_outcome_keeps_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=4)
+        limiter.release(await limiter.acquire())
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = AdaptiveLimiter(initial_limit=1)
+        token = await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.queue_depth == 0
+
+        limiter.release(token)
+        assert limiter.in_flight == 0
+
+    def test_limits_are_validated(self):
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=10, max_limit=5)
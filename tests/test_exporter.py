@@ -0,0 +1,198 @@
+import gzip
+import json
+import re
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from wordpress_mcp_server.codec import JSONCodec
+from wordpress_mcp_server.exporter import PostExporter
+from wordpress_mcp_server.server import WordPressClient
+
+
+def make_post(post_id, modified):
+    return {"id": post_id, "modified": modified, "title": {"raw": f"Post {post_id}"}}
+
+
+class FakeClient:
+    """Serves wp/v2 collections page by page, recording the queries."""
+
+    codec = JSONCodec()
+    prefetch_pages = 2
+
+    def __init__(self, posts, fail_revisions=()):
+        self.collections = {
+            "posts": posts,
+            "categories": [{"id": 1, "name": "News"}],
+            "tags": [{"id": 2, "name": "python"}, {"id": 3, "name": "sqlite"}],
+            "media": [{"id": 50, "modified": "2024-03-01T00:00:00"}],
+        }
+        for post in posts:
+            self.collections[f"posts/{post['id']}/revisions"] = [
+                {"id": post["id"] * 100 + n, "parent": post["id"]} for n in (1, 2)
+            ]
+        self.fail_revisions = set(fail_revisions)
+        self.calls = []
+
+    async def iter_pages(
+        self, route, per_page=100, max_pages=None, fields=None, cache=False, **params
+    ):
+        self.calls.append((route, params))
+        if (
+            route.endswith("/revisions")
+            and int(route.split("/")[1]) in self.fail_revisions
+        ):
+            raise RuntimeError("403 - rest_cannot_read")
+        items = self.collections[route]
+        if "modified_after" in params:
+            items = [i for i in items if i["modified"] > params["modified_after"]]
+        for start in range(0, max(len(items), 1), per_page):
+            yield items[start : start + per_page]
+
+    def iter_post_pages(
+        self, per_page=100, max_pages=None, fields=None, cache=False, **params
+    ):
+        return self.iter_pages("posts", per_page, max_pages, fields, cache, **params)
+
+
+def read_ndjson(path, compressed=False):
+    with (gzip.open if compressed else open)(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def client():
+    return FakeClient([make_post(n, f"2024-02-{n:02d}T00:00:00") for n in range(1, 8)])
+
+
+class TestPostExporter:
+    """Test cases for the streaming NDJSON exporter."""
+
+    async def test_exports_every_post(self, client, tmp_path):
+        path = str(tmp_path / "posts.ndjson")
+
+        result = await PostExporter(client, per_page=3).export(path)
+
+        assert result["success"]
+        records = read_ndjson(path)
+        assert [r["id"] for r in records] == list(range(1, 8))
+        assert {r["kind"] for r in records} == {"post"}
+        assert (result["posts"], result["terms"], result["media"]) == (7, 0, 0)
+        assert result["last_modified"] == "2024-02-07T00:00:00"
+        assert not (tmp_path / "posts.ndjson.tmp").exists()
+        _, params = client.calls[0]
+        assert params["orderby"] == "id" and params["context"] == "edit"
+
+    async def test_includes_terms_revisions_and_media(self, client, tmp_path):
+        path = str(tmp_path / "posts.ndjson")
+        exporter = PostExporter(
+            client, include=["terms", "revisions", "media"], per_page=3
+        )
+
+        result = await exporter.export(path)
+
+        kinds = [(r["kind"], r["id"]) for r in read_ndjson(path)]
+        assert kinds[:3] == [("category", 1), ("tag", 2), ("tag", 3)]
+        # Each post is followed by its revisions, in order
+        assert kinds[3:6] == [("post", 1), ("revision", 101), ("revision", 102)]
+        assert kinds[-4:] == [
+            ("post", 7),
+            ("revision", 701),
+            ("revision", 702),
+            ("media", 50),
+        ]
+        assert (result["terms"], result["revisions"], result["media"]) == (3, 14, 1)
+
+    async def test_modified_after_is_incremental(self, client, tmp_path):
+        path = str(tmp_path / "posts.ndjson")
+        exporter = PostExporter(client, include=["media"])
+
+        result = await exporter.export(path, modified_after="2024-02-05T12:00:00")
+
+        assert [r["id"] for r in read_ndjson(path)] == [6, 7, 50]
+        assert result["last_modified"] == "2024-02-07T00:00:00"
+
+        # The window starts a second early, so the last post is exported again
+        result = await exporter.export(path, modified_after=result["last_modified"])
+        assert client.calls[-2][1]["modified_after"] == "2024-02-06T23:59:59"
+        assert result["posts"] == 1
+        assert result["last_modified"] == "2024-02-07T00:00:00"
+
+    async def test_last_modified_is_the_newest_post(self, tmp_path):
+        client = FakeClient(
+            [
+                make_post(1, "2024-02-09T00:00:00"),
+                make_post(2, "2024-02-02T00:00:00"),
+                make_post(3, "2024-02-03T00:00:00"),
+            ]
+        )
+
+        result = await PostExporter(client, per_page=2).export(
+            str(tmp_path / "posts.ndjson")
+        )
+
+        assert result["last_modified"] == "2024-02-09T00:00:00"
+
+    async def test_gzip_follows_extension(self, client, tmp_path):
+        path = str(tmp_path / "posts.ndjson.gz")
+
+        result = await PostExporter(client).export(path)
+
+        assert result["compressed"]
+        assert len(read_ndjson(path, compressed=True)) == 7
+
+    async def test_progress_is_reported_per_page(self, client, tmp_path):
+        reports = []
+
+        async def progress(done, total):
+            reports.append(done)
+
+        exporter = PostExporter(client, per_page=3, progress=progress)
+        await exporter.export(str(tmp_path / "posts.ndjson"))
+
+        assert reports == [3, 6, 7]
+
+    async def test_failure_leaves_no_partial_file(self, client, tmp_path):
+        path = tmp_path / "posts.ndjson"
+        path.write_text("previous export\n")
+        client.fail_revisions = {4}
+
+        result = await PostExporter(client, include=["revisions"]).export(str(path))
+
+        assert not result["success"]
+        assert "403" in result["error"]
+        assert path.read_text() == "previous export\n"
+        assert not (tmp_path / "posts.ndjson.tmp").exists()
+
+    async def test_rejects_bad_arguments(self, client, tmp_path):
+        with pytest.raises(ValueError, match="comments"):
+            PostExporter(client, include=["comments"])
+
+        result = await PostExporter(client).export(
+            str(tmp_path / "x.ndjson"), modified_after="last week"
+        )
+        assert not result["success"]
+        assert "ISO 8601" in result["error"]
+
+    async def test_pages_stay_out_of_the_http_cache(self, tmp_path):
+        posts = [make_post(n, f"2024-02-01T00:00:{n:02d}") for n in range(1, 41)]
+
+        def reply(url, **kwargs):
+            per_page = int(kwargs["params"]["per_page"])
+            page = int(kwargs["params"]["page"])
+            return CallbackResult(
+                payload=posts[(page - 1) * per_page : page * per_page],
+                headers={"X-WP-TotalPages": str(-(-len(posts) // per_page))},
+            )
+
+        path = str(tmp_path / "posts.ndjson")
+        with aioresponses() as mocked:
+            mocked.get(
+                re.compile(r"^http://wp.test/.*/posts\?"), callback=reply, repeat=True
+            )
+            async with WordPressClient("http://wp.test", http_cache_ttl=60) as client:
+                result = await PostExporter(client, per_page=2).export(path)
+                assert len(client.http_cache) == 0
+
+        assert result["posts"] == 40
+        assert len(read_ndjson(path)) == 40
@@ -0,0 +1,93 @@
+import pytest
+from multidict import CIMultiDict
+
+from wordpress_mcp_server.http_cache import HTTPCache
+from wordpress_mcp_server.transport import Response
+
+URL = "http://wp.test/wp-json/wp/v2/posts"
+
+
+def response(status=200, body=b"[]", **headers) -> Response:
+    return Response(status, CIMultiDict(headers), body, URL)
+
+
+class TestHTTPCache:
+    """Test cases for the HTTPCache class."""
+
+    @pytest.fixture
+    def cache(self, clock):
+        return HTTPCache(maxsize=8, ttl=5, clock=clock)
+
+    def test_key_ignores_parameter_order(self):
+        assert HTTPCache.key(URL, {"a": 1, "b": 2}) == HTTPCache.key(
+            URL, [("b", "2"), ("a", "1")]
+        )
+        assert HTTPCache.key(URL) == URL
+
+    def test_response_without_validators_is_fresh_for_ttl(self, cache, clock):
+        key = cache.key(URL)
+        cache.update(key, None, response(body=b"[1]"))
+
+        cached = cache.fresh_response(cache.lookup(key))
+        assert cached.body == b"[1]"
+        assert cached.from_cache
+
+        clock.now = 5
+        assert cache.lookup(key) is None
+
+    def test_expired_entries_are_purged_on_store(self, cache, clock):
+        cache.update(cache.key(URL, {"page": 1}), None, response(body=b"[1]"))
+        cache.update(cache.key(URL, {"page": 2}), None, response(ETag='"v2"'))
+
+        clock.now = 5
+        cache.update(cache.key(URL, {"page": 3}), None, response(body=b"[3]"))
+
+        # The first page expired unread; the one with a validator is kept
+        assert len(cache) == 2
+        assert cache.lookup(cache.key(URL, {"page": 1})) is None
+
+    def test_response_with_etag_is_revalidated(self, cache, clock):
+        key = cache.key(URL)
+        cache.update(key, None, response(body=b"[1]", ETag='"v1"'))
+
+        clock.now = 3600
+        entry = cache.lookup(key)
+        assert cache.fresh_response(entry) is None
+        assert cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+        served = cache.update(key, entry, response(304, b"", ETag='"v1"'))
+        assert served.status == 200
+        assert served.body == b"[1]"
+        assert served.from_cache
+        assert cache.revalidations == 1
+
+    def test_last_modified_validator(self, cache):
+        key = cache.key(URL)
+        date = "Wed, 01 Jan 2025 00:00:00 GMT"
+        cache.update(key, None, response(**{"Last-Modified": date}))
+
+        headers = cache.conditional_headers(cache.lookup(key))
+        assert headers == {"If-Modified-Since": date}
+
+    def test_no_store_and_errors_are_not_cached(self, cache):
+        cache.update("a", None, response(**{"Cache-Control": "no-store"}))
+        cache.update("b", None, response(status=500))
+
+        assert len(cache) == 0
+
+    def test_write_invalidates_collection_and_items(self, cache):
+        tags = "http://wp.test/wp-json/wp/v2/tags"
+        for url in (URL, f"{URL}/12", f"{URL}/12/revisions", tags):
+            cache.update(cache.key(url, {"page": 1}), None, response())
+
+        cache.invalidate(f"{URL}/12")
+
+        assert [key.split("?")[0] for key in cache._entries] == [tags]
+
+    def test_lru_eviction(self, clock):
+        cache = HTTPCache(maxsize=2, ttl=60, clock=clock)
+        for name in ("a", "b", "c"):
+            cache.update(name, None, response())
+
+        assert cache.lookup("a") is None
+        assert len(cache) == 2
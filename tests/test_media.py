@@ -0,0 +1,46 @@
+import pytest
+
+from wordpress_mcp_server.media import (
+    content_disposition,
+    file_chunks,
+    guess_mime_type,
+    iterate_bytes,
+)
+
+
+class TestMediaHelpers:
+    """Test cases for media upload helpers."""
+
+    @pytest.mark.parametrize(
+        "filename, mime_type",
+        [
+            ("photo.JPG", "image/jpeg"),
+            ("clip.mp4", "video/mp4"),
+            ("paper.pdf", "application/pdf"),
+            ("blob", "application/octet-stream"),
+        ],
+    )
+    def test_guess_mime_type(self, filename, mime_type):
+        assert guess_mime_type(filename) == mime_type
+
+    def test_content_disposition(self):
+        assert content_disposition("a.png") == 'attachment; filename="a.png"'
+        assert content_disposition("café.png") == (
+            "attachment; filename=\"caf?.png\"; filename*=UTF-8''caf%C3%A9.png"
+        )
+
+    async def test_file_chunks(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"x" * 10)
+
+        chunks = [chunk async for chunk in file_chunks(path, chunk_size=4)]
+
+        assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+    async def test_iterate_bytes_accepts_sync_and_async(self):
+        async def agen():
+            yield b"a"
+            yield b"b"
+
+        assert [c async for c in iterate_bytes([b"a", b"b"])] == [b"a", b"b"]
+        assert [c async for c in iterate_bytes(agen())] == [b"a", b"b"]
@@ -0,0 +1,318 @@
+import asyncio
+
+import pytest
+
+from wordpress_mcp_server.mirror import PostMirror, fts_query, strip_html
+
+
+def make_post(post_id, modified, status="publish", title=None):
+    return {
+        "id": post_id,
+        "date": f"2024-01-{post_id:02d}T00:00:00",
+        "modified": modified,
+        "status": status,
+        "link": f"http://wp.test/?p={post_id}",
+        "title": {"rendered": title or f"Post {post_id}"},
+        "excerpt": {"rendered": f"<p>Excerpt {post_id}</p>"},
+        "content": {"rendered": f"<p>Content {post_id}</p>"},
+    }
+
+
+class FakeClient:
+    """Serves posts to iter_post_pages the way the REST API filters them."""
+
+    def __init__(self, posts, per_page=None):
+        self.posts = {post["id"]: post for post in posts}
+        self.per_page = per_page
+        self.after_page = None
+        self.calls = []
+
+    def _listing(self, params):
+        key = "id" if params.get("orderby") == "id" else "modified"
+        posts = sorted(self.posts.values(), key=lambda post: post[key])
+        if "modified_after" in params:
+            posts = [p for p in posts if p["modified"] > params["modified_after"]]
+        if "include" in params:
+            ids = {int(post_id) for post_id in params["include"].split(",")}
+            posts = [p for p in posts if p["id"] in ids]
+        return posts
+
+    async def iter_post_pages(self, per_page=100, fields=None, **params):
+        self.calls.append(params)
+        per_page = self.per_page or per_page
+        page = 1
+        # Each page is a fresh query, so changes between pages shift rows
+        while True:
+            posts = self._listing(params)
+            rows = posts[(page - 1) * per_page : page * per_page]
+            yield rows
+            if page * per_page >= len(posts):
+                return
+            if self.after_page is not None:
+                self.after_page(rows)
+            page += 1
+
+
+@pytest.fixture
+def clock_start():
+    return 1000.0
+
+
+@pytest.fixture
+async def mirror(tmp_path, clock):
+    client = FakeClient(
+        [
+            make_post(1, "2024-02-01T10:00:00"),
+            make_post(2, "2024-02-02T10:00:00", status="draft"),
+            make_post(3, "2024-02-03T10:00:00", status="trash"),
+        ]
+    )
+    mirror = await PostMirror(str(tmp_path / "mirror.db"), client, clock=clock).open()
+    yield mirror
+    await mirror.close()
+
+
+class TestPostMirror:
+    """Test cases for the PostMirror class."""
+
+    async def test_first_sync_is_full(self, mirror):
+        result = await mirror.sync()
+
+        assert (result["mode"], result["posts"], result["deleted"]) == ("full", 3, 0)
+        assert "modified_after" not in mirror.client.calls[0]
+        assert mirror.high_water_mark == "2024-02-03T10:00:00"
+
+    async def test_delta_sync_fetches_changes_since_high_water_mark(self, mirror):
+        await mirror.sync()
+        mirror.client.posts[2] = make_post(
+            2, "2024-02-05T09:00:00", status="draft", title="New"
+        )
+
+        result = await mirror.sync()
+
+        assert result["mode"] == "delta"
+        # One second of overlap in case of writes within the same second
+        assert mirror.client.calls[-1]["modified_after"] == "2024-02-03T09:59:59"
+        assert result["posts"] == 2
+        listed = await mirror.list_posts(status="draft")
+        assert listed["posts"][0]["title"] == "New"
+        assert mirror.high_water_mark == "2024-02-05T09:00:00"
+
+    async def test_full_sync_drops_deleted_posts(self, mirror):
+        await mirror.sync()
+        del mirror.client.posts[1]
+
+        assert (await mirror.sync())["deleted"] == 0
+        mirror._clock.now += mirror.full_sync_interval
+        result = await mirror.sync()
+
+        assert (result["mode"], result["deleted"]) == ("full", 1)
+        listed = await mirror.list_posts()
+        assert [post["id"] for post in listed["posts"]] == [2]
+
+    async def test_syncs_page_by_id(self, mirror):
+        await mirror.sync()
+        await mirror.sync()
+
+        assert mirror.client.calls[0]["orderby"] == "id"
+        assert mirror.client.calls[-1]["orderby"] == "id"
+
+    async def test_edit_mid_pass_hides_no_post(self, mirror):
+        mirror.client.per_page = 1
+        await mirror.sync()
+        mirror._clock.now += mirror.full_sync_interval
+
+        def edit(rows):
+            # Would move the post behind the unread ones in modified order
+            rows[0]["modified"] = "2024-02-09T00:00:00"
+
+        mirror.client.after_page = edit
+        result = await mirror.sync()
+
+        assert (result["mode"], result["posts"], result["deleted"]) == ("full", 3, 0)
+        assert "include" not in mirror.client.calls[-1]
+
+    async def test_edit_mid_delta_hides_no_change(self, mirror):
+        mirror.client.per_page = 1
+        await mirror.sync()
+        for post_id in (1, 2, 3):
+            mirror.client.posts[post_id][
+                "modified"
+            ] = f"2024-02-0{post_id + 4}T00:00:00"
+
+        def edit(rows):
+            rows[0]["modified"] = "2024-02-09T00:00:00"
+
+        mirror.client.after_page = edit
+        result = await mirror.sync()
+
+        assert (result["mode"], result["posts"]) == ("delta", 3)
+        # The mark covers what the pass read, not the edit made after it
+        assert mirror.high_water_mark == "2024-02-07T00:00:00"
+        mirror.client.after_page = None
+        result = await mirror.sync()
+        assert result["posts"] == 3
+
+    async def test_post_shifted_by_a_deletion_is_looked_up(self, mirror):
+        mirror.client.per_page = 1
+        await mirror.sync()
+        mirror._clock.now += mirror.full_sync_interval
+
+        def delete(rows):
+            # Shifts post 3 back onto page 2, which was already read
+            if rows[0]["id"] == 2:
+                del mirror.client.posts[1]
+
+        mirror.client.after_page = delete
+        result = await mirror.sync()
+
+        # Post 1 was read before it was deleted; the next full pass drops it
+        assert (result["mode"], result["deleted"]) == ("full", 0)
+        assert mirror.client.calls[-1]["include"] == "3"
+        trash = await mirror.list_posts(status="trash")
+        assert [post["id"] for post in trash["posts"]] == [3]
+
+    async def test_list_posts_filters_status(self, mirror):
+        await mirror.sync()
+
+        listed = await mirror.list_posts()
+        assert listed["success"]
+        # "any" leaves out trashed posts and lists newest first
+        assert [post["id"] for post in listed["posts"]] == [2, 1]
+        assert listed["posts"][1] == {
+            "id": 1,
+            "title": "Post 1",
+            "url": "http://wp.test/?p=1",
+            "status": "publish",
+            "date": "2024-01-01T00:00:00",
+            "excerpt": "<p>Excerpt 1</p>",
+        }
+        trash = await mirror.list_posts(status="trash", per_page=1)
+        assert [post["id"] for post in trash["posts"]] == [3]
+
+    async def test_freshness(self, mirror):
+        assert not mirror.is_fresh(300)
+        await mirror.sync()
+        assert mirror.is_fresh(300)
+
+        mirror.notify_write()
+        assert not mirror.is_fresh(300)
+        await mirror.sync()
+        assert mirror.is_fresh(300)
+
+        mirror._clock.now += 301
+        assert not mirror.is_fresh(300)
+
+    async def test_state_survives_reopen(self, mirror):
+        await mirror.sync()
+        await mirror.close()
+
+        reopened = await PostMirror(mirror.path, mirror.client).open()
+        try:
+            assert reopened.high_water_mark == "2024-02-03T10:00:00"
+            assert reopened.last_sync == 1000.0
+            assert len((await reopened.list_posts())["posts"]) == 2
+        finally:
+            await reopened.close()
+
+    async def test_background_sync_runs_after_write(self, mirror):
+        mirror.sync_interval = 3600
+        mirror.start()
+        try:
+            while mirror.last_sync is None:
+                await asyncio.sleep(0.001)
+            calls = len(mirror.client.calls)
+            mirror.notify_write()
+            while mirror._synced_writes != mirror._writes:
+                await asyncio.sleep(0.001)
+            assert len(mirror.client.calls) == calls + 1
+        finally:
+            await mirror.stop()
+
+
+class TestPostSearch:
+    """Test cases for full-text search over the post mirror."""
+
+    @pytest.fixture
+    async def indexed(self, mirror):
+        posts = mirror.client.posts
+        posts[1]["title"] = {"rendered": "Caf&eacute; reviews"}
+        posts[1]["content"] = {
+            "rendered": "<p>The best <b>espresso</b> in town.</p>"
+            "<script>var espresso = 1;</script>"
+        }
+        posts[2]["content"] = {"rendered": "<p>Notes about espresso machines</p>"}
+        posts[3]["content"] = {"rendered": "<p>Espresso in the trash</p>"}
+        await mirror.sync()
+        return mirror
+
+    def test_strip_html(self):
+        assert strip_html("<p>A&amp;B <em>c</em></p>\n<style>p{}</style>") == "A&B c"
+        assert strip_html("  plain   text ") == "plain text"
+
+    def test_fts_query_quotes_words(self):
+        assert fts_query('wp-json "x" espr*') == '"wp-json" """x""" "espr"*'
+        assert fts_query("   ") == ""
+
+    async def test_ranks_title_matches_first(self, indexed):
+        indexed.client.posts[2]["title"] = {"rendered": "Espresso"}
+        indexed.client.posts[2]["modified"] = "2024-03-01T00:00:00"
+        await indexed.sync()
+
+        result = await indexed.search("espresso")
+
+        assert result["success"]
+        # The trashed post is left out and the title match ranks first
+        assert [post["id"] for post in result["posts"]] == [2, 1]
+        assert result["posts"][0]["score"] > result["posts"][1]["score"]
+
+    async def test_snippet_and_stripped_fields(self, indexed):
+        result = await indexed.search("espresso", status="publish")
+
+        (post,) = result["posts"]
+        assert post["title"] == "Café reviews"
+        assert post["snippet"] == "The best **espresso** in town."
+
+    async def test_accents_prefixes_and_operators(self, indexed):
+        assert [p["id"] for p in (await indexed.search("cafe"))["posts"]] == [1]
+        assert len((await indexed.search("espress*"))["posts"]) == 2
+        assert (await indexed.search("NOT AND"))["posts"] == []
+        assert not (await indexed.search(" "))["success"]
+
+    async def test_index_follows_updates_and_deletes(self, indexed):
+        indexed.client.posts[1] = make_post(1, "2024-03-01T00:00:00")
+        await indexed.sync()
+        assert [p["id"] for p in (await indexed.search("espresso"))["posts"]] == [2]
+
+        del indexed.client.posts[2]
+        await indexed.sync(full=True)
+        assert (await indexed.search("espresso"))["posts"] == []
+
+    async def test_index_is_built_for_existing_mirrors(self, indexed):
+        await indexed._run(indexed._db.execute, "DELETE FROM posts_fts")
+        await indexed._run(indexed._db.commit)
+        await indexed.close()
+
+        reopened = await PostMirror(indexed.path, indexed.client).open()
+        try:
+            assert len((await reopened.search("espresso"))["posts"]) == 2
+        finally:
+            await reopened.close()
+
+
+class TestCreatedPosts:
+    """Test cases for the mirror as an idempotency store."""
+
+    async def test_created_posts_expire(self, mirror):
+        await mirror.put_created("key", {"id": 5}, expires_at=1010.0)
+
+        assert await mirror.get_created("key") == {"id": 5}
+        assert await mirror.get_created("other") is None
+        mirror._clock.now = 1010.0
+        assert await mirror.get_created("key") is None
+
+    async def test_closed_store_is_a_miss(self, mirror):
+        await mirror.close()
+
+        await mirror.put_created("key", {"id": 5}, expires_at=2000.0)
+        assert await mirror.get_created("key") is None
@@ -0,0 +1,142 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from wordpress_mcp_server.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_idempotent,
+    parse_retry_after,
+)
+
+
+class TestIdempotency:
+    """Test cases for classifying requests as safe to replay."""
+
+    @pytest.mark.parametrize(
+        "method, url, expected",
+        [
+            ("GET", "http://wp.test/wp-json/wp/v2/posts", True),
+            ("PUT", "http://wp.test/wp-json/wp/v2/posts/3", True),
+            ("DELETE", "http://wp.test/wp-json/wp/v2/posts/3", True),
+            ("POST", "http://wp.test/wp-json/wp/v2/posts/3", True),
+            ("POST", "/wp/v2/posts/3/", True),
+            ("POST", "http://wp.test/wp-json/wp/v2/posts", False),
+            ("post", "/wp/v2/tags", False),
+        ],
+    )
+    def test_is_idempotent(self, method, url, expected):
+        assert is_idempotent(method, url) is expected
+
+
+class TestRetryPolicy:
+    """Test cases for the RetryPolicy class."""
+
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(backoff=1, max_delay=5, rand=lambda: 1.0)
+
+        assert [policy.backoff_delay(n) for n in range(4)] == [1, 2, 4, 5]
+
+    def test_backoff_is_jittered(self):
+        policy = RetryPolicy(backoff=1, rand=lambda: 0.25)
+
+        assert policy.backoff_delay(2) == 1.0
+
+    def test_gives_up_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2, rand=lambda: 1.0)
+
+        assert policy.status_delay(503, None, 1, True) is not None
+        assert policy.status_delay(503, None, 2, True) is None
+
+    def test_only_transient_statuses_are_retried(self):
+        policy = RetryPolicy()
+
+        assert policy.status_delay(500, None, 0, True) is None
+        assert policy.status_delay(404, None, 0, True) is None
+        assert policy.status_delay(502, None, 0, True) is not None
+
+    def test_retry_after_replaces_backoff(self):
+        policy = RetryPolicy(max_delay=30)
+
+        assert policy.status_delay(429, "7", 0, True) == 7
+        assert policy.status_delay(429, "120", 0, True) is None
+
+    def test_creates_only_retry_when_not_processed(self):
+        policy = RetryPolicy(rand=lambda: 1.0)
+        reset = aiohttp.ServerDisconnectedError()
+        refused = aiohttp.ClientConnectorError(None, OSError(111, "refused"))
+
+        assert policy.status_delay(503, None, 0, False) is None
+        assert policy.status_delay(429, None, 0, False) is not None
+        assert policy.error_delay(reset, 0, False) is None
+        assert policy.error_delay(reset, 0, True) is not None
+        assert policy.error_delay(refused, 0, False) is not None
+
+    def test_other_errors_are_not_retried(self):
+        assert RetryPolicy().error_delay(ValueError("bad"), 0, True) is None
+        assert RetryPolicy().error_delay(asyncio.TimeoutError(), 0, True) is not None
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("12") == 12
+        assert parse_retry_after("soon") is None
+        # Sun, 06 Nov 1994 08:49:37 GMT is 784111777
+        assert parse_retry_after("Sun, 06 Nov 1994 08:49:37 GMT", 784111770) == 7
+        assert parse_retry_after("Sun, 06 Nov 1994 08:49:37 GMT", 784111800) == 0
+
+
+class TestCircuitBreaker:
+    """Test cases for the CircuitBreaker class."""
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker(
+            "wp.test", failure_threshold=3, reset_timeout=10, clock=clock
+        )
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            breaker.record_failure()
+        breaker.record_success()
+        for _ in range(2):
+            breaker.record_failure()
+        breaker.before_request()
+
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError, match="wp.test"):
+            breaker.before_request()
+
+    def test_half_open_trial_closes_on_success(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now = 10
+        breaker.before_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_status(200)
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_request()
+
+    def test_half_open_trial_reopens_on_failure(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10
+        breaker.before_request()
+
+        breaker.record_status(502)
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now = 19
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_zero_threshold_disables_breaker(self, clock):
+        breaker = CircuitBreaker("wp.test", failure_threshold=0, clock=clock)
+        for _ in range(100):
+            breaker.record_failure()
+
+        breaker.before_request()
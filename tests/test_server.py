@@ -0,0 +1,1299 @@
+import asyncio
+import gc
+import gzip
+import json
+import re
+import socket
+import sqlite3
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import make_mocked_request
+from aioresponses import CallbackResult, aioresponses
+from mcp.types import CallToolRequest, CallToolRequestParams
+from yarl import URL
+
+from wordpress_mcp_server.auth import auth_probes
+from wordpress_mcp_server.server import WordPressClient, WordPressMCPServer, slugify
+
+BASE_URL = "http://wp.test"
+API = f"{BASE_URL}/wp-json/wp/v2"
+TERMS_URL = re.compile(rf"^{API}/(categories|tags)\?.*slug")
+
+
+BATCH_URL = f"{BASE_URL}/wp-json/batch/v1"
+
+
+def endpoint(route: str):
+    """Match a REST route with any query string"""
+    return re.compile(rf"^{API}/{route}(\?.*)?$")
+
+
+def request_count(mocked) -> int:
+    return sum(len(calls) for calls in mocked.requests.values())
+
+
+def wp_post(post_id: int, title: str = "Hello", status: str = "draft") -> dict:
+    return {
+        "id": post_id,
+        "title": {"rendered": title},
+        "link": f"{BASE_URL}/?p={post_id}",
+        "status": status,
+        "date": "2025-01-01T00:00:00",
+        "excerpt": {"rendered": ""},
+    }
+
+
+async def call_tool(server: WordPressMCPServer, name: str, arguments: dict):
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    return (await handler(request)).root
+
+
+@pytest.fixture
+def mock_wp():
+    with aioresponses() as mocked:
+        yield mocked
+
+
+class TestWordPressClientSession:
+    """Test cases for the pooled client session lifecycle."""
+
+    async def test_open_is_idempotent(self):
+        client = WordPressClient(BASE_URL)
+        assert client.closed
+
+        await client.open()
+        session = client.session
+        await client.open()
+
+        assert client.session is session
+        assert not client.closed
+        await client.close()
+        assert client.closed
+
+    async def test_connector_uses_pool_options(self):
+        client = WordPressClient(
+            BASE_URL, pool_limit=7, pool_limit_per_host=3, dns_cache_ttl=42
+        )
+        async with client:
+            connector = client.session.connector
+            assert connector.limit == 7
+            assert connector.limit_per_host == 3
+
+    async def test_session_is_reused_across_calls(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), payload={"id": 1}, repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            session = client.session
+            for _ in range(3):
+                result = await client.authenticate()
+                assert result["success"]
+            assert client.session is session
+
+    async def test_session_uses_configured_json_codec(self, mock_wp):
+        mock_wp.post(endpoint("posts"), payload=wp_post(1, "Café"), status=201)
+
+        async with WordPressClient(BASE_URL, json_codec="json") as client:
+            assert client.codec.name == "json"
+            assert client.session._json_serialize == client.codec.dumps
+            result = await client.create_post("Café", "Body")
+
+        assert result["success"]
+        assert result["post"]["title"] == "Café"
+
+    async def test_client_can_be_reopened_after_close(self):
+        client = WordPressClient(BASE_URL)
+        async with client:
+            pass
+        async with client:
+            assert not client.closed
+        assert client.closed
+
+
+class TestWordPressMCPServer:
+    """Test cases for the server-owned client."""
+
+    def test_server_builds_one_client_from_options(self):
+        server = WordPressMCPServer(
+            BASE_URL, "user", "secret", client_options={"pool_limit": 5}
+        )
+
+        assert isinstance(server.wp_client, WordPressClient)
+        assert server.wp_client.pool_limit == 5
+        assert server.wp_client.username == "user"
+        assert server.wp_client.closed
+
+
+class TestTermCache:
+    """Test cases for category/tag resolution through the term cache."""
+
+    @staticmethod
+    def terms_page(taxonomy: str, page: int) -> str:
+        query = f"_fields=id,name,slug&hide_empty=false&page={page}&per_page=100"
+        return f"{API}/{taxonomy}?{query}"
+
+    async def test_preload_pages_through_taxonomies(self, mock_wp):
+        page_one = [{"id": n, "name": f"Cat {n}"} for n in range(100)]
+        mock_wp.get(
+            self.terms_page("categories", 1),
+            payload=page_one,
+            headers={"X-WP-TotalPages": "2"},
+        )
+        mock_wp.get(
+            self.terms_page("categories", 2),
+            payload=[{"id": 100, "name": "Research"}],
+            headers={"X-WP-TotalPages": "2"},
+        )
+        mock_wp.get(
+            self.terms_page("tags", 1),
+            payload=[{"id": 200, "name": "Python"}],
+            headers={"X-WP-TotalPages": "1"},
+        )
+
+        async with WordPressClient(BASE_URL) as client:
+            counts = await client.preload_terms()
+            assert counts == {"categories": 101, "tags": 1}
+            assert await client._get_or_create_categories(["research"]) == [100]
+            assert await client._get_or_create_tags(["PYTHON"]) == [200]
+
+    async def test_repeat_create_with_known_terms_is_one_request(self, mock_wp):
+        mock_wp.get(TERMS_URL, payload=[], repeat=True)
+        mock_wp.post(endpoint("categories"), status=201, payload={"id": 3})
+        mock_wp.post(endpoint("tags"), status=201, payload={"id": 7})
+        mock_wp.post(endpoint("posts"), status=201, payload=wp_post(10), repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            first = await client.create_post(
+                "Hello", "Body", categories=["Research"], tags=["python"]
+            )
+            assert first["success"]
+            requests_before = request_count(mock_wp)
+
+            second = await client.create_post(
+                "Hello again", "Body", categories=["research"], tags=["Python"]
+            )
+            assert second["success"]
+            requests_after = request_count(mock_wp)
+
+        assert requests_after - requests_before == 1
+
+
+class TestTermLookup:
+    """Test cases for batched exact-slug term lookup."""
+
+    @pytest.mark.parametrize(
+        "name, slug",
+        [
+            ("Machine Learning", "machine-learning"),
+            ("Café crème", "cafe-creme"),
+            ("C++ & Rust", "c-rust"),
+            ("  Python 3.12 ", "python-3-12"),
+            ("日本", "%e6%97%a5%e6%9c%ac"),
+            ("Rock'n'Roll", "rocknroll"),
+            ("Don\u2019t Panic", "dont-panic"),
+            ("snake_case", "snake_case"),
+            ("?!", ""),
+        ],
+    )
+    def test_slugify(self, name, slug):
+        assert slugify(name) == slug
+
+    async def test_existing_terms_resolved_in_one_request(self, mock_wp):
+        mock_wp.get(
+            TERMS_URL,
+            payload=[
+                {"id": 1, "name": "Machine Learning", "slug": "machine-learning"},
+                {"id": 2, "name": "Python", "slug": "python"},
+            ],
+        )
+
+        async with WordPressClient(BASE_URL) as client:
+            ids = await client._get_or_create_tags(["Machine Learning", "python"])
+
+        assert ids == [1, 2]
+        assert request_count(mock_wp) == 1
+        (((_, url), calls),) = mock_wp.requests.items()
+        assert url.query.getall("slug[]") == ["machine-learning", "python"]
+
+    async def test_only_missing_terms_are_created(self, mock_wp):
+        mock_wp.get(TERMS_URL, payload=[{"id": 1, "name": "Python", "slug": "python"}])
+        mock_wp.post(endpoint("tags"), status=201, payload={"id": 9})
+
+        async with WordPressClient(BASE_URL) as client:
+            ids = await client._get_or_create_tags(["Python", "Rust"])
+
+        assert ids == [1, 9]
+        posts = [key for key in mock_wp.requests if key[0] == "POST"]
+        assert len(posts) == 1
+        assert mock_wp.requests[posts[0]][0].kwargs["json"] == {"name": "Rust"}
+
+    async def test_name_without_slug_is_created(self, mock_wp):
+        mock_wp.post(endpoint("tags"), status=201, payload={"id": 7})
+
+        async with WordPressClient(BASE_URL) as client:
+            ids = await client._get_or_create_tags(["?!"])
+
+        assert ids == [7]
+        # Nothing to look up by slug, so straight to the create
+        assert [key[0] for key in mock_wp.requests] == ["POST"]
+
+    async def test_term_exists_resolves_to_existing_id(self, mock_wp):
+        mock_wp.get(TERMS_URL, payload=[])
+        mock_wp.post(
+            endpoint("tags"),
+            status=400,
+            payload={
+                "code": "term_exists",
+                "message": "A term with the name provided already exists.",
+                "data": {"status": 400, "term_id": 42},
+            },
+        )
+
+        async with WordPressClient(BASE_URL) as client:
+            assert await client._get_or_create_tags(["Python"]) == [42]
+
+        assert request_count(mock_wp) == 2
+
+    async def test_concurrent_posts_create_new_tag_once(self, mock_wp):
+        mock_wp.get(TERMS_URL, payload=[], repeat=True)
+        mock_wp.post(endpoint("tags"), status=201, payload={"id": 5})
+
+        async with WordPressClient(BASE_URL) as client:
+            results = await asyncio.gather(
+                client._get_or_create_tags(["New Tag"]),
+                client._get_or_create_tags(["new tag"]),
+            )
+
+        assert results == [[5], [5]]
+        posts = [key for key in mock_wp.requests if key[0] == "POST"]
+        assert len(mock_wp.requests[posts[0]]) == 1
+
+
+class TestBatch:
+    """Test cases for the Batch API and the bulk post tools."""
+
+    @staticmethod
+    def _batch_reply(url, json, **kwargs):
+        responses = []
+        for request in json["requests"]:
+            if request["path"] == "/wp/v2/posts":
+                title = request["body"]["title"]
+                post_id = int(title.split()[-1])
+                body, status = wp_post(post_id, title), 201
+            else:
+                post_id = int(request["path"].rsplit("/", 1)[1])
+                if post_id == 404:
+                    body = {"code": "rest_post_invalid_id", "message": "Invalid ID."}
+                    status = 404
+                else:
+                    body, status = wp_post(post_id, status="publish"), 200
+            responses.append({"body": body, "status": status, "headers": {}})
+        return CallbackResult(status=207, payload={"responses": responses})
+
+    async def test_requests_are_packed_25_per_call(self, mock_wp):
+        mock_wp.post(BATCH_URL, callback=self._batch_reply, repeat=True)
+        posts = [{"title": f"Draft {n}", "content": "Body"} for n in range(60)]
+
+        async with WordPressClient(BASE_URL) as client:
+            result = await client.create_posts(posts)
+
+        calls = mock_wp.requests[("POST", URL(BATCH_URL))]
+        assert [len(call.kwargs["json"]["requests"]) for call in calls] == [25, 25, 10]
+        assert result["success"]
+        assert result["succeeded"] == 60
+        assert [item["post"]["id"] for item in result["results"]] == list(range(60))
+
+    async def test_bulk_create_resolves_terms_once(self, mock_wp):
+        mock_wp.get(TERMS_URL, payload=[{"id": 3, "name": "News", "slug": "news"}])
+        mock_wp.post(BATCH_URL, callback=self._batch_reply)
+        posts = [
+            {"title": f"Draft {n}", "content": "Body", "categories": ["News"]}
+            for n in range(3)
+        ]
+
+        async with WordPressClient(BASE_URL) as client:
+            result = await client.create_posts(posts)
+
+        assert result["succeeded"] == 3
+        (call,) = mock_wp.requests[("POST", URL(BATCH_URL))]
+        bodies = [request["body"] for request in call.kwargs["json"]["requests"]]
+        assert all(body["categories"] == [3] for body in bodies)
+        assert request_count(mock_wp) == 2
+
+    async def test_per_item_failures_are_reported(self, mock_wp):
+        mock_wp.post(BATCH_URL, callback=self._batch_reply)
+
+        async with WordPressClient(BASE_URL) as client:
+            result = await client.update_posts(
+                [{"post_id": 1, "status": "publish"}, {"post_id": 404, "title": "x"}]
+            )
+
+        assert not result["success"]
+        assert result["succeeded"] == 1
+        assert result["results"][0]["post"]["status"] == "publish"
+        assert "404 - Invalid ID." in result["results"][1]["error"]
+
+    async def test_failed_batch_call_fails_its_items(self, mock_wp):
+        mock_wp.post(BATCH_URL, status=500, body="boom")
+
+        async with WordPressClient(BASE_URL) as client:
+            responses = await client.batch(
+                [{"method": "POST", "path": "/wp/v2/posts/1", "body": {}}] * 2
+            )
+
+        assert [response["status"] for response in responses] == [500, 500]
+        assert responses[0]["body"]["code"] == "batch_failed"
+
+    async def test_bulk_tool_lists_each_post(self, mock_wp):
+        mock_wp.post(BATCH_URL, callback=self._batch_reply)
+        server = WordPressMCPServer(BASE_URL, preload_terms=False)
+
+        async with server.wp_client:
+            result = await call_tool(
+                server,
+                "create_blog_posts_bulk",
+                {"posts": [{"title": f"Draft {n}", "content": "x"} for n in range(2)]},
+            )
+
+        assert not result.isError
+        assert "Successfully created 2 of 2 blog posts." in result.content[0].text
+
+
+class TestPostPagination:
+    """Test cases for the paginated post iterator."""
+
+    POSTS_URL = re.compile(rf"^{API}/posts\?")
+
+    @staticmethod
+    def _paged_reply(total: int):
+        def reply(url, **kwargs):
+            per_page = int(kwargs["params"]["per_page"])
+            page = int(kwargs["params"]["page"])
+            ids = range(total, 0, -1)[(page - 1) * per_page : page * per_page]
+            return CallbackResult(
+                payload=[wp_post(post_id) for post_id in ids],
+                headers={"X-WP-TotalPages": str(-(-total // per_page))},
+            )
+
+        return reply
+
+    async def test_iter_posts_walks_every_page(self, mock_wp):
+        mock_wp.get(self.POSTS_URL, callback=self._paged_reply(250), repeat=True)
+
+        async with WordPressClient(BASE_URL, prefetch_pages=2) as client:
+            ids = [post["id"] async for post in client.iter_posts(status="publish")]
+
+        assert ids == list(range(250, 0, -1))
+        assert request_count(mock_wp) == 3
+
+    async def test_max_posts_limits_pages_fetched(self, mock_wp):
+        mock_wp.get(self.POSTS_URL, callback=self._paged_reply(1000), repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            result = await client.list_posts(per_page=150)
+
+        assert result["success"]
+        assert len(result["posts"]) == 150
+        assert request_count(mock_wp) == 2
+
+    async def test_closing_early_cancels_prefetch(self, mock_wp):
+        mock_wp.get(self.POSTS_URL, callback=self._paged_reply(1000), repeat=True)
+
+        async with WordPressClient(BASE_URL, prefetch_pages=3) as client:
+            pages = client.iter_post_pages(per_page=10)
+            assert len(await pages.__anext__()) == 10
+            assert len(await pages.__anext__()) == 10
+            await pages.aclose()
+            await asyncio.sleep(0)
+
+        # First page, then at most the prefetch window and one refill
+        assert request_count(mock_wp) <= 5
+
+    async def test_prefetch_starts_with_the_first_page(self, mock_wp):
+        mock_wp.get(self.POSTS_URL, callback=self._paged_reply(1000), repeat=True)
+
+        async with WordPressClient(BASE_URL, prefetch_pages=3) as client:
+            pages = client.iter_post_pages(per_page=10)
+            await pages.__anext__()
+            # Pages 2-4 are requested while the caller holds page 1
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert request_count(mock_wp) == 4
+            await pages.aclose()
+
+    async def test_closing_early_retrieves_failed_prefetches(self, mock_wp):
+        release = asyncio.Event()
+
+        async def fail_later(url, **kwargs):
+            await release.wait()
+            raise aiohttp.ClientConnectionError("reset")
+
+        mock_wp.get(
+            self.POSTS_URL, payload=[wp_post(1)], headers={"X-WP-TotalPages": "3"}
+        )
+        mock_wp.get(self.POSTS_URL, callback=fail_later, repeat=True)
+        unretrieved = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: unretrieved.append(context))
+
+        try:
+            async with WordPressClient(
+                BASE_URL, prefetch_pages=2, max_retries=0
+            ) as client:
+                pages = client.iter_post_pages(per_page=1)
+                await pages.__anext__()
+                await asyncio.sleep(0.01)
+                await pages.aclose()
+                # Pages 2 and 3 fail after the caller has stopped
+                release.set()
+                await asyncio.sleep(0.01)
+            del pages
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert unretrieved == []
+
+    async def test_list_posts_reports_http_errors(self, mock_wp):
+        mock_wp.get(self.POSTS_URL, status=403)
+
+        async with WordPressClient(BASE_URL) as client:
+            result = await client.list_posts()
+
+        assert not result["success"]
+        assert "403" in result["error"]
+
+
+class TestFieldProjection:
+    """Test cases for _fields projections on read endpoints."""
+
+    @staticmethod
+    def _sent(mocked, method: str = "GET"):
+        return [url for (sent, url) in mocked.requests if sent == method]
+
+    async def test_list_posts_requests_summary_fields(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1)])
+
+        async with WordPressClient(BASE_URL) as client:
+            await client.list_posts()
+
+        (url,) = self._sent(mock_wp)
+        assert url.query["_fields"] == "id,title,link,status,date,excerpt"
+
+    async def test_callers_choose_their_projection(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[{"id": 1}], repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            [post async for post in client.iter_posts(fields=("id", "modified"))]
+            [post async for post in client.iter_posts()]
+
+        custom, full = self._sent(mock_wp)
+        assert custom.query["_fields"] == "id,modified"
+        assert "_fields" not in full.query
+
+    async def test_authenticate_projection(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), payload={"id": 1}, repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            await client.authenticate()
+            await client.authenticate(fields=None)
+
+        default, full = self._sent(mock_wp)
+        assert default.query["_fields"] == "id,name,username,email,roles"
+        assert "_fields" not in full.query
+
+
+class TestHTTPCaching:
+    """Test cases for conditional requests made by WordPressClient."""
+
+    async def test_not_modified_serves_cached_body(self, mock_wp):
+        mock_wp.get(
+            endpoint("users/me"),
+            payload={"id": 1, "name": "admin"},
+            headers={"ETag": '"u1"'},
+        )
+        mock_wp.get(endpoint("users/me"), status=304, headers={"ETag": '"u1"'})
+
+        async with WordPressClient(BASE_URL) as client:
+            first = await client.authenticate()
+            second = await client.authenticate()
+
+        assert first == second == {"success": True, "user": {"id": 1, "name": "admin"}}
+        conditional = list(mock_wp.requests.values())[0][1]
+        assert conditional.kwargs["headers"]["If-None-Match"] == '"u1"'
+
+    async def test_ttl_cache_without_validators(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1)])
+
+        async with WordPressClient(BASE_URL, http_cache_ttl=60) as client:
+            first = await client.list_posts()
+            second = await client.list_posts()
+
+        assert first == second
+        assert request_count(mock_wp) == 1
+
+    async def test_write_invalidates_cached_listing(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1)], repeat=True)
+        mock_wp.post(endpoint("posts/1"), payload=wp_post(1, status="publish"))
+
+        async with WordPressClient(BASE_URL, http_cache_ttl=60) as client:
+            await client.list_posts()
+            await client.update_post(1, status="publish")
+            await client.list_posts()
+
+        gets = [
+            call
+            for (method, _), calls in mock_wp.requests.items()
+            for call in calls
+            if method == "GET"
+        ]
+        assert len(gets) == 2
+
+    async def test_paged_reads_bypass_cache(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1)], repeat=True)
+
+        async with WordPressClient(BASE_URL, http_cache_ttl=60) as client:
+            for _ in range(2):
+                async for _page in client.iter_post_pages():
+                    pass
+            assert len(client.http_cache) == 0
+
+        assert request_count(mock_wp) == 2
+
+    async def test_cache_can_be_disabled(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1)], repeat=True)
+
+        async with WordPressClient(BASE_URL, http_cache_size=0) as client:
+            await client.list_posts()
+            await client.list_posts()
+
+        assert request_count(mock_wp) == 2
+
+    async def test_read_in_flight_during_a_write_is_not_cached(self, mock_wp):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_listing(url, **kwargs):
+            started.set()
+            await release.wait()
+            return CallbackResult(payload=[wp_post(1)])
+
+        mock_wp.get(endpoint("posts"), callback=slow_listing)
+        mock_wp.post(endpoint("posts"), status=201, payload=wp_post(2))
+        mock_wp.get(endpoint("posts"), payload=[wp_post(2), wp_post(1)])
+
+        async with WordPressClient(BASE_URL, http_cache_ttl=60) as client:
+            listing = asyncio.ensure_future(client.list_posts())
+            await started.wait()
+            await client.create_post("New", "Body")
+            release.set()
+            await listing
+            result = await client.list_posts()
+
+        assert [post["id"] for post in result["posts"]] == [2, 1]
+
+
+class TestRetries:
+    """Test cases for retries and the circuit breaker in WordPressClient."""
+
+    @pytest.fixture
+    def client_options(self):
+        return {"retry_backoff": 0, "http_cache_size": 0}
+
+    async def test_transient_status_is_retried(self, mock_wp, client_options):
+        mock_wp.get(endpoint("users/me"), status=502)
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+
+        async with WordPressClient(BASE_URL, **client_options) as client:
+            result = await client.authenticate()
+
+        assert result == {"success": True, "user": {"id": 1}}
+        assert request_count(mock_wp) == 2
+
+    async def test_connection_reset_is_retried(self, mock_wp, client_options):
+        mock_wp.post(endpoint("posts/1"), exception=aiohttp.ServerDisconnectedError())
+        mock_wp.post(endpoint("posts/1"), payload=wp_post(1, status="publish"))
+
+        async with WordPressClient(BASE_URL, **client_options) as client:
+            result = await client.update_post(1, status="publish")
+
+        assert result["success"]
+        assert result["post"]["status"] == "publish"
+
+    async def test_create_is_not_replayed(self, mock_wp, client_options):
+        mock_wp.post(endpoint("posts"), status=503)
+        mock_wp.post(endpoint("posts"), payload=wp_post(1), status=201)
+
+        async with WordPressClient(BASE_URL, **client_options) as client:
+            result = await client.create_post("Hello", "Body")
+
+        assert not result["success"]
+        assert request_count(mock_wp) == 1
+
+    async def test_retry_after_is_honored(self, mock_wp, client_options, monkeypatch):
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        mock_wp.get(endpoint("users/me"), status=429, headers={"Retry-After": "3"})
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+
+        async with WordPressClient(BASE_URL, **client_options) as client:
+            result = await client.authenticate()
+
+        assert result["success"]
+        assert delays == [3]
+
+    async def test_open_circuit_fails_fast(self, mock_wp, client_options):
+        mock_wp.get(endpoint("users/me"), status=503, repeat=True)
+
+        async with WordPressClient(
+            BASE_URL, max_retries=0, breaker_threshold=2, **client_options
+        ) as client:
+            for _ in range(2):
+                result = await client.authenticate()
+                assert result["error"] == "Authentication failed: 503"
+            result = await client.authenticate()
+
+        assert "unavailable after repeated failures" in result["error"]
+        assert request_count(mock_wp) == 2
+
+
+class TestAdaptiveConcurrency:
+    """Test cases for the adaptive concurrency limit in WordPressClient."""
+
+    async def test_throttling_shrinks_the_limit(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), status=429)
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+
+        async with WordPressClient(
+            BASE_URL, concurrency_limit=8, retry_backoff=0, http_cache_size=0
+        ) as client:
+            result = await client.authenticate()
+            assert result["success"]
+            assert client.limiter.limit == 4
+            assert client.limiter.in_flight == 0
+
+    async def test_requests_beyond_the_limit_wait(self, mock_wp):
+        in_flight = peak = 0
+
+        async def slow(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return CallbackResult(payload={"id": 1})
+
+        mock_wp.get(endpoint("users/me"), callback=slow, repeat=True)
+
+        async with WordPressClient(
+            BASE_URL, concurrency_limit=2, max_concurrency=2, http_cache_size=0
+        ) as client:
+            # Distinct projections, so the reads aren't coalesced
+            results = await asyncio.gather(
+                *(client.authenticate(fields=("id",) * n) for n in range(1, 7))
+            )
+
+        assert all(result["success"] for result in results)
+        assert peak == 2
+
+    async def test_limiter_can_be_disabled(self):
+        assert WordPressClient(BASE_URL, max_concurrency=0).limiter is None
+
+
+class TestAuthentication:
+    """Test cases for the auth headers WordPressClient sends."""
+
+    async def test_basic_auth_header_is_sent(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+
+        async with WordPressClient(BASE_URL, "admin", "secret") as client:
+            await client.authenticate()
+
+        (call,) = list(mock_wp.requests.values())[0]
+        assert call.kwargs["headers"]["Authorization"] == "Basic YWRtaW46c2VjcmV0"
+
+    async def test_jwt_is_refreshed_once_after_401(self, mock_wp):
+        token_url = f"{BASE_URL}/wp-json/jwt-auth/v1/token"
+        mock_wp.post(token_url, payload={"token": "first"})
+        mock_wp.post(token_url, payload={"token": "second"})
+        mock_wp.get(endpoint("users/me"), status=401)
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+
+        async with WordPressClient(
+            BASE_URL, auth_method="jwt", http_cache_size=0
+        ) as client:
+            result = await client.authenticate()
+
+        assert result["success"]
+        gets = [
+            call
+            for (method, _), calls in mock_wp.requests.items()
+            for call in calls
+            if method == "GET"
+        ]
+        assert [call.kwargs["headers"]["Authorization"] for call in gets] == [
+            "Bearer first",
+            "Bearer second",
+        ]
+
+
+class TestMediaUpload:
+    """Test cases for streaming media uploads."""
+
+    @staticmethod
+    def media(media_id: int = 5) -> dict:
+        return {
+            "id": media_id,
+            "title": {"rendered": "photo"},
+            "source_url": f"{BASE_URL}/wp-content/uploads/photo.png",
+            "mime_type": "image/png",
+        }
+
+    @pytest.fixture
+    def received(self, mock_wp):
+        received = []
+
+        def upload(url, **kwargs):
+            # aioresponses drains streamed bodies into bytes
+            received.append((url, kwargs["headers"], kwargs["data"]))
+            return CallbackResult(status=201, payload=self.media())
+
+        mock_wp.post(endpoint("media"), callback=upload, repeat=True)
+        return received
+
+    async def test_file_is_streamed_with_headers(self, received, tmp_path):
+        path = tmp_path / "photo.png"
+        path.write_bytes(b"\x89PNG" * 1000)
+
+        async with WordPressClient(BASE_URL) as client:
+            result = await client.upload_media(str(path), alt_text="A photo")
+
+        assert result == {
+            "success": True,
+            "media": {
+                "id": 5,
+                "title": "photo",
+                "url": f"{BASE_URL}/wp-content/uploads/photo.png",
+                "mime_type": "image/png",
+            },
+        }
+        ((url, headers, body),) = received
+        assert body == path.read_bytes()
+        assert headers["Content-Type"] == "image/png"
+        assert headers["Content-Length"] == "4000"
+        assert headers["Content-Disposition"] == 'attachment; filename="photo.png"'
+        assert url.query["alt_text"] == "A photo"
+
+    async def test_byte_iterator_needs_filename(self, received):
+        async with WordPressClient(BASE_URL) as client:
+            missing = await client.upload_media(iter([b"abc"]))
+            result = await client.upload_media(
+                iter([b"ab", b"c"]), filename="notes.txt"
+            )
+
+        assert not missing["success"]
+        assert result["success"]
+        ((_, headers, body),) = received
+        assert body == b"abc"
+        assert headers["Content-Type"] == "text/plain"
+        assert "Content-Length" not in headers
+
+    async def test_upload_media_tool(self, received, tmp_path):
+        path = tmp_path / "photo.png"
+        path.write_bytes(b"png")
+        server = WordPressMCPServer(BASE_URL, "admin", "secret")
+
+        async with server.wp_client:
+            result = await call_tool(
+                server, "upload_media", {"file_path": str(path), "title": "Photo"}
+            )
+
+        assert not result.isError
+        assert "ID: 5" in result.content[0].text
+        assert received[0][0].query["title"] == "Photo"
+
+    async def test_upload_media_directory_tool(self, received, tmp_path):
+        (tmp_path / "one.png").write_bytes(b"1")
+        (tmp_path / "two.png").write_bytes(b"2")
+        server = WordPressMCPServer(BASE_URL, "admin", "secret")
+
+        async with server.wp_client:
+            result = await call_tool(
+                server, "upload_media_directory", {"directory": str(tmp_path)}
+            )
+
+        assert not result.isError
+        assert "Uploaded 2 of 2 files" in result.content[0].text
+        assert len(received) == 2
+
+
+class TestWarmUp:
+    """Test cases for startup warm-up and readiness."""
+
+    @staticmethod
+    async def get_health(server: WordPressMCPServer):
+        app = server.create_http_app()
+        request = make_mocked_request("GET", "/health", app=app)
+        match = await app.router.resolve(request)
+        response = await match.handler(request)
+        return response.status, json.loads(response.body)
+
+    async def test_warm_up_opens_connections_and_checks_auth(self, mock_wp):
+        mock_wp.head(API, repeat=True)
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+        mock_wp.get(endpoint("(categories|tags)"), payload=[], repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            report = await client.warm_up(connections=3)
+
+        assert report["connections"] == 3
+        assert report["authenticated"]
+        assert report["terms"] == {"categories": 0, "tags": 0}
+        assert report["errors"] == []
+        assert report["elapsed"] >= 0
+
+    async def test_warm_up_reports_failures(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), status=401)
+
+        async with WordPressClient(BASE_URL) as client:
+            report = await client.warm_up(connections=1, preload_terms=False)
+
+        assert not report["authenticated"]
+        assert report["connections"] == 0
+        assert len(report["errors"]) == 2
+
+    async def test_health_is_ready_after_warm_up(self, mock_wp):
+        mock_wp.head(API, repeat=True)
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+        server = WordPressMCPServer(
+            BASE_URL, "admin", "secret", preload_terms=False, warm_up_connections=2
+        )
+
+        status, body = await self.get_health(server)
+        assert status == 503
+        assert body["status"] == "starting"
+
+        await server._start_client()
+        try:
+            status, body = await self.get_health(server)
+        finally:
+            await server.wp_client.close()
+
+        assert status == 200
+        assert body["warm_up"]["connections"] == 2
+        assert body["warm_up"]["authenticated"]
+
+    async def test_failed_start_releases_client_and_port(self, tmp_path):
+        server = WordPressMCPServer(
+            BASE_URL, preload_terms=False, mirror_path=str(tmp_path / "no/m.db")
+        )
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        with pytest.raises(sqlite3.OperationalError):
+            await server.run_http("127.0.0.1", port)
+
+        assert server.wp_client.closed
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", port))
+
+
+class TestPostMirror:
+    """Test cases for serving list_blog_posts from the post mirror."""
+
+    async def test_list_posts_reads_mirror_until_a_write(self, mock_wp, tmp_path):
+        mirrored = {**wp_post(1, "Mirrored"), "modified": "2025-01-01T00:00:00"}
+        mirrored["content"] = {"rendered": "<p>Body</p>"}
+        mock_wp.get(endpoint("posts"), payload=[mirrored])
+        mock_wp.post(endpoint("posts/1"), payload=wp_post(1, "Edited"))
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1, "Edited")])
+        server = WordPressMCPServer(
+            BASE_URL, "admin", "secret", mirror_path=str(tmp_path / "mirror.db")
+        )
+        await server.wp_client.open()
+        await server.mirror.open()
+        try:
+            await server.mirror.sync()
+            result = await call_tool(server, "list_blog_posts", {})
+            assert "Title: Mirrored" in result.content[0].text
+            assert request_count(mock_wp) == 1
+
+            await call_tool(
+                server, "update_blog_post", {"post_id": 1, "title": "Edited"}
+            )
+            result = await call_tool(server, "list_blog_posts", {})
+            assert "Title: Edited" in result.content[0].text
+            assert request_count(mock_wp) == 3
+        finally:
+            await server._stop_client()
+
+    async def test_search_tool(self, mock_wp, tmp_path):
+        post = {**wp_post(4, "Espresso"), "modified": "2025-01-01T00:00:00"}
+        post["content"] = {"rendered": "<p>Grinding beans</p>"}
+        mock_wp.get(endpoint("posts"), payload=[post])
+        server = WordPressMCPServer(BASE_URL, mirror_path=str(tmp_path / "m.db"))
+
+        result = await call_tool(server, "search_blog_posts", {"query": "beans"})
+        assert result.isError
+
+        await server.wp_client.open()
+        await server.mirror.open()
+        try:
+            await server.mirror.sync()
+            result = await call_tool(server, "search_blog_posts", {"query": "beans"})
+        finally:
+            await server._stop_client()
+
+        assert not result.isError
+        assert "Title: Espresso" in result.content[0].text
+        assert "Match: Grinding **beans**" in result.content[0].text
+
+
+class TestMinimalDiffUpdates:
+    """Test cases for skipping unchanged fields in updates."""
+
+    async def test_unchanged_update_skips_request(self, mock_wp):
+        mock_wp.post(endpoint("posts/7"), payload=wp_post(7, "Title"), repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            first = await client.update_post(7, title="Title", content="Body")
+            second = await client.update_post(7, title="Title", content="Body")
+
+        assert first["success"] and "unchanged" not in first
+        assert second == {**first, "unchanged": True}
+        assert request_count(mock_wp) == 1
+
+    async def test_only_changed_fields_are_sent(self, mock_wp):
+        mock_wp.post(endpoint("posts/7"), payload=wp_post(7, "Title"), repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            await client.update_post(7, title="Title", content="Body")
+            result = await client.update_post(
+                7, title="Title", content="New body", status="publish"
+            )
+
+        assert not result.get("unchanged")
+        calls = [call for calls in mock_wp.requests.values() for call in calls]
+        assert calls[1].kwargs["json"] == {"content": "New body", "status": "publish"}
+
+    async def test_created_posts_are_remembered(self, mock_wp):
+        mock_wp.post(endpoint("posts"), status=201, payload=wp_post(3, "Title"))
+
+        async with WordPressClient(BASE_URL) as client:
+            await client.create_post("Title", "Body")
+            result = await client.update_post(3, title="Title", status="draft")
+
+        assert result["unchanged"]
+        assert request_count(mock_wp) == 1
+
+    async def test_failed_update_is_forgotten(self, mock_wp):
+        mock_wp.post(endpoint("posts/7"), payload=wp_post(7, "Title"))
+        mock_wp.post(endpoint("posts/7"), status=500, payload={}, repeat=True)
+
+        async with WordPressClient(BASE_URL, max_retries=0) as client:
+            await client.update_post(7, title="Title")
+            await client.update_post(7, title="Other")
+            result = await client.update_post(7, title="Title")
+
+        assert not result["success"]
+        assert request_count(mock_wp) == 3
+
+    async def test_paged_reads_bypass_cache(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1)], repeat=True)
+
+        async with WordPressClient(BASE_URL, http_cache_ttl=60) as client:
+            for _ in range(2):
+                async for _page in client.iter_post_pages():
+                    pass
+            assert len(client.http_cache) == 0
+
+        assert request_count(mock_wp) == 2
+
+    async def test_cache_can_be_disabled(self, mock_wp):
+        mock_wp.post(endpoint("posts/7"), payload=wp_post(7, "Title"), repeat=True)
+
+        async with WordPressClient(BASE_URL, post_hash_cache_size=0) as client:
+            await client.update_post(7, title="Title")
+            result = await client.update_post(7, title="Title")
+
+        assert "unchanged" not in result
+        assert request_count(mock_wp) == 2
+
+    async def test_bulk_updates_skip_unchanged_posts(self, mock_wp):
+        mock_wp.post(endpoint("posts/1"), payload=wp_post(1, "One"))
+        mock_wp.post(
+            BATCH_URL,
+            payload={"responses": [{"status": 200, "body": wp_post(2, "Two")}]},
+        )
+
+        async with WordPressClient(BASE_URL) as client:
+            await client.update_post(1, title="One")
+            result = await client.update_posts(
+                [{"post_id": 1, "title": "One"}, {"post_id": 2, "title": "Two"}]
+            )
+
+        assert result["succeeded"] == 2
+        assert result["results"][0]["unchanged"]
+        assert result["results"][1]["post"]["id"] == 2
+        batch = mock_wp.requests[("POST", URL(BATCH_URL))][0].kwargs["json"]
+        assert [request["path"] for request in batch["requests"]] == ["/wp/v2/posts/2"]
+
+
+class TestIdempotentCreate:
+    """Test cases for deduplicating repeated create_post calls."""
+
+    async def test_duplicate_returns_original(self, mock_wp):
+        terms = [
+            {"id": 1, "name": "a", "slug": "a"},
+            {"id": 2, "name": "B", "slug": "b"},
+        ]
+        mock_wp.get(TERMS_URL, payload=terms)
+        mock_wp.post(endpoint("posts"), status=201, payload=wp_post(5), repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            first = await client.create_post("Hello", "Body", tags=["a", "B"])
+            second = await client.create_post("Hello", "Body", tags=["b", "A"])
+            other = await client.create_post("Hello", "Body", status="publish")
+
+        assert second == {**first, "duplicate": True}
+        assert "duplicate" not in other
+        assert request_count(mock_wp) == 3
+
+    async def test_concurrent_duplicates_share_one_request(self, mock_wp):
+        mock_wp.post(endpoint("posts"), status=201, payload=wp_post(5), repeat=True)
+
+        async with WordPressClient(BASE_URL) as client:
+            results = await asyncio.gather(
+                *(client.create_post("Hello", "Body") for _ in range(5))
+            )
+
+        assert {result["post"]["id"] for result in results} == {5}
+        assert request_count(mock_wp) == 1
+        assert client._creations.coalesced == 4
+
+    async def test_failures_and_disabled_window_are_not_deduplicated(self, mock_wp):
+        mock_wp.post(endpoint("posts"), status=400, payload={})
+        mock_wp.post(endpoint("posts"), status=201, payload=wp_post(5), repeat=True)
+
+        async with WordPressClient(BASE_URL, max_retries=0) as client:
+            assert not (await client.create_post("Hello", "Body"))["success"]
+            assert "duplicate" not in await client.create_post("Hello", "Body")
+        async with WordPressClient(BASE_URL, create_dedup_window=0) as client:
+            await client.create_post("Hello", "Body")
+            assert "duplicate" not in await client.create_post("Hello", "Body")
+
+        assert request_count(mock_wp) == 4
+
+    async def test_store_catches_duplicates_across_clients(self, mock_wp, tmp_path):
+        mock_wp.post(endpoint("posts"), status=201, payload=wp_post(5), repeat=True)
+        server = WordPressMCPServer(BASE_URL, mirror_path=str(tmp_path / "m.db"))
+        await server.mirror.open()
+        try:
+            async with server.wp_client:
+                await call_tool(
+                    server, "create_blog_post", {"title": "Hi", "content": "x"}
+                )
+            async with WordPressClient(BASE_URL) as client:
+                client.idempotency_store = server.mirror
+                result = await client.create_post("Hi", "x")
+        finally:
+            await server.mirror.close()
+
+        assert result["duplicate"]
+        assert result["post"]["id"] == 5
+        assert request_count(mock_wp) == 1
+
+
+class TestReadCoalescing:
+    """Test cases for sharing identical concurrent reads."""
+
+    async def test_identical_reads_share_one_request(self, mock_wp):
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1)], repeat=True)
+
+        async with WordPressClient(BASE_URL, http_cache_size=0) as client:
+            results = await asyncio.gather(*(client.list_posts() for _ in range(5)))
+            other = await client.list_posts(status="publish")
+
+        assert all(result == results[0] for result in results)
+        assert other["success"]
+        assert request_count(mock_wp) == 2
+        assert client.coalescing == {"requests": 2, "coalesced": 4}
+
+    async def test_results_are_not_shared_objects(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), payload={"id": 1}, repeat=True)
+
+        async with WordPressClient(BASE_URL, http_cache_size=0) as client:
+            first, second = await asyncio.gather(
+                client.authenticate(), client.authenticate()
+            )
+
+        first["user"]["id"] = 2
+        assert second["user"] == {"id": 1}
+        assert request_count(mock_wp) == 1
+
+    async def test_reads_after_a_write_do_not_join_older_reads(self, mock_wp):
+        release = asyncio.Event()
+
+        async def slow_read(url, **kwargs):
+            await release.wait()
+            return CallbackResult(payload=[wp_post(1)])
+
+        mock_wp.get(endpoint("posts"), callback=slow_read, repeat=True)
+        mock_wp.post(endpoint("posts/1"), payload=wp_post(1, "Edited"))
+
+        async with WordPressClient(BASE_URL, http_cache_size=0) as client:
+            before = asyncio.ensure_future(client.list_posts())
+            await asyncio.sleep(0)
+            await client.update_post(1, title="Edited")
+            after = asyncio.ensure_future(client.list_posts())
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(before, after)
+
+        assert client.coalescing == {"requests": 2, "coalesced": 0}
+
+    async def test_writes_are_never_coalesced(self, mock_wp):
+        mock_wp.post(endpoint("posts/1"), payload=wp_post(1), repeat=True)
+
+        async with WordPressClient(
+            BASE_URL, post_hash_cache_size=0, max_retries=0
+        ) as client:
+            await asyncio.gather(
+                client.update_post(1, title="A"), client.update_post(1, title="A")
+            )
+
+        assert request_count(mock_wp) == 2
+
+
+class TestAuthProbe:
+    """Test cases for the cached test_wordpress_connection check."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_probes(self):
+        auth_probes.clear()
+        yield
+        auth_probes.clear()
+
+    async def test_connection_tool_reuses_the_check(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), payload={"id": 1, "name": "Admin"})
+        server = WordPressMCPServer(BASE_URL, "admin", "secret")
+
+        async with server.wp_client:
+            for _ in range(3):
+                result = await call_tool(server, "test_wordpress_connection", {})
+                assert "Connected as: Admin" in result.content[0].text
+
+        assert request_count(mock_wp) == 1
+
+    async def test_checks_are_per_credentials(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), payload={"id": 1}, repeat=True)
+
+        async with WordPressClient(BASE_URL, "admin", "a", http_cache_size=0) as a:
+            async with WordPressClient(BASE_URL, "admin", "b", http_cache_size=0) as b:
+                await a.probe_auth()
+                await a.probe_auth()
+                await b.probe_auth()
+
+        assert request_count(mock_wp) == 2
+
+    async def test_401_drops_the_cached_check(self, mock_wp):
+        mock_wp.get(endpoint("users/me"), payload={"id": 1})
+        mock_wp.get(endpoint("posts"), status=401, payload={})
+        mock_wp.get(endpoint("users/me"), status=401, payload={})
+
+        async with WordPressClient(BASE_URL, http_cache_size=0) as client:
+            assert (await client.probe_auth())["success"]
+            await client.list_posts()
+            assert not (await client.probe_auth())["success"]
+
+
+class TestMultiSite:
+    """Test cases for tools targeting sites from a sites file."""
+
+    @pytest.fixture
+    def sites_file(self, tmp_path):
+        path = tmp_path / "sites.json"
+        path.write_text(
+            json.dumps({"sites": {"lab": {"url": "http://lab.test", "password": "pw"}}})
+        )
+        return str(path)
+
+    async def test_tools_use_the_named_site(self, mock_wp, sites_file):
+        lab_posts = re.compile(r"^http://lab\.test/wp-json/wp/v2/posts(\?.*)?$")
+        mock_wp.get(lab_posts, payload=[wp_post(9, "Lab post")])
+        mock_wp.get(endpoint("posts"), payload=[wp_post(1, "Main post")])
+        server = WordPressMCPServer(BASE_URL, sites_file=sites_file)
+
+        async with server.wp_client:
+            lab = await call_tool(server, "list_blog_posts", {"site": "lab"})
+            main = await call_tool(server, "list_blog_posts", {})
+            await server._stop_client()
+
+        assert "Title: Lab post" in lab.content[0].text
+        assert "Title: Main post" in main.content[0].text
+        assert server.client_pool.stats["opened"] == 1
+        assert server.client_pool.stats["open"] == []
+
+    async def test_unknown_site_is_an_error(self, sites_file):
+        server = WordPressMCPServer(BASE_URL, sites_file=sites_file)
+
+        result = await call_tool(server, "list_blog_posts", {"site": "nope"})
+
+        assert result.isError
+        assert result.content[0].text == "Unknown site: nope"
+
+    async def test_tools_advertise_the_site_argument(self, sites_file):
+        from mcp.types import ListToolsRequest
+
+        server = WordPressMCPServer(BASE_URL, sites_file=sites_file)
+        handler = server.server.request_handlers[ListToolsRequest]
+        tools = (await handler(ListToolsRequest(method="tools/list"))).root.tools
+
+        for tool in tools:
+            site = tool.inputSchema["properties"]["site"]
+            assert "default, lab" in site["description"]
+
+
+class TestExport:
+    """Test cases for the export_posts tool."""
+
+    async def test_export_posts_tool(self, mock_wp, tmp_path):
+        post = {**wp_post(1), "modified": "2025-01-02T00:00:00"}
+        mock_wp.get(endpoint("posts"), payload=[post], headers={"X-WP-TotalPages": "1"})
+        path = tmp_path / "posts.ndjson.gz"
+        server = WordPressMCPServer(BASE_URL, "admin", "secret")
+
+        async with server.wp_client:
+            result = await call_tool(
+                server,
+                "export_posts",
+                {"path": str(path), "modified_after": "2025-01-01T00:00:00"},
+            )
+
+        assert not result.isError, result.content[0].text
+        assert "Exported 1 posts" in result.content[0].text
+        assert "Last modified: 2025-01-02T00:00:00" in result.content[0].text
+        with gzip.open(path, "rt") as f:
+            assert json.loads(f.readline())["kind"] == "post"
+        ((_, calls),) = mock_wp.requests.items()
+        assert calls[0].kwargs["params"]["modified_after"] == "2024-12-31T23:59:59"
+
+    async def test_export_posts_tool_reports_errors(self, mock_wp, tmp_path):
+        mock_wp.get(endpoint("posts"), status=403)
+        server = WordPressMCPServer(BASE_URL, "admin", "secret")
+
+        async with server.wp_client:
+            result = await call_tool(
+                server, "export_posts", {"path": str(tmp_path / "posts.ndjson")}
+            )
+
+        assert result.isError
+        assert "403" in result.content[0].text
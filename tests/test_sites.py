@@ -0,0 +1,144 @@
+import asyncio
+import json
+
+import pytest
+
+from wordpress_mcp_server.sites import (
+    ClientPool,
+    Site,
+    SiteRegistry,
+    UnknownSiteError,
+)
+
+
+class FakeClient:
+    """Tracks whether the pool opened and closed it."""
+
+    def __init__(self, site):
+        self.site = site
+        self.is_open = False
+
+    async def open(self):
+        await asyncio.sleep(0)
+        self.is_open = True
+
+    async def close(self):
+        self.is_open = False
+
+
+@pytest.fixture
+def sites():
+    return [Site(name, f"http://{name}.test/") for name in ("a", "b", "c")]
+
+
+class TestSiteRegistry:
+    """Test cases for the SiteRegistry class."""
+
+    def test_resolve_by_name_or_url(self, sites):
+        registry = SiteRegistry(sites)
+
+        assert registry.resolve("a") is sites[0]
+        assert registry.resolve("http://b.test/") is sites[1]
+        assert registry.resolve("http://b.test") is sites[1]
+        with pytest.raises(UnknownSiteError, match="Unknown site: d"):
+            registry.resolve("d")
+
+    def test_duplicate_names_are_rejected(self):
+        with pytest.raises(ValueError):
+            SiteRegistry([Site("a", "http://a.test"), Site("a", "http://b.test")])
+
+    def test_load(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LAB_PASSWORD", "from-env")
+        path = tmp_path / "sites.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "sites": {
+                        "lab": {
+                            "url": "https://lab.test",
+                            "username": "editor",
+                            "password_env": "LAB_PASSWORD",
+                            "options": {"pool_limit": 20},
+                        },
+                        "blog": {"url": "https://blog.test", "password": "pw"},
+                    }
+                }
+            )
+        )
+
+        registry = SiteRegistry.load(str(path), Site("default", "https://main.test"))
+
+        assert registry.names == ["default", "lab", "blog"]
+        lab = registry.resolve("lab")
+        assert (lab.username, lab.password) == ("editor", "from-env")
+        assert lab.options == {"pool_limit": 20}
+        assert registry.resolve("https://blog.test").password == "pw"
+
+    def test_load_requires_password_env(self, tmp_path):
+        path = tmp_path / "sites.json"
+        path.write_text(
+            json.dumps(
+                {"sites": {"lab": {"url": "https://lab.test", "password_env": "NOPE"}}}
+            )
+        )
+
+        with pytest.raises(ValueError, match="NOPE"):
+            SiteRegistry.load(str(path))
+
+
+class TestClientPool:
+    """Test cases for the ClientPool class."""
+
+    async def test_clients_are_opened_once_and_reused(self, sites):
+        pool = ClientPool(FakeClient)
+
+        async def use(site):
+            async with pool.use(site) as client:
+                return client
+
+        clients = await asyncio.gather(*(use(sites[0]) for _ in range(3)))
+
+        assert clients[0].is_open
+        assert all(client is clients[0] for client in clients)
+        assert pool.opened == 1
+
+    async def test_least_recently_used_is_closed_first(self, sites):
+        pool = ClientPool(FakeClient, max_open=2)
+
+        for site in (sites[0], sites[1], sites[0], sites[2]):
+            async with pool.use(site):
+                pass
+
+        assert pool.stats == {"open": ["a", "c"], "opened": 3, "evicted": 1}
+
+    async def test_clients_in_use_are_not_closed(self, sites):
+        pool = ClientPool(FakeClient, max_open=1)
+
+        async with pool.use(sites[0]) as busy:
+            async with pool.use(sites[1]):
+                pass
+            assert busy.is_open
+
+        assert len(pool) == 1
+
+    async def test_idle_clients_are_closed(self, sites, clock):
+        pool = ClientPool(FakeClient, idle_timeout=60, clock=clock)
+
+        async with pool.use(sites[0]) as idle:
+            pass
+        clock.now += 61
+        async with pool.use(sites[1]):
+            pass
+
+        assert not idle.is_open
+        assert pool.stats["open"] == ["b"]
+
+    async def test_close(self, sites):
+        pool = ClientPool(FakeClient)
+        async with pool.use(sites[0]) as client:
+            pass
+
+        await pool.close()
+
+        assert not client.is_open
+        assert len(pool) == 0
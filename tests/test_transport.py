@@ -0,0 +1,211 @@
+import asyncio
+import json
+import socket
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from wordpress_mcp_server.server import WordPressClient
+from wordpress_mcp_server.transport import (
+    AiohttpTransport,
+    ConnectionNotEstablished,
+    HTTPXTransport,
+    create_transport,
+    parse_connect_to,
+)
+
+
+async def echo(request: web.Request) -> web.Response:
+    return web.json_response(
+        {
+            "method": request.method,
+            "query": dict(request.query),
+            "content_type": request.headers.get("Content-Type"),
+            "body": (await request.read()).decode(),
+            "auth": request.headers.get("Authorization"),
+            "host": request.host,
+        }
+    )
+
+
+async def slow(request: web.Request) -> web.Response:
+    await asyncio.sleep(1)
+    return web.json_response({})
+
+
+async def posts(request: web.Request) -> web.Response:
+    post = {
+        "id": 1,
+        "title": {"rendered": "Hello"},
+        "link": "http://wp.test/?p=1",
+        "status": "publish",
+        "date": "2024-01-01T00:00:00",
+        "excerpt": {"rendered": ""},
+    }
+    return web.json_response([post], headers={"X-WP-TotalPages": "1"})
+
+
+def make_app() -> web.Application:
+    app = web.Application()
+    app.router.add_route("*", "/echo", echo)
+    app.router.add_get("/slow", slow)
+    app.router.add_get("/wp-json/wp/v2/posts", posts)
+    return app
+
+
+@pytest.fixture
+async def server():
+    server = TestServer(make_app())
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(params=["aiohttp", "httpx"])
+async def transport(request):
+    if request.param == "httpx":
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        transport = HTTPXTransport(timeout=0.2)
+    else:
+        transport = AiohttpTransport(aiohttp.TCPConnector, timeout=0.2)
+    await transport.open()
+    yield transport
+    await transport.close()
+
+
+class TestTransports:
+    """Test cases the aiohttp and httpx transports must both pass."""
+
+    async def test_json_request(self, server, transport):
+        response = await transport.request(
+            "POST",
+            str(server.make_url("/echo")),
+            params={"page": 2},
+            json={"title": "Café"},
+            headers={"Authorization": "Basic x"},
+        )
+
+        assert response.status == 200
+        echoed = response.json()
+        assert echoed["query"] == {"page": "2"}
+        assert echoed["content_type"].startswith("application/json")
+        assert json.loads(echoed["body"]) == {"title": "Café"}
+        assert echoed["auth"] == "Basic x"
+
+    async def test_raw_body(self, server, transport):
+        response = await transport.request(
+            "PUT", str(server.make_url("/echo")), data=b"raw bytes"
+        )
+
+        assert response.json()["body"] == "raw bytes"
+
+    async def test_refused_connection_was_not_sent(self, transport):
+        # aiohttp raises its own connector error, httpx's is translated
+        with pytest.raises((aiohttp.ClientConnectorError, ConnectionNotEstablished)):
+            await transport.request("GET", f"http://127.0.0.1:{closed_port()}/")
+
+    async def test_timeout(self, server, transport):
+        with pytest.raises(asyncio.TimeoutError):
+            await transport.request("GET", str(server.make_url("/slow")))
+
+    async def test_open_and_close(self, transport):
+        assert not transport.closed
+        await transport.open()
+        await transport.close()
+        assert transport.closed
+
+
+class TestHTTPBackend:
+    """Test cases for choosing WordPressClient's HTTP backend."""
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown HTTP backend"):
+            create_transport("curl", aiohttp.TCPConnector)
+
+    async def test_client_on_httpx(self, server):
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        base_url = str(server.make_url("")).rstrip("/")
+
+        async with WordPressClient(base_url, http_backend="httpx") as client:
+            assert client.transport.name == "httpx"
+            result = await client.list_posts()
+
+        assert result["success"]
+        assert [post["id"] for post in result["posts"]] == [1]
+        assert client.closed
+
+
+class TestConnectTo:
+    """Test cases for connecting to a co-located WordPress."""
+
+    @pytest.fixture
+    async def unix_socket(self, tmp_path):
+        path = str(tmp_path / "wordpress.sock")
+        runner = web.AppRunner(make_app(), access_log=None)
+        await runner.setup()
+        await web.UnixSite(runner, path).start()
+        yield path
+        await runner.cleanup()
+
+    def test_parse(self):
+        assert parse_connect_to(None) == (None, None)
+        assert parse_connect_to("unix:/run/wp.sock") == ("/run/wp.sock", None)
+        _, resolver = parse_connect_to("10.0.0.5:8080")
+        assert (resolver.host, resolver.port) == ("10.0.0.5", 8080)
+        _, resolver = parse_connect_to("[::1]:80")
+        assert (resolver.host, resolver.port) == ("::1", 80)
+        _, resolver = parse_connect_to("::1")
+        assert (resolver.host, resolver.port) == ("::1", None)
+
+    @pytest.mark.parametrize("value", ["unix:", "wordpress:80", "10.0.0.5:http"])
+    def test_parse_rejects(self, value):
+        with pytest.raises(ValueError):
+            parse_connect_to(value)
+
+    async def test_fixed_address_keeps_host_header(self, server):
+        connect_to = f"127.0.0.1:{server.port}"
+
+        async with WordPressClient("http://wp.test", connect_to=connect_to) as client:
+            response = await client.transport.request("GET", "http://wp.test/echo")
+
+        assert response.json()["host"] == "wp.test"
+
+    async def test_unix_socket(self, unix_socket):
+        async with WordPressClient(
+            "http://wp.test", connect_to=f"unix:{unix_socket}"
+        ) as client:
+            assert isinstance(client.session.connector, aiohttp.UnixConnector)
+            result = await client.list_posts()
+
+        assert [post["id"] for post in result["posts"]] == [1]
+
+    async def test_unix_socket_over_httpx(self, unix_socket):
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        async with WordPressClient(
+            "http://wp.test", http_backend="httpx", connect_to=f"unix:{unix_socket}"
+        ) as client:
+            response = await client.transport.request("GET", "http://wp.test/echo")
+
+        assert response.json()["host"] == "wp.test"
+
+    def test_httpx_has_no_fixed_address(self):
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        with pytest.raises(ValueError, match="unix: socket"):
+            WordPressClient("http://wp.test", http_backend="httpx", connect_to="::1")
+
+    def test_aiohttp_socket_rejects_https(self):
+        with pytest.raises(ValueError, match="plain HTTP"):
+            WordPressClient("https://wp.test", connect_to="unix:/run/wp.sock")
@@ -0,0 +1,176 @@
+import asyncio
+import hashlib
+import json
+
+import pytest
+
+from wordpress_mcp_server.uploader import (
+    MANIFEST_NAME,
+    MediaUploader,
+    UploadManifest,
+    walk_files,
+)
+
+
+class FakeClient:
+    """Records upload_media calls instead of talking to WordPress."""
+
+    def __init__(self, fail=()):
+        self.uploads = []
+        self.fail = set(fail)
+        self.in_flight = self.peak = 0
+
+    async def upload_media(self, path, meta=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        self.uploads.append((str(path), meta))
+        if path.endswith(tuple(self.fail)):
+            return {"success": False, "error": "413 - too large"}
+        media_id = len(self.uploads)
+        return {
+            "success": True,
+            "media": {"id": media_id, "url": f"http://wp.test/{media_id}"},
+        }
+
+    async def iter_pages(self, route, fields=None):
+        assert route == "media"
+        digest = hashlib.sha256(b"remote").hexdigest()
+        yield [
+            {"id": 90, "source_url": "http://wp.test/90", "meta": {"sha": digest}},
+            {"id": 91, "source_url": "http://wp.test/91", "meta": []},
+        ]
+
+
+@pytest.fixture
+def photos(tmp_path):
+    (tmp_path / "2024").mkdir()
+    (tmp_path / ".cache").mkdir()
+    (tmp_path / "a.jpg").write_bytes(b"a")
+    (tmp_path / "b.jpg").write_bytes(b"b")
+    (tmp_path / "2024" / "c.jpg").write_bytes(b"c")
+    (tmp_path / ".cache" / "thumb.jpg").write_bytes(b"t")
+    (tmp_path / ".DS_Store").write_bytes(b"x")
+    return tmp_path
+
+
+class TestUploadManifest:
+    """Test cases for the UploadManifest class."""
+
+    def test_missing_manifest_is_empty(self, tmp_path):
+        manifest = UploadManifest.load(str(tmp_path / "none.json"))
+        assert manifest.files == {}
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "manifest.json")
+        manifest = UploadManifest(path)
+        manifest.record("a.jpg", "abc", 1, 2.0, 7, "http://wp.test/7")
+        manifest.write(manifest.dumps())
+
+        loaded = UploadManifest.load(path)
+        assert loaded.find("abc")["media_id"] == 7
+        assert loaded.known_hash("a.jpg", 1, 2.0) == "abc"
+        assert loaded.known_hash("a.jpg", 1, 3.0) is None
+
+
+class TestMediaUploader:
+    """Test cases for the MediaUploader class."""
+
+    def test_walk_skips_dotfiles(self, photos):
+        names = [p[len(str(photos)) + 1 :] for p in walk_files(str(photos))]
+        assert names == ["a.jpg", "b.jpg", "2024/c.jpg"]
+        assert len(walk_files(str(photos), recursive=False)) == 2
+
+    async def test_uploads_and_writes_manifest(self, photos):
+        client = FakeClient()
+        progress = []
+
+        async def report(done, total):
+            progress.append((done, total))
+
+        result = await MediaUploader(client, progress=report).upload_directory(
+            str(photos)
+        )
+
+        assert result["success"]
+        assert (result["uploaded"], result["skipped"], result["failed"]) == (3, 0, 0)
+        assert progress[-1] == (3, 3)
+        manifest = json.loads((photos / MANIFEST_NAME).read_text())
+        assert sorted(manifest["files"]) == ["2024/c.jpg", "a.jpg", "b.jpg"]
+
+    async def test_second_run_skips_uploaded_files(self, photos):
+        client = FakeClient()
+        await MediaUploader(client).upload_directory(str(photos))
+        (photos / "d.jpg").write_bytes(b"d")
+        (photos / "copy-of-a.jpg").write_bytes(b"a")
+
+        result = await MediaUploader(client).upload_directory(str(photos))
+
+        assert (result["uploaded"], result["skipped"]) == (1, 4)
+        assert len(client.uploads) == 4
+        assert client.uploads[-1][0].endswith("d.jpg")
+
+    async def test_identical_files_upload_once(self, tmp_path):
+        for n in range(4):
+            (tmp_path / f"{n}.jpg").write_bytes(b"same")
+        client = FakeClient()
+
+        result = await MediaUploader(client).upload_directory(str(tmp_path))
+
+        assert (result["uploaded"], result["skipped"]) == (1, 3)
+        assert len(client.uploads) == 1
+
+    async def test_identical_files_queued_one_at_a_time_upload_once(self, tmp_path):
+        for n in range(3):
+            (tmp_path / f"{n}.jpg").write_bytes(b"same")
+        client = FakeClient()
+
+        result = await MediaUploader(client, concurrency=1).upload_directory(
+            str(tmp_path)
+        )
+
+        assert (result["uploaded"], result["skipped"]) == (1, 2)
+        assert len(client.uploads) == 1
+
+    async def test_failures_are_reported_and_retried_next_run(self, photos):
+        result = await MediaUploader(FakeClient(fail=["b.jpg"])).upload_directory(
+            str(photos)
+        )
+        assert result["failed"] == 1
+        assert result["errors"] == [{"path": "b.jpg", "error": "413 - too large"}]
+
+        client = FakeClient()
+        result = await MediaUploader(client).upload_directory(str(photos))
+        assert result["uploaded"] == 1
+        assert client.uploads[0][0].endswith("b.jpg")
+
+    async def test_concurrency_is_bounded(self, tmp_path):
+        for n in range(20):
+            (tmp_path / f"{n}.jpg").write_bytes(str(n).encode())
+        client = FakeClient()
+
+        await MediaUploader(client, concurrency=3).upload_directory(str(tmp_path))
+
+        assert len(client.uploads) == 20
+        assert client.peak == 3
+
+    async def test_meta_key_skips_remote_uploads(self, tmp_path):
+        (tmp_path / "remote.jpg").write_bytes(b"remote")
+        (tmp_path / "new.jpg").write_bytes(b"new")
+        client = FakeClient()
+
+        result = await MediaUploader(client, meta_key="sha").upload_directory(
+            str(tmp_path)
+        )
+
+        assert (result["uploaded"], result["skipped"]) == (1, 1)
+        ((path, meta),) = client.uploads
+        assert path.endswith("new.jpg")
+        assert meta == {"sha": hashlib.sha256(b"new").hexdigest()}
+
+    async def test_missing_directory(self, tmp_path):
+        result = await MediaUploader(FakeClient()).upload_directory(
+            str(tmp_path / "nope")
+        )
+        assert not result["success"]